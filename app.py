@@ -1,13 +1,32 @@
+import os
+import time
+from contextlib import ExitStack
 import streamlit as st
 from datetime import datetime, date
 import pandas as pd
 import altair as alt
 
-from modules.player import Player
-from modules.team import Team
+from modules.player import CAREER
+from modules.registry import REGISTRY_EXPIRY, get_player, get_team
 from modules.constants import *
 from modules.utils import *
+from modules.ui import *
 from modules.fetch import *
+from modules.cache import cache_refresh_stats, memory_cache_stats
+from modules.metrics import collect, span, write_prometheus
+
+# Player/Team objects are interned process-wide (modules.registry), so resolved
+# URLs and loaded game logs survive reruns and are shared across sessions
+@st.cache_resource(ttl=REGISTRY_EXPIRY["players"])
+def active_players(season):
+    return get_all_active_players(season)
+
+# --- Diagnostics: time every span recorded during this rerun ---
+show_diagnostics = st.sidebar.checkbox("Show diagnostics", value=os.environ.get("NBA_DIAGNOSTICS") == "1")
+# Closed before the panel (and before st.stop()), restoring the thread's previous collection
+rerun_collection = ExitStack()
+rerun_spans = rerun_collection.enter_context(collect())
+rerun_start = time.perf_counter()
 
 # --- App Instructions ---
 with st.expander("ℹ️ Instructions"):
@@ -42,6 +61,7 @@ if search_method == "Game Date":
 
     if games:
         selected_game = st.selectbox("Select a game:", games, format_func=str)
+        selected_game.load_rosters()
         col1, col2 = st.columns([1, 1])
         with col1:
             if selected_game.away_team.logo_url:
@@ -57,19 +77,19 @@ if search_method == "Game Date":
 
 # --- Search Mode: Team Roster ---
 elif search_method == "Team Roster":
-    selected_team = Team(st.selectbox("Select a team:", get_all_teams()), selected_season)
+    selected_team = get_team(st.selectbox("Select a team:", get_all_teams()), selected_season)
     if selected_team.logo_url:
         st.image(selected_team.logo_url, caption=selected_team.name, width=150)
     selected_player = st.selectbox("Select a Player", selected_team.roster, format_func=lambda x: f"{x.name}")
 
 # --- Search Mode: Player Name ---
 elif search_method == "Player Name":
-    all_players = get_all_active_players(selected_season)
+    all_players = active_players(selected_season)
     search_query = st.text_input("Enter player name:")
     if search_query:
         fuzzy_player = fuzzy_match_player(search_query, all_players)
         if fuzzy_player:
-            selected_player = Player(fuzzy_player.name, fuzzy_player.team_name, selected_season)
+            selected_player = get_player(fuzzy_player.name, fuzzy_player.team_name, selected_season)
             st.write(f"### Selected Player: {selected_player.name} ({selected_player.team_name})")
         else:
             st.warning("No matching player found. Try refining your search.")
@@ -80,7 +100,7 @@ if selected_player and search_method in ["Team Roster", "Player Name"]:
     selected_season = get_season_year(selected_date)
     if selected_season != selected_player.season:
         st.info("↩️ Resetting player to correct season context.")
-        selected_player = Player(selected_player.name, selected_player.team_name, selected_season)
+        selected_player = get_player(selected_player.name, selected_player.team_name, selected_season)
 
     games = get_games_for_date(selected_date)
     if games:
@@ -94,6 +114,7 @@ if selected_player:
 
     if not stats_fetched or not selected_player.stats:
         st.error("No stats found.")
+        rerun_collection.close()
         st.stop()
 
     st.write(f"Fetching stats for {selected_player.name} from {selected_player.stats_url}")
@@ -122,6 +143,14 @@ if selected_player:
             threshold = st.number_input(f"Threshold for {STAT_NAME_MAPPING[stat]}:", min_value=0, step=1)
             stat_thresholds[stat] = threshold
 
+    if "Stats Against This Opponent" in selected_stat_types:
+        history = st.selectbox("Head-to-head history:", ["This season", "Last 3 seasons", "Career"])
+        opponent_seasons = {
+            "This season": None,
+            "Last 3 seasons": range(selected_player.season - 2, selected_player.season + 1),
+            "Career": CAREER,
+        }[history]
+
     if "Last n Games" in selected_stat_types:
         n = st.slider("n Games", min_value=1, max_value=82, value=5)
 
@@ -169,7 +198,8 @@ if selected_player:
                     )
                     chart += threshold_line
 
-            st.altair_chart(chart, use_container_width=True)
+            with span("render.chart"):
+                st.altair_chart(chart, use_container_width=True)
 
 
         if "Full Season Averages" in selected_stat_types:
@@ -185,7 +215,7 @@ if selected_player:
                 else selected_game.home_team.name
             )
             opponent_code = TEAM_CODES[opponent_team_name]
-            stats, avg = selected_player.get_stats_against_opponent(opponent_code)
+            stats, avg = selected_player.get_stats_against_opponent(opponent_code, seasons=opponent_seasons)
             if stats:
                 if "Threshold Stats" in selected_stat_types and stat_thresholds:
                     translated_thresholds = {STAT_NAME_MAPPING[k]:v for k, v in stat_thresholds.items()}
@@ -200,15 +230,17 @@ if selected_player:
                 st.warning(f"No matching stats found for {selected_player.name} vs {opponent_team_name}.")
 
         if "Threshold Stats" in selected_stat_types:
-            rows = []
-            for stat, threshold in stat_thresholds.items():
-                result = selected_player.count_exceeding_threshold(stat, threshold)
-                rows.append([
-                    STAT_NAME_MAPPING[stat], result[2], result[0], f"{result[3]:.2f}%",
-                    result[1], f"{result[4]:.2f}%"
-                ])
-            if rows:
-                df = pd.DataFrame(rows, columns=["Stat", "Total Games", "Exceeded", "% Exceeded", "Not Exceeded", "% Not Exceeded"])
+            df = selected_player.threshold_table(stat_thresholds)
+            if not df.empty:
                 render_table(df, "### 📈 Threshold Stats Analysis")
             else:
                 st.write("No threshold stats available.")
+
+# --- Diagnostics Panel ---
+rerun_collection.close()
+if show_diagnostics:
+    render_diagnostics(rerun_spans, time.perf_counter() - rerun_start, {
+        "Memory cache": memory_cache_stats(),
+        "Background refresh": cache_refresh_stats(),
+    })
+write_prometheus(gauges={"cache_memory_hit_rate": memory_cache_stats()["hit_rate"]})
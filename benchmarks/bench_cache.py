@@ -0,0 +1,55 @@
+"""
+Cache hit latency as the cache grows.
+
+Fills each backend with N synthetic ~100 KB pages and times lookups of
+random keys. The SQLite store should stay flat; the legacy JSON file
+grows linearly with N.
+
+    python -m benchmarks.bench_cache
+"""
+import os
+import random
+import tempfile
+import time
+
+from modules.cache_store import JSONCacheStore, SQLiteCacheStore
+
+PAGE_SIZE = 100_000
+SIZES = [50, 200, 800]
+LOOKUPS = 50
+
+def _fill(store, n):
+    page = "<html>" + "x" * PAGE_SIZE + "</html>"
+    now = time.time()
+    if hasattr(store, "set_many"):
+        store.set_many("pages", [(f"https://example.com/{i}", page, now) for i in range(n)])
+    else:
+        store._save({"pages": {f"https://example.com/{i}": {"data": page, "timestamp": now} for i in range(n)}})
+
+def _time_hits(store, n, lookups):
+    keys = [f"https://example.com/{random.randrange(n)}" for _ in range(lookups)]
+    start = time.perf_counter()
+    for key in keys:
+        assert store.get("pages", key) is not None
+    return (time.perf_counter() - start) / lookups * 1000
+
+def run():
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in SIZES:
+            sqlite_store = SQLiteCacheStore(os.path.join(tmp, f"cache_{n}.db"))
+            _fill(sqlite_store, n)
+            json_store = JSONCacheStore(os.path.join(tmp, f"cache_{n}.json"))
+            _fill(json_store, n)
+            results.append({
+                "entries": n,
+                "sqlite_hit_ms": _time_hits(sqlite_store, n, LOOKUPS),
+                "json_hit_ms": _time_hits(json_store, n, max(3, LOOKUPS // 10)),
+            })
+            sqlite_store.close()
+    return results
+
+if __name__ == "__main__":
+    print(f"{'entries':>8} {'sqlite hit (ms)':>16} {'json hit (ms)':>14}")
+    for row in run():
+        print(f"{row['entries']:>8} {row['sqlite_hit_ms']:>16.3f} {row['json_hit_ms']:>14.2f}")
@@ -0,0 +1,99 @@
+"""
+lxml table extraction vs. the previous BeautifulSoup parsers.
+
+Runs both on the recorded pages in tests/fixtures and checks they agree.
+
+    python -m benchmarks.bench_parse
+"""
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from modules.parse import parse_game_log, parse_roster, parse_schedule
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+REPEAT = 20
+
+# Column indices the BeautifulSoup gamelog parser used before data-stat lookups
+LEGACY_STAT_COLUMNS = {'points': 30, 'assists': 25, 'rebounds': 24, 'steals': 26, 'blocks': 27, '3pm': 12}
+
+def legacy_game_log(html):
+    soup = BeautifulSoup(html, "html.parser")
+    stats = []
+    for table_id, game_type in [("player_game_log_reg", "regular"), ("player_game_log_post", "playoff")]:
+        table = soup.find("table", {"id": table_id})
+        if not table:
+            continue
+        for row in table.find_all("tr")[1:]:
+            cols = row.find_all("td")
+            if len(cols) < 27:
+                continue
+            game_date = cols[2].get_text().strip()
+            if not game_date or game_date.lower() in ["totals", ""]:
+                continue
+            stat_row = {"game_date": game_date, "team": cols[3].get_text(), "opponent": cols[5].get_text(),
+                        "result": cols[6].get_text(), "game_type": game_type}
+            for stat, idx in LEGACY_STAT_COLUMNS.items():
+                value = cols[idx].get_text()
+                stat_row[stat] = int(value) if value.isdigit() else float(value or 0)
+            stat_row["points_rebounds"] = stat_row["points"] + stat_row["rebounds"]
+            stat_row["points_assists"] = stat_row["points"] + stat_row["assists"]
+            stat_row["rebounds_assists"] = stat_row["rebounds"] + stat_row["assists"]
+            stat_row["points_rebounds_assists"] = stat_row["points"] + stat_row["rebounds"] + stat_row["assists"]
+            stats.append(stat_row)
+    stats.sort(key=lambda x: x["game_date"])
+    return stats
+
+def legacy_schedule(html):
+    soup = BeautifulSoup(html, "html.parser")
+    games = []
+    for table in soup.find_all("table", {"id": "schedule"}):
+        for row in table.find_all("tr")[1:]:
+            cols = row.find_all("td")
+            if len(cols) > 3:
+                try:
+                    game_date = datetime.strptime(row.find("th", {"data-stat": "date_game"}).text.strip(), "%a, %b %d, %Y").date()
+                except ValueError:
+                    continue
+                games.append({"date": game_date.isoformat(), "time": cols[0].text.strip(),
+                              "away": cols[1].find("a").text.strip(), "home": cols[3].find("a").text.strip()})
+    return games
+
+def legacy_roster(html):
+    soup = BeautifulSoup(html, "html.parser")
+    media_item = soup.find("div", class_="media-item")
+    img_tag = media_item.find("img") if media_item else None
+    table = soup.find("table", {"id": "roster"})
+    players = [row.find("td", {"data-stat": "player"}).get_text(strip=True)
+               for row in table.find_all("tr")[1:] if row.find("td", {"data-stat": "player"})]
+    return img_tag["src"] if img_tag else None, players
+
+def _time(fn, html, repeat=REPEAT):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(html)
+    return (time.perf_counter() - start) / repeat * 1000
+
+def run():
+    gamelog = (FIXTURES / "gamelog_jamesle01_2025.html").read_text()
+    schedule = (FIXTURES / "schedule_2025_april.html").read_text()
+    roster = (FIXTURES / "roster_LAL_2025.html").read_text()
+
+    # The legacy parser cannot see the commented-out playoff table; compare the rest
+    new_games = [g for g in parse_game_log(gamelog) if g["game_type"] == "regular"]
+    assert new_games == legacy_game_log(gamelog)
+    assert parse_schedule(schedule) == legacy_schedule(schedule)
+    assert [name for name, _ in parse_roster(roster)[1]] == legacy_roster(roster)[1]
+
+    return [
+        {"page": "gamelog", "legacy_ms": _time(legacy_game_log, gamelog), "lxml_ms": _time(parse_game_log, gamelog)},
+        {"page": "schedule", "legacy_ms": _time(legacy_schedule, schedule), "lxml_ms": _time(parse_schedule, schedule)},
+        {"page": "roster", "legacy_ms": _time(legacy_roster, roster), "lxml_ms": _time(parse_roster, roster)},
+    ]
+
+if __name__ == "__main__":
+    print(f"{'page':>10} {'bs4 (ms)':>10} {'lxml (ms)':>10} {'speedup':>8}")
+    for row in run():
+        print(f"{row['page']:>10} {row['legacy_ms']:>10.2f} {row['lxml_ms']:>10.2f} {row['legacy_ms'] / row['lxml_ms']:>7.1f}x")
@@ -0,0 +1,55 @@
+"""
+Player name search latency over a league-sized player list.
+
+Compares PlayerSearchIndex with fuzzywuzzy's process.extractOne (the
+previous implementation) when fuzzywuzzy is installed.
+
+    python -m benchmarks.bench_search
+"""
+import random
+import time
+
+from modules.player import Player
+from modules.search import PlayerSearchIndex
+
+FIRST = ["LeBron", "Stephen", "Kevin", "Anthony", "Jalen", "Jaylen", "Luka", "Nikola", "Shai", "Tyrese",
+         "Donovan", "Devin", "Jayson", "Damian", "Kyrie", "Paul", "Trae", "Zion", "Ja", "De'Aaron",
+         "Karl-Anthony", "Bam", "Jimmy", "Joel"]
+LAST = ["James", "Curry", "Durant", "Davis", "Brunson", "Brown", "Dončić", "Jokić", "Gilgeous-Alexander",
+        "Haliburton", "Mitchell", "Booker", "Tatum", "Lillard", "Irving", "George", "Young", "Williamson",
+        "Morant", "Fox", "Towns", "Adebayo", "Butler", "Embiid"]
+QUERIES = ["lebron", "steph cury", "luka doncic", "shai gilgeous", "karl anthony towns", "jalen brunson",
+           "de'aaron", "jokic", "tyrese hali", "zion"]
+REPEAT = 200
+
+def league(size=550):
+    rng = random.Random(3)
+    names = {f"{rng.choice(FIRST)} {rng.choice(LAST)}" for _ in range(size * 3)}
+    return [Player(name, "Los Angeles Lakers", 2025) for name in sorted(names)[:size]]
+
+def run():
+    players = league()
+    start = time.perf_counter()
+    index = PlayerSearchIndex(players)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for query in QUERIES:
+            index.search(query, k=5)
+    search_ms = (time.perf_counter() - start) / (REPEAT * len(QUERIES)) * 1000
+
+    result = {"players": len(players), "build_ms": build_ms, "index_search_ms": search_ms}
+    try:
+        from fuzzywuzzy import process
+    except ImportError:
+        return result
+    start = time.perf_counter()
+    for query in QUERIES:
+        process.extractOne(query, players)
+    result["fuzzywuzzy_search_ms"] = (time.perf_counter() - start) / len(QUERIES) * 1000
+    return result
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key:>22}: {value:.3f}" if isinstance(value, float) else f"{key:>22}: {value}")
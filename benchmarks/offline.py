@@ -0,0 +1,77 @@
+"""
+Offline environment for benchmarks: a throwaway SQLite cache and a fetcher
+that serves the recorded pages in tests/fixtures instead of the network.
+"""
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from modules import cache, registry, schedule
+from modules.cache_store import SQLiteCacheStore
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+EMPTY_SCHEDULE = '<table id="schedule"><tbody></tbody></table>'
+
+# URL pattern -> fixture file (None: an empty schedule month)
+FIXTURE_PAGES = [
+    (re.compile(r"/players/\w/\w+/gamelog/"), "gamelog_jamesle01_2025.html"),
+    (re.compile(r"/players/\w/\w+\.html"), "profile_jamesle01.html"),
+    (re.compile(r"/teams/\w+/\d{4}\.html"), "roster_LAL_2025.html"),
+    (re.compile(r"/leagues/NBA_\d{4}_games(-april)?\.html"), "schedule_2025_april.html"),
+    (re.compile(r"/leagues/NBA_\d{4}_games-\w+\.html"), None),
+]
+
+def fixture(name):
+    return (FIXTURES / name).read_text()
+
+
+class FixtureFetcher:
+    """Stands in for TieredFetcher: same fetch(url) -> (html, tier) contract."""
+
+    def __init__(self):
+        self.pages = {}
+        self.urls = []
+
+    def fetch(self, url):
+        self.urls.append(url)
+        for pattern, name in FIXTURE_PAGES:
+            if pattern.search(url):
+                if name is None:
+                    return EMPTY_SCHEDULE, "fixture"
+                if name not in self.pages:
+                    self.pages[name] = fixture(name)
+                return self.pages[name], "fixture"
+        return None, "fixture"
+
+
+@contextmanager
+def offline_cache():
+    """Point the cache layer at a fresh store and the fixture fetcher; restore on exit."""
+    previous_store, previous_fetcher = cache._store, cache.get_fetcher
+    fetcher = FixtureFetcher()
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteCacheStore(os.path.join(tmp, "bench_cache.db"))
+        cache.set_cache_store(store)
+        cache.get_fetcher = lambda: fetcher
+        schedule._schedules.clear()
+        registry.get_registry().clear()
+        try:
+            yield fetcher
+        finally:
+            cache.get_fetcher = previous_fetcher
+            cache.set_cache_store(previous_store)
+            schedule._schedules.clear()
+            registry.get_registry().clear()
+            store.close()
+
+
+def reset_caches(*categories):
+    """Forget cached entries (all of them if no categories) and in-memory schedules/objects."""
+    store = cache.get_cache_store()
+    for category in categories or store.categories():
+        store.clear(category)
+    cache.memory_cache.clear()
+    schedule._schedules.clear()
+    registry.get_registry().clear()
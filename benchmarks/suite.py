@@ -0,0 +1,292 @@
+"""
+Offline benchmark suite for the app's hot paths.
+
+Everything runs against the recorded pages in tests/fixtures through a
+throwaway cache (see benchmarks/offline.py), so results do not depend on
+the network. Each benchmark reports the median / min / max milliseconds
+per call over several runs; results are written as JSON so two runs can be
+compared.
+
+    python -m benchmarks.suite                              # print results
+    python -m benchmarks.suite --output bench.json          # save results
+    python -m benchmarks.suite --baseline bench.json        # fail on regressions
+
+A benchmark regresses when its median exceeds its absolute budget, or the
+baseline median by more than --tolerance (default 30%).
+"""
+import argparse
+import atexit
+import io
+import itertools
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import date
+from pathlib import Path
+
+from benchmarks.bench_search import league
+from benchmarks.offline import fixture, offline_cache, reset_caches
+from modules import cache, dataset
+from modules.fetch import get_games_for_date
+from modules.parse import parse_game_log, parse_profile, parse_roster, parse_schedule
+from modules.player import Player
+from modules.team import Team
+from modules.utils import fuzzy_match_player
+
+DEFAULT_REPEAT = 7
+DEFAULT_TOLERANCE = 0.3
+GAMELOG_URL = "https://www.basketball-reference.com/players/j/jamesle01/gamelog/2025"
+ROSTER_URL = "https://www.basketball-reference.com/teams/LAL/2025.html"
+SLATE_DATE = date(2025, 4, 13)
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+BENCHMARKS = {}
+
+def benchmark(name, budget_ms, number=1):
+    """
+    Register a benchmark. The decorated function does any untimed setup and
+    returns (fn, before): fn is timed number times per run, before (or None)
+    runs untimed ahead of every run.
+    """
+    def register(factory):
+        BENCHMARKS[name] = {"factory": factory, "budget_ms": budget_ms, "number": number}
+        return factory
+    return register
+
+# --- Parsing ---
+
+@benchmark("parse_game_log", budget_ms=50)
+def _parse_game_log():
+    html = fixture("gamelog_jamesle01_2025.html")
+    return lambda: parse_game_log(html), None
+
+@benchmark("parse_roster", budget_ms=20)
+def _parse_roster():
+    html = fixture("roster_LAL_2025.html")
+    return lambda: parse_roster(html), None
+
+@benchmark("parse_profile", budget_ms=5, number=20)
+def _parse_profile():
+    html = fixture("profile_jamesle01.html")
+    return lambda: parse_profile(html), None
+
+@benchmark("parse_schedule", budget_ms=50)
+def _parse_schedule():
+    html = fixture("schedule_2025_april.html")
+    return lambda: parse_schedule(html), None
+
+# --- Team / schedule loading ---
+
+@benchmark("team_load_cold", budget_ms=50)
+def _team_load_cold():
+    cache.safe_request(ROSTER_URL, category="rosters")  # raw page cached, parse is not
+    return lambda: Team("Los Angeles Lakers", 2025).load(), lambda: reset_caches("parsed_rosters")
+
+@benchmark("team_load_warm", budget_ms=5, number=20)
+def _team_load_warm():
+    Team("Los Angeles Lakers", 2025).load()
+    return lambda: Team("Los Angeles Lakers", 2025).load(), None
+
+@benchmark("games_for_date_cold", budget_ms=500)
+def _games_for_date_cold():
+    return lambda: get_games_for_date(SLATE_DATE), reset_caches
+
+@benchmark("games_for_date_warm", budget_ms=2, number=50)
+def _games_for_date_warm():
+    get_games_for_date(SLATE_DATE)
+    return lambda: get_games_for_date(SLATE_DATE), None
+
+# --- Cache paths ---
+
+@benchmark("cache_hit_memory", budget_ms=0.1, number=200)
+def _cache_hit_memory():
+    cache.set_cached(GAMELOG_URL, fixture("gamelog_jamesle01_2025.html"))
+    return lambda: cache.get_cached(GAMELOG_URL), None
+
+@benchmark("cache_hit_store", budget_ms=5)
+def _cache_hit_store():
+    cache.set_cached(GAMELOG_URL, fixture("gamelog_jamesle01_2025.html"))
+    return lambda: cache.get_cached(GAMELOG_URL), cache.memory_cache.clear
+
+@benchmark("cache_miss_fetch_store", budget_ms=20, number=10)
+def _cache_miss():
+    counter = itertools.count()
+    return lambda: cache.safe_request(f"{GAMELOG_URL}?run={next(counter)}"), None
+
+# --- Search ---
+
+@benchmark("fuzzy_match_player", budget_ms=2, number=50)
+def _fuzzy_match_player():
+    players = league()
+    fuzzy_match_player("lebron", players)  # builds the index
+    return lambda: fuzzy_match_player("steph cury", players), None
+
+# --- Player ---
+
+def _lebron():
+    player = Player("LeBron James", "Los Angeles Lakers", 2025, "jamesle01")
+    player.fetch_stats()
+    return player
+
+@benchmark("player_fetch_stats_cold", budget_ms=100)
+def _player_fetch_stats_cold():
+    cache.safe_request(GAMELOG_URL)
+    return lambda: _lebron(), lambda: reset_caches("game_logs")
+
+@benchmark("player_season_averages", budget_ms=0.5, number=200)
+def _player_season_averages():
+    player = _lebron()
+    return player.get_season_averages, None
+
+@benchmark("player_last_n_games", budget_ms=1, number=100)
+def _player_last_n_games():
+    player = _lebron()
+    return lambda: player.get_last_n_games(10, SLATE_DATE), None
+
+@benchmark("player_last_n_averages_by_n", budget_ms=5, number=20)
+def _player_last_n_averages_by_n():
+    player = _lebron()
+    return lambda: player.get_last_n_averages_by_n(82, SLATE_DATE), None
+
+@benchmark("player_against_opponent", budget_ms=1, number=100)
+def _player_against_opponent():
+    player = _lebron()
+    return lambda: player.get_stats_against_opponent("BOS"), None
+
+@benchmark("player_threshold_table", budget_ms=5, number=20)
+def _player_threshold_table():
+    player = _lebron()
+    thresholds = {"points": [18.5, 22.5, 26.5, 30.5], "assists": [5.5, 7.5, 9.5], "3pm": [1.5, 2.5]}
+    return lambda: player.threshold_table(thresholds, last_n=20), None
+
+# --- Columnar dataset ---
+
+@benchmark("dataset_load_game_log", budget_ms=20)
+def _dataset_load_game_log():
+    base_dir = tempfile.mkdtemp(prefix="nba_dataset_")
+    atexit.register(shutil.rmtree, base_dir, True)
+    games = parse_game_log(fixture("gamelog_jamesle01_2025.html"))
+    for i in range(30):  # a league-sized partition: the scan has to skip the other players
+        dataset.write_game_log(f"player{i:02d}", 2025, games, base_dir=base_dir)
+    return lambda: dataset.load_game_log("player07", 2025, base_dir=base_dir), None
+
+# --- Startup ---
+
+# What a headless script or report worker imports; the UI stack must stay out of it
+CORE_MODULES = ["modules.fetch", "modules.search", "modules.utils"]
+UI_MODULES = ["streamlit", "pandas", "pyarrow", "altair", "playwright"]
+
+def import_core():
+    """Fresh interpreter importing CORE_MODULES; returns the UI_MODULES it loaded anyway."""
+    code = f"import sys, {', '.join(CORE_MODULES)}; print(' '.join(m for m in {UI_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=REPO_ROOT)
+    return result.stdout.split()
+
+@benchmark("import_core", budget_ms=600)
+def _import_core():
+    return import_core, None
+
+# --- Running and comparing ---
+
+def _time(fn, before, number, repeat):
+    samples = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number * 1000)
+    return samples
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def run(names=None, repeat=DEFAULT_REPEAT):
+    """Run the selected benchmarks (all by default) offline; returns a JSON-ready dict."""
+    results = {}
+    # The app logs every cache hit and fetch; keep that out of the timings
+    with offline_cache(), redirect_stdout(io.StringIO()):
+        for name, spec in BENCHMARKS.items():
+            if names and name not in names:
+                continue
+            reset_caches()
+            fn, before = spec["factory"]()
+            fn()  # warm-up
+            samples = _time(fn, before, spec["number"], repeat)
+            results[name] = {
+                "median_ms": round(statistics.median(samples), 4),
+                "min_ms": round(min(samples), 4),
+                "max_ms": round(max(samples), 4),
+                "runs": repeat,
+                "number": spec["number"],
+                "budget_ms": spec["budget_ms"],
+            }
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+
+def compare(report, baseline=None, tolerance=DEFAULT_TOLERANCE):
+    """List of regressions as {"name", "median_ms", "limit_ms", "reason"} dicts."""
+    regressions = []
+    baseline_results = (baseline or {}).get("results", {})
+    for name, result in report["results"].items():
+        if result["median_ms"] > result["budget_ms"]:
+            regressions.append({"name": name, "median_ms": result["median_ms"],
+                                "limit_ms": result["budget_ms"], "reason": "budget"})
+        previous = baseline_results.get(name)
+        if previous is not None:
+            limit = round(previous["median_ms"] * (1 + tolerance), 4)
+            if result["median_ms"] > limit:
+                regressions.append({"name": name, "median_ms": result["median_ms"],
+                                    "limit_ms": limit, "reason": "baseline"})
+    return regressions
+
+def print_report(report, baseline=None):
+    baseline_results = (baseline or {}).get("results", {})
+    print(f"{'benchmark':<30}{'median ms':>12}{'min ms':>10}{'budget':>10}{'baseline':>10}")
+    for name, result in report["results"].items():
+        previous = baseline_results.get(name, {}).get("median_ms", "")
+        print(f"{name:<30}{result['median_ms']:>12.4f}{result['min_ms']:>10.4f}{result['budget_ms']:>10}{previous:>10}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--only", nargs="*", help="benchmark names to run")
+    args = parser.parse_args(argv)
+
+    report = run(args.only, args.repeat)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    regressions = compare(report, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"❌ {regression['name']}: {regression['median_ms']} ms > {regression['limit_ms']} ms ({regression['reason']})")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
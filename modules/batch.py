@@ -0,0 +1,56 @@
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from modules.cache import get_cached, safe_request, was_not_found
+
+BATCH_MAX_WORKERS = int(os.environ.get("NBA_BATCH_WORKERS", 4))
+BATCH_RETRIES = 2
+BATCH_BACKOFF = 2.0  # seconds, doubled per attempt
+
+def fetch_with_retries(url, category="pages", retries=BATCH_RETRIES, backoff=BATCH_BACKOFF, max_age=None):
+    """
+    safe_request with jittered exponential backoff between failed attempts.
+    Pages the server reported as missing (404/410) are not retried.
+    """
+    for attempt in range(retries + 1):
+        html = safe_request(url, category=category, max_age=max_age)
+        if html:
+            return html
+        if was_not_found(url):
+            return None
+        if attempt < retries:
+            delay = backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+            print(f"🔁 Retrying {url} in {delay:.1f}s ({attempt + 1}/{retries})")
+            time.sleep(delay)
+    return None
+
+def fetch_many(urls, category="pages", max_workers=BATCH_MAX_WORKERS, max_age=None):
+    """
+    Fetch many URLs with bounded concurrency and yield (url, html) pairs as
+    they complete. Cached pages are yielded first without touching the
+    network; misses go through safe_request, which applies the per-host and
+    global rate limits. html is None for URLs that still failed after retries.
+
+    max_age (seconds) is passed on to safe_request: cached copies older than
+    that are refetched rather than served stale, for callers that refresh.
+    """
+    pending = []
+    for url in dict.fromkeys(urls):
+        html = get_cached(url, category) if max_age is None else None
+        if html is not None:
+            yield url, html
+        else:
+            pending.append(url)
+
+    if not pending:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+        futures = {pool.submit(fetch_with_retries, url, category, max_age=max_age): url for url in pending}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+def prefetch(urls, category="pages", max_workers=BATCH_MAX_WORKERS, max_age=None):
+    """Warm the cache for urls; returns the list of URLs that failed."""
+    return [url for url, html in fetch_many(urls, category, max_workers, max_age) if html is None]
@@ -0,0 +1,165 @@
+import atexit
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from modules.metrics import increment, span
+
+BROWSER_POOL_SIZE = int(os.environ.get("NBA_BROWSER_PAGES", 2))
+BROWSER_PAGE_MAX_USES = int(os.environ.get("NBA_BROWSER_PAGE_USES", 50))
+BROWSER_NAV_TIMEOUT = 20000  # ms
+
+def sync_playwright():
+    """Playwright is imported on first launch; most runs never need the browser fallback."""
+    from playwright.sync_api import sync_playwright as playwright
+    return playwright()
+
+class _BrowserWorker(threading.Thread):
+    """
+    Owns one Playwright instance, browser and page. Playwright's sync API is
+    bound to the thread that started it, so each page lives on its own thread
+    and fetches are handed to it through the pool's task queue.
+    """
+
+    def __init__(self, pool, index):
+        super().__init__(name=f"browser-pool-{index}", daemon=True)
+        self.pool = pool
+        self._playwright = None
+        self._browser = None
+        self._page = None
+        self._page_uses = 0
+
+    def run(self):
+        try:
+            while True:
+                task = self.pool._tasks.get()
+                if task is None:
+                    break
+                url, future = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    html = self._fetch(url)
+                except Exception as e:
+                    # Assume the browser is in a bad state; relaunch on the next task
+                    self.pool.crashes += 1
+                    self._close_browser()
+                    future.set_exception(e)
+                else:
+                    future.set_result(html)
+        finally:
+            self._close_browser()
+            if self._playwright is not None:
+                try:
+                    self._playwright.stop()
+                except Exception:
+                    pass
+                self._playwright = None
+
+    def _ensure_page(self):
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        if self._browser is None or not self._browser.is_connected():
+            self._close_browser()
+            with span("browser.launch"):
+                self._browser = self._playwright.chromium.launch(headless=True)
+            self.pool.launches += 1
+            increment("browser.launches")
+        if self._page is None or self._page.is_closed() or self._page_uses >= self.pool.max_page_uses:
+            if self._page is not None and not self._page.is_closed():
+                self._page.close()
+                self.pool.recycles += 1
+            self._page = self._browser.new_page()
+            self._page_uses = 0
+        return self._page
+
+    def _fetch(self, url):
+        page = self._ensure_page()
+        self._page_uses += 1
+        page.goto(url, timeout=self.pool.nav_timeout, wait_until="domcontentloaded")
+        return page.content()
+
+    def _close_browser(self):
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+        self._browser = None
+        self._page = None
+        self._page_uses = 0
+
+
+class BrowserPool:
+    """
+    Long-lived pool of headless Chromium pages. `size` pages can load
+    concurrently; each page is replaced after `max_page_uses` navigations
+    and its browser is relaunched after a failure. Workers start lazily on
+    the first fetch and are shut down when the process exits.
+    """
+
+    def __init__(self, size=BROWSER_POOL_SIZE, max_page_uses=BROWSER_PAGE_MAX_USES, nav_timeout=BROWSER_NAV_TIMEOUT):
+        self.size = size
+        self.max_page_uses = max_page_uses
+        self.nav_timeout = nav_timeout
+        self._tasks = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.launches = 0
+        self.recycles = 0
+        self.crashes = 0
+
+    def _start(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Browser pool has been shut down")
+            if not self._workers:
+                self._workers = [_BrowserWorker(self, i) for i in range(self.size)]
+                for worker in self._workers:
+                    worker.start()
+
+    def submit(self, url):
+        """Queue a page load and return a Future resolving to its HTML."""
+        self._start()
+        future = Future()
+        self._tasks.put((url, future))
+        return future
+
+    def fetch(self, url, timeout=None):
+        """Load url on a pooled page and return its HTML (raises on failure)."""
+        return self.submit(url).result(timeout=timeout)
+
+    def shutdown(self, wait=True, timeout=10):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._tasks.put(None)
+        if wait:
+            for worker in workers:
+                worker.join(timeout)
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "launches": self.launches,
+            "recycles": self.recycles,
+            "crashes": self.crashes,
+            "queued": self._tasks.qsize(),
+        }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_browser_pool():
+    """Return the process-wide browser pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.shutdown)
+        return _pool
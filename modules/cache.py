@@ -1,72 +1,271 @@
 import json
+import threading
 import time
 import os
-import requests
-from playwright.sync_api import sync_playwright
+from concurrent.futures import ThreadPoolExecutor
+from modules.fetcher import NOT_FOUND, get_fetcher
+from modules.cache_store import CACHE_BACKENDS, migrate_json_cache
+from modules.memory_cache import LRUCache
+from modules.metrics import increment, span
+from modules.single_flight import SingleFlight
 
 CACHE_FILE = "nba_cache.json"
+CACHE_DB = "nba_cache.db"
+CACHE_BACKEND = os.environ.get("NBA_CACHE_BACKEND", "sqlite")
 CACHE_EXPIRY = {
     "rosters": 7 * 24 * 60 * 60,  # 7 days
     "all_players": 7 * 24 * 60 * 60,  # 7 days
     "player_stats": 24 * 60 * 60,  # 1 day
-    "pages": 12 * 60 * 60  # 12 hours
+    "pages": 12 * 60 * 60,  # 12 hours
+    "player_ids": 30 * 24 * 60 * 60,  # 30 days
+    "player_ids_missing": 24 * 60 * 60,  # 1 day
+    "parsed_rosters": 7 * 24 * 60 * 60  # same as rosters
 }
+CACHE_CATEGORIES = ["rosters", "all_players", "player_stats", "pages", "player_photos", "player_ids", "player_ids_missing",
+                    "parsed_rosters", "season_schedules", "game_logs"]
+# CACHE_EXPIRY is the soft TTL. Between it and the hard TTL below,
+# safe_request serves the stale page at once and refreshes it in the
+# background; past the hard TTL (or for categories not listed) it blocks.
+CACHE_HARD_EXPIRY = {
+    "pages": 3 * 24 * 60 * 60,  # 3 days
+    "rosters": 30 * 24 * 60 * 60,  # 30 days
+}
+# Total budget for the SQLite store (stored, i.e. compressed, bytes)
+CACHE_MAX_BYTES = int(os.environ.get("NBA_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+STALE_WHILE_REVALIDATE = os.environ.get("NBA_CACHE_SWR", "1") != "0"
+REFRESH_WORKERS = int(os.environ.get("NBA_REFRESH_WORKERS", 2))
+# Raw page HTML is only needed to re-parse; set NBA_CACHE_RAW_HTML=0 to keep
+# just the parsed artifacts and cut cache size.
+CACHE_RAW_HTML = os.environ.get("NBA_CACHE_RAW_HTML", "1") != "0"
+RAW_HTML_CATEGORIES = {"pages", "rosters"}
 
-def load_cache():
-    """Load the cache from file or return an empty structured cache."""
-    if not os.path.exists(CACHE_FILE):
-        return {"rosters": {}, "all_players": {}, "player_stats": {}, "pages": {}, "player_photos": {}}
+# In-process tier in front of the store. Module state survives Streamlit
+# reruns, so it is shared by every session served by this process.
+MEMORY_CACHE_MAX_ENTRIES = int(os.environ.get("NBA_MEMORY_CACHE_ENTRIES", 512))
+MEMORY_CACHE_MAX_BYTES = int(os.environ.get("NBA_MEMORY_CACHE_BYTES", 64 * 1024 * 1024))
 
-    try:
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        print("⚠️ Cache file is corrupted. Resetting cache.")
-        return {"rosters": {}, "all_players": {}, "player_stats": {}, "pages": {}}
+_store = None
+_refresh_pool = None
+_refreshing = set()
+_refresh_listeners = []
+# Concurrent misses for the same URL share one fetch
+fetch_flight = SingleFlight()
+_refresh_lock = threading.Lock()
+refresh_stats = {"stale_hits": 0, "refreshes": 0, "refresh_failures": 0, "refresh_seconds": 0.0}
+memory_cache = LRUCache(MEMORY_CACHE_MAX_ENTRIES, MEMORY_CACHE_MAX_BYTES, CACHE_EXPIRY)
+# URLs the server answered with "not found", so callers can tell them from failed fetches
+not_found_pages = LRUCache(1024, expiry={"pages": CACHE_EXPIRY["player_ids_missing"]})
+
+def get_cache_store():
+    """Return the process-wide cache backend, creating (and migrating) it on first use."""
+    global _store
+    if _store is None:
+        if CACHE_BACKEND == "json":
+            _store = CACHE_BACKENDS["json"](CACHE_FILE)
+        else:
+            _store = CACHE_BACKENDS[CACHE_BACKEND](CACHE_DB, max_bytes=CACHE_MAX_BYTES)
+            migrate_json_cache(CACHE_FILE, _store)
+    return _store
+
+def set_cache_store(store):
+    """Swap the cache backend (used by tests and benchmarks)."""
+    global _store
+    _store = store
+    memory_cache.clear()
+
+def is_fresh(entry, category):
+    """True if a cache entry is younger than its category's expiry."""
+    expiry = CACHE_EXPIRY.get(category)
+    if expiry is None:
+        return True
+    return time.time() - entry.get("timestamp", 0) < expiry
+
+def is_dead(entry, category):
+    """True once an entry is too old to be served even stale; it is deleted when read."""
+    expiry = CACHE_HARD_EXPIRY.get(category, CACHE_EXPIRY.get(category))
+    return expiry is not None and time.time() - entry.get("timestamp", 0) >= expiry
+
+def _get_entry(key, category):
+    """Look up an entry in the memory tier, then the store (promoting fresh hits)."""
+    entry = memory_cache.get(category, key)
+    if entry is not None:
+        return entry
+    with span("cache.read"):
+        entry = get_cache_store().get(category, key)
+    if entry is not None and is_dead(entry, category):
+        get_cache_store().delete(category, key)
+        return None
+    if entry is not None and is_fresh(entry, category):
+        memory_cache.put(category, key, entry["data"], entry["timestamp"])
+    return entry
+
+def get_cached(key, category="pages"):
+    """Return cached data for key if present and not expired, else None."""
+    entry = _get_entry(key, category)
+    if entry is None or not is_fresh(entry, category):
+        increment("cache.miss")
+        return None
+    increment("cache.hit")
+    return entry["data"]
+
+def set_cached(key, data, category="pages"):
+    """Store data for key in a category."""
+    timestamp = time.time()
+    with span("cache.write"):
+        get_cache_store().set(category, key, data, timestamp)
+    memory_cache.put(category, key, data, timestamp)
+
+def cache_stats():
+    """Entries and stored bytes per category, plus the total."""
+    sizes = get_cache_store().sizes()
+    total = {
+        "entries": sum(s["entries"] for s in sizes.values()),
+        "bytes": sum(s["bytes"] or 0 for s in sizes.values()),
+    }
+    return {"categories": sizes, "total": total}
+
+def print_cache_stats():
+    stats = cache_stats()
+    print(f"{'category':<20}{'entries':>10}{'bytes':>14}")
+    for category, sizes in sorted(stats["categories"].items()):
+        print(f"{category:<20}{sizes['entries']:>10}{sizes['bytes'] or 0:>14,}")
+    print(f"{'total':<20}{stats['total']['entries']:>10}{stats['total']['bytes']:>14,}")
+    if CACHE_BACKEND != "json":
+        print(f"budget: {CACHE_MAX_BYTES:,} bytes")
+
+def memory_cache_stats():
+    """Hit, miss and eviction counters for the in-memory tier."""
+    return memory_cache.stats()
+
+def load_cache():
+    """
+    Load the full cache as {category: {key: entry}}.
+    Reads every entry; prefer get_cached/set_cached for single lookups.
+    """
+    store = get_cache_store()
+    cache = {category: {} for category in CACHE_CATEGORIES}
+    for category in store.categories():
+        cache[category] = dict(store.items(category))
+    return cache
 
 def save_cache(cache):
-    """Save the cache to file."""
-    with open(CACHE_FILE, "w") as f:
-        json.dump(cache, f, indent=4)
+    """Write every entry of a {category: {key: entry}} dict to the cache."""
+    store = get_cache_store()
+    for category, entries in cache.items():
+        for key, entry in entries.items():
+            if isinstance(entry, dict) and "data" in entry:
+                store.set(category, key, entry["data"], entry.get("timestamp", time.time()))
+
+def _within_hard_expiry(entry, category):
+    hard_expiry = CACHE_HARD_EXPIRY.get(category)
+    return hard_expiry is not None and time.time() - entry.get("timestamp", 0) < hard_expiry
+
+def _refresh(url, category):
+    start = time.perf_counter()
+    html = fetch_flight.do((category, url), lambda: _fetch_and_store(url, category))
+    with _refresh_lock:
+        _refreshing.discard((category, url))
+        refresh_stats["refreshes"] += 1
+        refresh_stats["refresh_seconds"] += time.perf_counter() - start
+        if not html:
+            refresh_stats["refresh_failures"] += 1
+    if html:
+        for listener in _refresh_listeners:
+            listener(url, category, html)
+
+def add_refresh_listener(listener):
+    """Call listener(url, category, html) after every successful background refresh."""
+    _refresh_listeners.append(listener)
 
-def safe_request(url, category="pages"):
+def schedule_refresh(url, category="pages"):
+    """Refetch url on a background worker unless a refresh is already pending."""
+    global _refresh_pool
+    with _refresh_lock:
+        if (category, url) in _refreshing:
+            return False
+        _refreshing.add((category, url))
+        if _refresh_pool is None:
+            _refresh_pool = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix="cache-refresh")
+    _refresh_pool.submit(_refresh, url, category)
+    return True
+
+def wait_for_refreshes(timeout=30):
+    """Block until pending background refreshes finish (tests, CLI shutdown)."""
+    deadline = time.time() + timeout
+    while _refreshing and time.time() < deadline:
+        time.sleep(0.01)
+    return not _refreshing
+
+def cache_refresh_stats():
+    """Stale hits and background refresh counts, failures and mean latency."""
+    with _refresh_lock:
+        stats = dict(refresh_stats, pending=len(_refreshing))
+    stats["refresh_avg_seconds"] = stats["refresh_seconds"] / stats["refreshes"] if stats["refreshes"] else 0.0
+    return stats
+
+def safe_request(url, category="pages", max_age=None):
     """
-    Always uses Playwright to fetch the page, with full caching and expiry support.
+    Fetch a page with full caching and expiry support. Tries plain HTTP
+    first and falls back to Playwright when the page looks incomplete.
+    max_age (seconds) further limits how old a cached copy may be.
+
+    An expired entry still within CACHE_HARD_EXPIRY is returned immediately
+    and refreshed in the background (unless max_age is given).
     """
-    cache = load_cache()
-    category_cache = cache.get(category, {})
+    entry = _get_entry(url, category)
 
     # Use cached version if valid
-    if url in category_cache:
-        timestamp = category_cache[url].get("timestamp", 0)
-        age = time.time() - timestamp
-        if age < CACHE_EXPIRY[category]:
+    if entry is not None:
+        age = time.time() - entry.get("timestamp", 0)
+        if is_fresh(entry, category) and (max_age is None or age < max_age):
             print(f"✅ Using cached {category} response for {url} (Age: {age / 3600:.2f} hours)")
-            return category_cache[url]["data"]
-        else:
-            print(f"⏳ Cache expired for {category} {url}. Fetching fresh data.")
+            increment("cache.hit")
+            return entry["data"]
+        if STALE_WHILE_REVALIDATE and max_age is None and _within_hard_expiry(entry, category):
+            print(f"♻️ Serving stale {category} response for {url} (Age: {age / 3600:.2f} hours), refreshing")
+            increment("cache.stale_hit")
+            with _refresh_lock:
+                refresh_stats["stale_hits"] += 1
+            schedule_refresh(url, category)
+            return entry["data"]
+        print(f"⏳ Cache expired for {category} {url}. Fetching fresh data.")
+
+    increment("cache.miss")
+    return fetch_flight.do((category, url), lambda: _fetch_if_missing(url, category, max_age))
+
+def _fetch_if_missing(url, category, max_age):
+    # Another thread or process may have stored the page while we waited
+    entry = get_cache_store().get(category, url)
+    if entry is not None and is_fresh(entry, category):
+        if max_age is None or time.time() - entry["timestamp"] < max_age:
+            memory_cache.put(category, url, entry["data"], entry["timestamp"])
+            return entry["data"]
+    return _fetch_and_store(url, category)
+
+def was_not_found(url):
+    """True if the last fetch of url was answered with "not found" (rather than failing)."""
+    return not_found_pages.get("pages", url) is not None
 
-    print(f"🌍 Fetching {url} using Playwright...")
+def _fetch_and_store(url, category):
+    print(f"🌍 Fetching {url}...")
+    not_found_pages.delete("pages", url)
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, timeout=20000, wait_until="domcontentloaded")
-            html = page.content()
-            browser.close()
-
-            if html.strip():
-                category_cache[url] = {"data": html, "timestamp": time.time()}
-                cache[category] = category_cache
-                save_cache(cache)
-                print(f"✅ Playwright fetch + cache successful for {url}")
-                return html
-            else:
-                print(f"⚠️ Empty content received from Playwright for {url}")
+        with span("fetch"):
+            html, tier = get_fetcher().fetch(url)
+
+        if tier == NOT_FOUND:
+            not_found_pages.put("pages", url, True)
+        elif html:
+            if CACHE_RAW_HTML or category not in RAW_HTML_CATEGORIES:
+                set_cached(url, html, category)
+            print(f"✅ {tier} fetch + cache successful for {url}")
+            return html
+        else:
+            print(f"⚠️ Empty content received for {url}")
 
     except Exception as e:
-        print(f"❌ Playwright failed for {url}: {e}")
+        print(f"❌ Fetch failed for {url}: {e}")
 
     return None
 
@@ -75,15 +274,27 @@ def clear_cache(category=None):
     Clears the entire cache or a specific category.
     If category is None, clears all caches.
     """
+    store = get_cache_store()
+    memory_cache.clear(category)
     if category:
-        cache = load_cache()
-        if category in cache:
-            cache[category] = {}
-            save_cache(cache)
+        if category in store.categories():
+            store.clear(category)
             print(f"🗑️ Cleared cache for {category}.")
         else:
             print(f"⚠️ Category '{category}' not found in cache.")
     else:
-        if os.path.exists(CACHE_FILE):
-            os.remove(CACHE_FILE)
-            print("🗑️ Cache file deleted.")
+        store.clear()
+        print("🗑️ Cache cleared.")
+
+if __name__ == "__main__":
+    # python -m modules.cache [stats | evict | clear [category]]
+    import sys
+    command = sys.argv[1] if len(sys.argv) > 1 else "stats"
+    if command == "stats":
+        print_cache_stats()
+    elif command == "evict":
+        print(f"🗑️ Evicted {get_cache_store().evict(CACHE_MAX_BYTES)} entries")
+    elif command == "clear":
+        clear_cache(sys.argv[2] if len(sys.argv) > 2 else None)
+    else:
+        sys.exit(f"Unknown command {command!r}; expected stats, evict or clear")
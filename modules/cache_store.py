@@ -0,0 +1,414 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: only in-process locking is available
+    fcntl = None
+
+class CacheStore:
+    """
+    Keyed cache backend. Entries are addressed by (category, key) and hold
+    a JSON-serializable payload plus the time it was written.
+    """
+
+    def get(self, category, key):
+        """Return {"data": ..., "timestamp": ...} for the entry, or None."""
+        raise NotImplementedError
+
+    def set(self, category, key, data, timestamp=None):
+        raise NotImplementedError
+
+    def delete(self, category, key):
+        raise NotImplementedError
+
+    def clear(self, category=None):
+        """Remove every entry in a category, or the whole store if category is None."""
+        raise NotImplementedError
+
+    def items(self, category):
+        """Yield (key, entry) pairs for a category."""
+        raise NotImplementedError
+
+    def categories(self):
+        raise NotImplementedError
+
+    def count(self, category=None):
+        raise NotImplementedError
+
+    def sizes(self):
+        """{category: {"entries": n, "bytes": stored bytes}}."""
+        raise NotImplementedError
+
+    def evict(self, max_bytes):
+        """Drop least recently used entries until the store fits max_bytes; returns how many."""
+        return 0
+
+    def close(self):
+        pass
+
+
+ACCESS_RESOLUTION = 60  # seconds; last-access times are only rewritten this often
+EVICT_CHECK_EVERY = 100  # writes between size-budget checks
+EVICT_TARGET = 0.9  # evict down to this fraction of the budget
+SQLITE_BUSY_TIMEOUT = 10  # seconds a writer waits for another process's lock
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    SQLite-backed store. Every read and write touches a single row, so the
+    cost of a hit does not depend on how many pages are cached.
+
+    Payloads are stored as zlib-compressed JSON (rows written as plain JSON
+    text by older versions are still read). With max_bytes set, the store is
+    kept under that many stored bytes by dropping the least recently read
+    entries of whichever category is largest.
+
+    Several processes may share one database file: WAL mode lets readers run
+    alongside a writer, writers wait up to SQLITE_BUSY_TIMEOUT for each
+    other, and multi-row writes run in a single IMMEDIATE transaction.
+    """
+
+    def __init__(self, path, max_bytes=None, compress=True):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self._local = threading.local()
+        self._writes = 0
+        conn = self._conn()
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                category TEXT NOT NULL,
+                key TEXT NOT NULL,
+                data BLOB NOT NULL,
+                timestamp REAL NOT NULL,
+                size INTEGER NOT NULL DEFAULT 0,
+                accessed REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (category, key)
+            ) WITHOUT ROWID
+            """
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        if "size" not in columns:
+            conn.execute("ALTER TABLE cache ADD COLUMN size INTEGER NOT NULL DEFAULT 0")
+            conn.execute("ALTER TABLE cache ADD COLUMN accessed REAL NOT NULL DEFAULT 0")
+            conn.execute("UPDATE cache SET size = length(data), accessed = timestamp")
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_lru ON cache (category, accessed)")
+
+    def _encode(self, data):
+        text = json.dumps(data, separators=(",", ":"))
+        return zlib.compress(text.encode("utf-8"), 6) if self.compress else text
+
+    @staticmethod
+    def _decode(blob):
+        if isinstance(blob, bytes):
+            return json.loads(zlib.decompress(blob))
+        return json.loads(blob)
+
+    def _row(self, category, key, data, timestamp):
+        blob = self._encode(data)
+        timestamp = timestamp if timestamp is not None else time.time()
+        return (category, key, blob, timestamp, len(blob), time.time())
+
+    def _conn(self):
+        # sqlite3 connections must not be shared between threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None, timeout=SQLITE_BUSY_TIMEOUT)
+            conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT * 1000}")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, category, key):
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT data, timestamp, accessed FROM cache WHERE category = ? AND key = ?",
+            (category, key),
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[2] >= ACCESS_RESOLUTION:
+            conn.execute("UPDATE cache SET accessed = ? WHERE category = ? AND key = ?", (now, category, key))
+        return {"data": self._decode(row[0]), "timestamp": row[1]}
+
+    def set(self, category, key, data, timestamp=None):
+        self._conn().execute(
+            "INSERT OR REPLACE INTO cache (category, key, data, timestamp, size, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+            self._row(category, key, data, timestamp),
+        )
+        self._after_write(1)
+
+    def set_many(self, category, entries):
+        """Bulk insert of (key, data, timestamp) tuples in one transaction."""
+        conn = self._conn()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (category, key, data, timestamp, size, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                [self._row(category, key, data, timestamp) for key, data, timestamp in entries],
+            )
+        self._after_write(len(entries))
+
+    def _after_write(self, count):
+        if self.max_bytes is None:
+            return
+        self._writes += count
+        if self._writes >= EVICT_CHECK_EVERY:
+            self._writes = 0
+            self.evict(self.max_bytes)
+
+    def total_bytes(self):
+        return self._conn().execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+
+    def evict(self, max_bytes):
+        total = self.total_bytes()
+        if total <= max_bytes:
+            return 0
+        conn = self._conn()
+        target = max_bytes * EVICT_TARGET
+        evicted = 0
+        while total > target:
+            sizes = self.sizes()
+            if not sizes:
+                break
+            category = max(sizes, key=lambda c: sizes[c]["bytes"])
+            rows = conn.execute(
+                "SELECT key, size FROM cache WHERE category = ? ORDER BY accessed LIMIT 100", (category,)
+            ).fetchall()
+            victims = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                victims.append((category, key))
+                total -= size
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("DELETE FROM cache WHERE category = ? AND key = ?", victims)
+            evicted += len(victims)
+        return evicted
+
+    def delete(self, category, key):
+        self._conn().execute("DELETE FROM cache WHERE category = ? AND key = ?", (category, key))
+
+    def clear(self, category=None):
+        if category is None:
+            self._conn().execute("DELETE FROM cache")
+        else:
+            self._conn().execute("DELETE FROM cache WHERE category = ?", (category,))
+
+    def items(self, category):
+        rows = self._conn().execute(
+            "SELECT key, data, timestamp FROM cache WHERE category = ?", (category,)
+        ).fetchall()
+        for key, data, timestamp in rows:
+            yield key, {"data": self._decode(data), "timestamp": timestamp}
+
+    def categories(self):
+        return [row[0] for row in self._conn().execute("SELECT DISTINCT category FROM cache")]
+
+    def count(self, category=None):
+        if category is None:
+            return self._conn().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM cache WHERE category = ?", (category,)
+        ).fetchone()[0]
+
+    def sizes(self):
+        rows = self._conn().execute("SELECT category, COUNT(*), SUM(size) FROM cache GROUP BY category")
+        return {category: {"entries": count, "bytes": size} for category, count, size in rows}
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class JSONCacheStore(CacheStore):
+    """
+    The original single-file layout ({category: {key: entry}}). Every write
+    rewrites the whole file; kept for compatibility and for comparison.
+
+    Safe for several processes: each read-modify-write holds an exclusive
+    flock on a sidecar .lock file (reads take a shared one), and the file is
+    replaced atomically, so readers never see a half-written cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _file_lock(self, exclusive=False):
+        if fcntl is None:
+            yield
+            return
+        with open(self.path + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def _writing(self):
+        with self._lock, self._file_lock(exclusive=True):
+            yield
+
+    def _read(self):
+        with self._file_lock():
+            cache = self._parse()
+        if cache is None:
+            # Moving the file aside needs the exclusive lock, not the shared one
+            with self._writing():
+                return self._load()
+        return cache
+
+    def _parse(self):
+        """The cache file's contents, {} if there is none, None if it is corrupt."""
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            return None
+
+    def _load(self):
+        # Callers hold the exclusive lock (see _writing)
+        cache = self._parse()
+        if cache is None:
+            # Writes are atomic, so this is damage from outside; keep it for inspection
+            print(f"⚠️ Cache file is corrupted. Moving it to {self.path}.corrupt and resetting cache.")
+            os.replace(self.path, self.path + ".corrupt")
+            return {}
+        return cache
+
+    def _save(self, cache):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".nba_cache.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(cache, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def get(self, category, key):
+        entry = self._read().get(category, {}).get(key)
+        if not isinstance(entry, dict) or "data" not in entry:
+            return None
+        return {"data": entry["data"], "timestamp": entry.get("timestamp", 0)}
+
+    def set(self, category, key, data, timestamp=None):
+        with self._writing():
+            cache = self._load()
+            cache.setdefault(category, {})[key] = {
+                "data": data,
+                "timestamp": timestamp if timestamp is not None else time.time(),
+            }
+            self._save(cache)
+
+    def delete(self, category, key):
+        with self._writing():
+            cache = self._load()
+            if cache.get(category, {}).pop(key, None) is not None:
+                self._save(cache)
+
+    def clear(self, category=None):
+        with self._writing():
+            if category is None:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            cache = self._load()
+            cache[category] = {}
+            self._save(cache)
+
+    def items(self, category):
+        for key, entry in self._read().get(category, {}).items():
+            if isinstance(entry, dict) and "data" in entry:
+                yield key, {"data": entry["data"], "timestamp": entry.get("timestamp", 0)}
+
+    def categories(self):
+        return list(self._read().keys())
+
+    def count(self, category=None):
+        cache = self._read()
+        if category is None:
+            return sum(len(entries) for entries in cache.values())
+        return len(cache.get(category, {}))
+
+    def sizes(self):
+        return {
+            category: {"entries": len(entries), "bytes": sum(len(json.dumps(e)) for e in entries.values())}
+            for category, entries in self._read().items() if isinstance(entries, dict)
+        }
+
+
+CACHE_BACKENDS = {
+    "sqlite": SQLiteCacheStore,
+    "json": JSONCacheStore,
+}
+
+def migrate_json_cache(json_path, store):
+    """
+    Copy entries from a legacy nba_cache.json into `store`, then rename the
+    JSON file so the migration only runs once. Returns the number of entries copied.
+
+    Processes starting together (the app plus report workers) serialize on
+    the JSON store's exclusive lock; whoever gets it second finds the file
+    already renamed and has nothing to do.
+    """
+    if not os.path.exists(json_path):
+        return 0
+
+    with JSONCacheStore(json_path)._writing():
+        return _migrate_locked(json_path, store)
+
+def _migrate_locked(json_path, store):
+    try:
+        with open(json_path, "r") as f:
+            legacy = json.load(f)
+    except FileNotFoundError:
+        return 0  # Migrated by another process while we waited for the lock
+    except (json.JSONDecodeError, OSError):
+        print(f"⚠️ Could not read legacy cache {json_path}; skipping migration.")
+        return 0
+
+    migrated = 0
+    for category, entries in legacy.items():
+        if not isinstance(entries, dict):
+            continue
+        # all_players was stored as a single {"data", "timestamp"} blob with no
+        # season attached; it is cheap to rebuild from the cached rosters.
+        if "data" in entries and "timestamp" in entries:
+            continue
+        batch = [
+            (key, entry["data"], entry.get("timestamp", 0))
+            for key, entry in entries.items()
+            if isinstance(entry, dict) and "data" in entry
+        ]
+        if hasattr(store, "set_many"):
+            store.set_many(category, batch)
+        else:
+            for key, data, timestamp in batch:
+                store.set(category, key, data, timestamp)
+        migrated += len(batch)
+
+    os.replace(json_path, json_path + ".migrated")
+    print(f"📦 Migrated {migrated} entries from {json_path}")
+    return migrated
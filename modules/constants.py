@@ -2,20 +2,29 @@
 #      CONSTANTS & MAPPINGS      #
 # ============================== #
 
-# Mapping of stats to their corresponding column indices in the game stats table
+# Mapping of stats to the data-stat attribute(s) of their game log cells.
+# Older pages use different names, so each stat lists the aliases in order.
 AVAILABLE_STATS = {
-    'points': 30,
-    'assists': 25,
-    'rebounds': 24,
-    'steals': 26,
-    'blocks': 27,
-    '3pm': 12,
+    'points': ('pts',),
+    'assists': ('ast',),
+    'rebounds': ('trb',),
+    'steals': ('stl',),
+    'blocks': ('blk',),
+    '3pm': ('fg3',),
     'points_rebounds_assists': None, #Derived
     'points_assists': None, #Derived
     'points_rebounds': None, #Derived
     'rebounds_assists': None #Derived
 }
 
+# data-stat aliases for the non-numeric game log columns
+GAME_LOG_FIELDS = {
+    'game_date': ('date', 'date_game'),
+    'opponent': ('opp_name_abbr', 'opp_id'),
+    'result': ('game_result',),
+    'team': ('team_name_abbr', 'team_id')
+}
+
 # In modules/constants.py
 STAT_NAME_MAPPING = {
     "game_date": "Game Date",
@@ -68,4 +77,47 @@ TEAM_CODES = {
 }
 
 # List of common suffixes to remove from names for URL fetching
-SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
\ No newline at end of file
+SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+# Nicknames and common short forms -> search key of the player's full name
+NICKNAMES = {
+    "king james": "lebron james",
+    "bron": "lebron james",
+    "the king": "lebron james",
+    "steph": "stephen curry",
+    "chef curry": "stephen curry",
+    "kd": "kevin durant",
+    "slim reaper": "kevin durant",
+    "ad": "anthony davis",
+    "the brow": "anthony davis",
+    "greek freak": "giannis antetokounmpo",
+    "giannis": "giannis antetokounmpo",
+    "joker": "nikola jokic",
+    "sga": "shai gilgeous alexander",
+    "luka": "luka doncic",
+    "wemby": "victor wembanyama",
+    "ant": "anthony edwards",
+    "ant man": "anthony edwards",
+    "cp3": "chris paul",
+    "dame": "damian lillard",
+    "dame time": "damian lillard",
+    "the beard": "james harden",
+    "spida": "donovan mitchell",
+    "book": "devin booker",
+    "jimmy buckets": "jimmy butler",
+    "the process": "joel embiid",
+    "kat": "karl anthony towns",
+    "pg13": "paul george",
+    "pg": "paul george",
+    "kawhi": "kawhi leonard",
+    "the claw": "kawhi leonard",
+    "zion": "zion williamson",
+    "ja": "ja morant",
+    "trae": "trae young",
+    "jt": "jayson tatum",
+    "jb": "jaylen brown",
+    "bam": "bam adebayo",
+    "dlo": "dangelo russell",
+    "scoot": "scoot henderson",
+    "chet": "chet holmgren",
+}
\ No newline at end of file
@@ -0,0 +1,232 @@
+import glob
+import os
+import tempfile
+from importlib.util import find_spec
+import numpy as np
+from modules.constants import AVAILABLE_STATS
+from modules.gamelog import GAME_TYPES, GameLog
+
+# The dataset is optional (everything else works from the cache), and pyarrow
+# is only imported on first use so that importing this module stays cheap
+ARROW_AVAILABLE = find_spec("pyarrow") is not None
+pa = pc = ds = None
+
+DATASET_DIR = os.environ.get("NBA_DATASET_DIR", "nba_dataset")
+# Write parsed game logs / rosters through to the dataset and read finished seasons from it
+DATASET_ENABLED = ARROW_AVAILABLE and os.environ.get("NBA_DATASET", "0") == "1"
+
+def _arrow():
+    global pa, pc, ds
+    if pa is None:
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        import pyarrow as pa
+
+def _schemas():
+    _arrow()
+    stats = [(stat, pa.int32()) for stat in AVAILABLE_STATS]
+    return {
+        "game_logs": pa.schema([
+            ("player_id", pa.string()), ("game_date", pa.date32()), ("opponent", pa.string()),
+            ("result", pa.string()), ("game_type", pa.string()), *stats, ("image_url", pa.string()),
+            ("season", pa.int16()), ("team", pa.string()),
+        ]),
+        "rosters": pa.schema([
+            ("player_name", pa.string()), ("player_id", pa.string()), ("logo_url", pa.string()),
+            ("season", pa.int16()), ("team", pa.string()),
+        ]),
+        "schedules": pa.schema([
+            ("date", pa.date32()), ("time", pa.string()), ("away", pa.string()), ("home", pa.string()),
+            ("month", pa.string()), ("season", pa.int16()),
+        ]),
+    }
+
+PARTITIONS = {
+    "game_logs": ["season", "team"],
+    "rosters": ["season", "team"],
+    "schedules": ["season"],
+}
+
+def _partitioning(name):
+    schema = _schemas()[name]
+    return ds.partitioning(pa.schema([schema.field(column) for column in PARTITIONS[name]]), flavor="hive")
+
+def _write(name, table, file_id, base_dir=None):
+    """
+    Write table into its hive partitions as {file_id}-0.parquet. Rewriting the
+    same file_id replaces those files and leaves every other file alone, so
+    appends are incremental and re-ingesting is idempotent.
+
+    The files are written to a hidden temporary directory (ignored by dataset
+    discovery) and then renamed into place, so a concurrent reader sees the
+    old file or the new one, never a half-written one.
+    """
+    root = os.path.join(base_dir or DATASET_DIR, name)
+    os.makedirs(root, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=root, prefix=".tmp-") as staging:
+        ds.write_dataset(
+            table, staging, format="parquet", partitioning=_partitioning(name),
+            basename_template=f"{file_id}-{{i}}.parquet", existing_data_behavior="overwrite_or_ignore",
+        )
+        for directory, _, files in os.walk(staging):
+            target = os.path.join(root, os.path.relpath(directory, staging))
+            for file in files:
+                os.makedirs(target, exist_ok=True)
+                os.replace(os.path.join(directory, file), os.path.join(target, file))
+
+def _dataset(name, base_dir=None):
+    _arrow()
+    path = os.path.join(base_dir or DATASET_DIR, name)
+    if not os.path.isdir(path):
+        return None
+    return ds.dataset(path, format="parquet", partitioning=_partitioning(name), schema=_schemas()[name])
+
+def _read(name, columns=None, base_dir=None, **equals):
+    """
+    Read a table, keeping only the given columns and rows where each keyword
+    column equals the value (or is in the list). Filters on partition
+    columns skip whole directories; the rest use Parquet row-group statistics.
+    """
+    _arrow()
+    dataset = _dataset(name, base_dir)
+    if dataset is None:
+        return None
+    expression = None
+    for column, value in equals.items():
+        if value is None:
+            continue
+        condition = pc.field(column).isin(list(value)) if isinstance(value, (list, tuple, set, range)) else pc.field(column) == value
+        expression = condition if expression is None else expression & condition
+    return dataset.to_table(columns=columns, filter=expression)
+
+# --- Game logs ---
+
+def write_game_log(player_id, season, games, base_dir=None, image_url=None):
+    """
+    Store one player's season (per-game dicts from parse_game_log), split by
+    team, with the headshot from the gamelog page.
+    """
+    _arrow()
+    if not games:
+        return
+    games = sorted(games, key=lambda g: g["game_date"])
+    columns = {
+        "player_id": [player_id] * len(games),
+        "game_date": np.array([g["game_date"] for g in games], dtype="datetime64[D]"),
+        "opponent": [g["opponent"] for g in games],
+        "result": [g.get("result", "") for g in games],
+        "game_type": [g.get("game_type", "regular") for g in games],
+        **{stat: [g.get(stat, 0) for g in games] for stat in AVAILABLE_STATS},
+        "image_url": [image_url] * len(games),
+        "season": [season] * len(games),
+        "team": [g.get("team") or "UNK" for g in games],
+    }
+    _write("game_logs", pa.table(columns, schema=_schemas()["game_logs"]), player_id, base_dir)
+
+def read_game_logs(seasons=None, teams=None, player_ids=None, columns=None, base_dir=None):
+    """Arrow table of game-log rows for any mix of seasons, teams and players."""
+    return _read("game_logs", columns, base_dir, season=seasons, team=teams, player_id=player_ids)
+
+def game_log_from_table(table):
+    """Build a GameLog straight from Arrow columns (no per-game dicts)."""
+    _arrow()
+    table = table.sort_by("game_date")
+    opponents = pc.dictionary_encode(table["opponent"]).combine_chunks()
+    teams = pc.dictionary_encode(table["team"]).combine_chunks()
+    game_types = table["game_type"].to_pylist()
+    seasons = table["season"].to_numpy()
+    return GameLog(
+        dates=table["game_date"].to_numpy().astype("datetime64[D]"),
+        opponent_codes=opponents.indices.to_numpy(zero_copy_only=False).astype(np.int16),
+        opponent_labels=opponents.dictionary.to_pylist(),
+        game_type_codes=np.array([GAME_TYPES.index(game_type) for game_type in game_types], dtype=np.int8),
+        results=np.array(table["result"].to_pylist(), dtype=object),
+        stats={stat: table[stat].to_numpy().astype(np.int32) for stat in AVAILABLE_STATS},
+        team_codes=teams.indices.to_numpy(zero_copy_only=False).astype(np.int16),
+        team_labels=teams.dictionary.to_pylist(),
+        seasons=seasons.astype(np.int16) if len(np.unique(seasons)) > 1 else None,
+    )
+
+def load_game_log(player_id, season, base_dir=None):
+    """
+    GameLog for one player's season from the dataset, or None if it has no
+    rows. Files are named after the player, so only that player's files
+    (one per team played for) are opened.
+    """
+    table = _player_season(player_id, season, base_dir)
+    return game_log_from_table(table) if table is not None and table.num_rows else None
+
+def load_headshot(player_id, season, base_dir=None):
+    """The headshot URL stored with a player's season, or None."""
+    table = _player_season(player_id, season, base_dir, columns=["image_url"])
+    urls = [] if table is None else [url for url in table["image_url"].to_pylist() if url]
+    return urls[0] if urls else None
+
+def _player_season(player_id, season, base_dir=None, columns=None):
+    _arrow()
+    root = os.path.join(base_dir or DATASET_DIR, "game_logs")
+    paths = glob.glob(os.path.join(root, f"season={season}", "team=*", f"{player_id}-*.parquet"))
+    if not paths:
+        return None
+    return ds.dataset(paths, format="parquet", schema=_schemas()["game_logs"],
+                      partitioning=_partitioning("game_logs"), partition_base_dir=root).to_table(columns=columns)
+
+# --- Rosters ---
+
+def write_roster(team_code, season, logo_url, players, base_dir=None):
+    """Store a team's roster ([(name, player_id)] as parse_roster returns)."""
+    _arrow()
+    table = pa.table({
+        "player_name": [name for name, _ in players],
+        "player_id": [player_id for _, player_id in players],
+        "logo_url": [logo_url] * len(players),
+        "season": [season] * len(players),
+        "team": [team_code] * len(players),
+    }, schema=_schemas()["rosters"])
+    _write("rosters", table, "roster", base_dir)
+
+def load_roster(team_code, season, base_dir=None):
+    """{"logo_url", "players": [(name, player_id)]} from the dataset, or None."""
+    table = _read("rosters", ["player_name", "player_id", "logo_url"], base_dir, season=season, team=team_code)
+    if table is None or table.num_rows == 0:
+        return None
+    return {
+        "logo_url": table["logo_url"][0].as_py(),
+        "players": list(zip(table["player_name"].to_pylist(), table["player_id"].to_pylist())),
+    }
+
+# --- Schedules ---
+
+def write_schedule_month(season, month, games, base_dir=None):
+    """Store one schedule month ({"date", "time", "away", "home"} dicts)."""
+    _arrow()
+    table = pa.table({
+        "date": np.array([g["date"] for g in games], dtype="datetime64[D]"),
+        "time": [g["time"] for g in games],
+        "away": [g["away"] for g in games],
+        "home": [g["home"] for g in games],
+        "month": [month] * len(games),
+        "season": [season] * len(games),
+    }, schema=_schemas()["schedules"])
+    _write("schedules", table, month, base_dir)
+
+def read_schedules(seasons=None, columns=None, base_dir=None):
+    return _read("schedules", columns, base_dir, season=seasons)
+
+if __name__ == "__main__":
+    # python -m modules.dataset export SEASON [TEAM_CODE ...] | info
+    import sys
+    command = sys.argv[1] if len(sys.argv) > 1 else "info"
+    if not ARROW_AVAILABLE:
+        sys.exit("pyarrow is required for the dataset")
+    if command == "export" and len(sys.argv) > 2:
+        from modules.fetch import export_season
+        print(export_season(int(sys.argv[2]), sys.argv[3:] or None))
+    elif command == "info":
+        for name in PARTITIONS:
+            table = _read(name, ["season"])
+            counts = [] if table is None else pc.value_counts(table["season"]).to_pylist()
+            print(f"{name:<12}" + ", ".join(f"{c['values']}: {c['counts']} rows" for c in counts))
+    else:
+        sys.exit("usage: python -m modules.dataset export SEASON [TEAM_CODE ...] | info")
+
@@ -1,52 +1,42 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 import time
-from bs4 import BeautifulSoup, Comment
+from modules import dataset
+from modules.batch import BATCH_MAX_WORKERS
 from modules.constants import *
 from modules.utils import *
 from modules.cache import *
 from modules.player import *
-from modules.team import Team
+from modules.parsed_cache import prefetch_rosters
+from modules.schedule import get_season_schedule
+from modules.registry import get_player, get_team
+from modules.team import team_page_url
 from modules.game import Game
+from modules.gamelog_store import load_season_game_log
+from modules.player_index import player_urls
 
 def get_games_for_date(selected_date):
-    """Fetch all games for a given date from Basketball Reference."""
-    month = selected_date.strftime('%B').lower()
-    year = selected_date.year
+    """Return the Games on a date, looked up in the season schedule index."""
     selected_season = get_season_year(selected_date)
-    url = f"https://www.basketball-reference.com/leagues/NBA_{selected_season}_games-{month}.html"
-    response_text = safe_request(url)
-
-    if not response_text:
-        print(f"❌ Failed to retrieve games for {selected_date}")
-        return []
-
-    soup = BeautifulSoup(response_text, 'html.parser')
-    games = soup.find_all('table', {'id': 'schedule'})
+    schedule = get_season_schedule(selected_season)
+    games = schedule.games_on(selected_date)
 
     if not games:
         print(f"⚠️ No games found for {selected_date}.")
         return []
 
-    game_list = []
-    for game in games:
-        for row in game.find_all('tr')[1:]:
-            game_columns = row.find_all('td')
-            if len(game_columns) > 3:
-                game_date_str = row.find('th', {'data-stat': 'date_game'}).text.strip()
-                try:
-                    game_date = datetime.strptime(game_date_str, '%a, %b %d, %Y').date()
-                except ValueError:
-                    continue
-                
-                if game_date == selected_date:
-                    home_team = game_columns[3].find('a').text.strip() if game_columns[3].find('a') else "Unknown"
-                    away_team = game_columns[1].find('a').text.strip() if game_columns[1].find('a') else "Unknown"
-                    game_time = game_columns[0].text.strip() if len(game_columns) > 3 else "Time Not Available"
-
-                    game_list.append(Game(home_team, away_team, game_date, game_time))
-
-    return game_list
+    # Rosters are not fetched here; Game loads them when a game is selected
+    return [Game(game["home"], game["away"], selected_date, game["time"]) for game in games]
+
+def get_next_game(team_name, after_date=None):
+    """Return the team's next game on or after a date as a schedule dict, or None."""
+    after_date = after_date or date.today()
+    return get_season_schedule(get_season_year(after_date)).next_game(team_name, after_date)
+
+def get_games_between(start_date, end_date):
+    """Return every scheduled game between two dates (inclusive) of one season."""
+    return get_season_schedule(get_season_year(start_date)).games_between(start_date, end_date)
 
 def get_all_teams():
     """Return all team names."""
@@ -54,28 +44,61 @@ def get_all_teams():
 
 def get_all_players_in_game(selected_game):
     """Fetch rosters for both teams in a selected game."""
-    home_team = Team(selected_game.home_team.name, selected_game.season)
-    away_team = Team(selected_game.away_team.name, selected_game.season)
-
-    return home_team.roster + away_team.roster
+    return selected_game.get_all_players()
 
 def get_all_active_players(season):
     """Fetch and cache all active NBA players."""
-    cache = load_cache()
-    if "all_players" in cache and (time.time() - cache["all_players"].get("timestamp", 0)) < CACHE_EXPIRY["all_players"]:
+    cached_players = get_cached(str(season), category="all_players")
+    if cached_players is not None:
         print("✅ Using cached all_players list")
-        return [Player(name, team, season) for name, team in cache["all_players"]["data"]]
+        return [get_player(name, team, season, *player_id) for name, team, *player_id in cached_players]
 
     print("🌍 Fetching all active players...")
+    failed = prefetch_rosters([(code, team_page_url(code, season)) for code in TEAM_CODES.values()], season)
+    if failed:
+        print(f"⚠️ {len(failed)} roster pages could not be fetched")
+
     all_players = []
     for team_name in TEAM_CODES:
-        team = Team(team_name, season)
-        all_players.extend(team.roster)
-        time.sleep(7)
-    
-    cache["all_players"] = {
-    "data": [(p.name, p.team_name) for p in all_players],  # ✅ Simple & safe
-    "timestamp": time.time()
-}
-    save_cache(cache)
-    return [Player(name, team, season) for name, team in cache["all_players"]["data"]]
+        all_players.extend(get_team(team_name, season).roster)
+
+    player_data = [(p.name, p.team_name, p.player_id) for p in all_players]  # ✅ Simple & safe
+    set_cached(str(season), player_data, category="all_players")
+    return all_players
+
+def export_season(season, team_codes=None, base_dir=None):
+    """
+    Bulk-ingest a season into the Parquet dataset (modules.dataset): every
+    roster, the game log of every rostered player and the schedule. Pages
+    already cached are not refetched, and re-exporting replaces each
+    player's / team's files rather than duplicating rows.
+    """
+    team_names = [name for name, code in TEAM_CODES.items() if team_codes is None or code in team_codes]
+    prefetch_rosters([(TEAM_CODES[name], team_page_url(TEAM_CODES[name], season)) for name in team_names], season)
+
+    players = {}
+    for team_name in team_names:
+        team = get_team(team_name, season)
+        if team.roster:
+            dataset.write_roster(team.code, season, team.logo_url,
+                                 [(p.name, p.player_id) for p in team.roster], base_dir)
+        players.update((p.player_id, p) for p in team.roster if p.player_id)
+
+    def ingest(player):
+        _, stats_url = player_urls(player.player_id, season)
+        game_log = load_season_game_log(stats_url, player.player_id, season, player.team_name)
+        if not game_log:
+            return 0
+        dataset.write_game_log(player.player_id, season, game_log["games"], base_dir, game_log["image_url"])
+        return len(game_log["games"])
+
+    print(f"📦 Exporting {len(players)} player game logs for {season}...")
+    with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as pool:
+        games = sum(pool.map(ingest, players.values()))
+
+    schedule = get_season_schedule(season)
+    for month, entry in schedule.months.items():
+        dataset.write_schedule_month(season, month, entry["games"], base_dir)
+
+    return {"teams": len(team_names), "players": len(players), "games": games}
+
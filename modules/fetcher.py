@@ -0,0 +1,162 @@
+import re
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from modules.browser_pool import get_browser_pool
+from modules.metrics import span
+from modules.rate_limit import rate_limiter
+
+HTTP_TIMEOUT = 15  # seconds
+HTTP_REPROBE_INTERVAL = 25  # browser fetches before trying plain HTTP again
+# The server says the page does not exist; no other tier will find it either
+NOT_FOUND_STATUSES = {404, 410}
+NOT_FOUND = "not_found"
+HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+}
+
+# (pattern name, URL regex, marker that a complete page must contain)
+URL_PATTERNS = [
+    ("gamelog", re.compile(r"/players/\w/\w+/gamelog/\d{4}"), 'id="player_game_log_reg"'),
+    ("profile", re.compile(r"/players/\w/\w+\.html$"), 'id="meta"'),
+    ("roster", re.compile(r"/teams/\w{3}/\d{4}\.html$"), 'id="roster"'),
+    ("schedule", re.compile(r"/leagues/NBA_\d{4}_games"), 'id="schedule"'),
+]
+
+# Basketball Reference ships some tables inside HTML comments and un-comments
+# them with JavaScript; plain HTTP responses need the same treatment.
+_COMMENTED_TABLE = re.compile(r"<!--(\s*<div[^>]*class=\"table_container[^\"]*\".*?)-->", re.DOTALL)
+
+def uncomment_tables(html):
+    return _COMMENTED_TABLE.sub(r"\1", html)
+
+class PageNotFound(Exception):
+    pass
+
+def is_complete(html, marker):
+    return bool(html and html.strip()) and (not marker or marker in html)
+
+def classify_url(url):
+    """Return (pattern name, expected marker) for a URL."""
+    for name, regex, marker in URL_PATTERNS:
+        if regex.search(url):
+            return name, marker
+    return "other", None
+
+
+class TieredFetcher:
+    """
+    Fetch pages over a pooled requests.Session and fall back to the
+    Playwright pool only when a 200 response is missing the content a
+    complete page of that URL pattern must contain. Other failures (429,
+    5xx, timeouts) are returned to the caller, whose retries back off,
+    rather than sent to the browser. The tier that produced a complete page
+    is remembered per pattern so later fetches go straight to it.
+    """
+
+    def __init__(self, session=None, browser_fetch=None, limiter=rate_limiter):
+        self.session = session or self._make_session()
+        self.browser_fetch = browser_fetch or (lambda url: get_browser_pool().fetch(url))
+        self.limiter = limiter
+        self.preferred_tier = {}
+        self.tier_counts = {}
+        self._browser_streak = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_session():
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(HTTP_HEADERS)
+        return session
+
+    def _throttle(self, url):
+        if self.limiter is not None:
+            with span("fetch.throttle"):
+                self.limiter.acquire(url)
+
+    def _fetch_http(self, url):
+        """The (uncommented) HTML of a 200 response, or None for any other status."""
+        self._throttle(url)
+        with span("fetch.http"):
+            response = self.session.get(url, timeout=HTTP_TIMEOUT)
+        if response.status_code in NOT_FOUND_STATUSES:
+            raise PageNotFound(url)
+        if response.status_code != 200:
+            print(f"⚠️ HTTP {response.status_code} for {url}")
+            return None
+        return uncomment_tables(response.text)
+
+    def _record(self, pattern, tier):
+        with self._lock:
+            self.preferred_tier[pattern] = tier
+            self.tier_counts[(pattern, tier)] = self.tier_counts.get((pattern, tier), 0) + 1
+            if tier == "browser":
+                self._browser_streak[pattern] = self._browser_streak.get(pattern, 0) + 1
+            else:
+                self._browser_streak[pattern] = 0
+
+    def _should_try_http(self, pattern):
+        with self._lock:
+            if self.preferred_tier.get(pattern, "http") == "http":
+                return True
+            return self._browser_streak.get(pattern, 0) % HTTP_REPROBE_INTERVAL == 0
+
+    def fetch(self, url):
+        """
+        Return (html, tier) for url, where tier is "http" or "browser",
+        (None, NOT_FOUND) when the server reports that the page does not
+        exist, or (None, None) when it could not be fetched.
+        """
+        pattern, marker = classify_url(url)
+
+        if self._should_try_http(pattern):
+            try:
+                html = self._fetch_http(url)
+            except PageNotFound:
+                print(f"⚠️ Page not found: {url}")
+                return None, NOT_FOUND
+            except requests.RequestException as e:
+                print(f"⚠️ HTTP fetch failed for {url}: {e}")
+                return None, None
+            if html is None:
+                return None, None
+            if is_complete(html, marker):
+                self._record(pattern, "http")
+                return html, "http"
+
+        self._throttle(url)
+        with span("fetch.browser"):
+            html = self.browser_fetch(url)
+        if not html or not html.strip():
+            return None, None
+        # A page that lacks the marker in the browser too (e.g. a player with no games) says nothing about the tiers
+        if is_complete(html, marker):
+            self._record(pattern, "browser")
+        return html, "browser"
+
+    def stats(self):
+        with self._lock:
+            return {
+                "preferred_tier": dict(self.preferred_tier),
+                "counts": {f"{pattern}:{tier}": n for (pattern, tier), n in self.tier_counts.items()},
+            }
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+def get_fetcher():
+    """Return the process-wide tiered fetcher."""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = TieredFetcher()
+        return _fetcher
@@ -1,16 +1,32 @@
-from modules.team import Team
+from modules.parsed_cache import prefetch_rosters
+from modules.registry import get_team
 from modules.utils import *
 
 class Game:
+    """
+    One scheduled game. Team rosters are not fetched until they are needed;
+    load_rosters() fetches both teams' pages in parallel.
+    """
+
     def __init__(self, home_team_name, away_team_name, game_date, game_time):
         self.game_date = game_date
         self.game_time = game_time
         self.season = get_season_year(self.game_date)
-        self.home_team = Team(home_team_name, self.season)
-        self.away_team = Team(away_team_name, self.season)
+        self.home_team = get_team(home_team_name, self.season)
+        self.away_team = get_team(away_team_name, self.season)
 
     def __str__(self):
         return f"{self.away_team.name} @ {self.home_team.name} on {self.game_date} at {self.game_time}"
 
+    def load_rosters(self):
+        """Fetch both teams' roster pages concurrently, then parse them from the cache."""
+        teams = [team for team in (self.home_team, self.away_team) if team.code and not team.is_loaded]
+        if teams:
+            prefetch_rosters([(team.code, team.url) for team in teams], self.season)
+            for team in teams:
+                team.load()
+        return self
+
     def get_all_players(self):
+        self.load_rosters()
         return self.home_team.roster + self.away_team.roster
@@ -0,0 +1,255 @@
+import numpy as np
+from modules.constants import AVAILABLE_STATS
+
+GAME_TYPES = ["regular", "playoff"]
+
+class GameLog:
+    """
+    Columnar game log: one NumPy array per stat, dates as datetime64[D] and
+    opponents / game types as small integer codes into label lists. Rows are
+    kept sorted by date.
+
+    Iterating or indexing yields the same per-game dicts the parser produces,
+    so code written against a list of games keeps working.
+
+    Multi-season logs (see Player.fetch_career) also carry a season column,
+    so queries over any range of seasons are a vectorized mask.
+
+    Per-stat prefix sums are built once on construction, so the average over
+    any contiguous run of games (last n before a date, a date range) is a
+    binary search on dates plus one subtraction per stat.
+    """
+
+    def __init__(self, dates, opponent_codes, opponent_labels, game_type_codes, results, stats,
+                 team_codes=None, team_labels=None, seasons=None):
+        self.dates = dates
+        self.opponent_codes = opponent_codes
+        self.opponent_labels = opponent_labels
+        self.game_type_codes = game_type_codes
+        self.results = results
+        self.stats = stats
+        self.team_labels = team_labels if team_labels is not None else [""]
+        self.team_codes = team_codes if team_codes is not None else np.zeros(len(dates), dtype=np.int16)
+        self.seasons = seasons  # None for a single-season log
+        self.cumsums = {
+            stat: np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+            for stat, values in stats.items()
+        }
+        self._sorted = {}
+
+    @classmethod
+    def from_records(cls, games):
+        """
+        Build a GameLog from per-game dicts (as returned by parse_game_log).
+        Dicts with a "season" key make a season-tagged log.
+        """
+        games = sorted(games, key=lambda g: g["game_date"])
+        opponent_labels = sorted({g["opponent"] for g in games})
+        opponent_index = {label: i for i, label in enumerate(opponent_labels)}
+        team_labels = sorted({g.get("team", "") for g in games} | {""})
+        team_index = {label: i for i, label in enumerate(team_labels)}
+        tagged = any("season" in g for g in games)
+        return cls(
+            dates=np.array([g["game_date"] for g in games], dtype="datetime64[D]"),
+            opponent_codes=np.array([opponent_index[g["opponent"]] for g in games], dtype=np.int16),
+            opponent_labels=opponent_labels,
+            game_type_codes=np.array([GAME_TYPES.index(g.get("game_type", "regular")) for g in games], dtype=np.int8),
+            results=np.array([g.get("result", "") for g in games], dtype=object),
+            stats={stat: np.array([g.get(stat, 0) for g in games], dtype=np.int32) for stat in AVAILABLE_STATS},
+            team_codes=np.array([team_index[g.get("team", "")] for g in games], dtype=np.int16),
+            team_labels=team_labels,
+            seasons=np.array([g.get("season", 0) for g in games], dtype=np.int16) if tagged else None,
+        )
+
+    @classmethod
+    def concat(cls, logs):
+        """Merge several logs (e.g. seasons or players) into one date-sorted log."""
+        logs = [log for log in logs if log is not None and len(log)]
+        if not logs:
+            return cls.from_records([])
+        return cls.from_records([game for log in logs for game in log])
+
+    # --- Sequence protocol (list-of-dicts compatibility) ---
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __iter__(self):
+        return iter(self.to_records())
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.to_records(np.arange(len(self))[item])
+        return self.to_records([item])[0]
+
+    def __repr__(self):
+        return f"<GameLog: {len(self)} games>"
+
+    # --- Selection ---
+
+    def take(self, indices):
+        """Return a new GameLog holding the rows at indices (or a boolean mask)."""
+        return GameLog(
+            dates=self.dates[indices],
+            opponent_codes=self.opponent_codes[indices],
+            opponent_labels=self.opponent_labels,
+            game_type_codes=self.game_type_codes[indices],
+            results=self.results[indices],
+            stats={stat: values[indices] for stat, values in self.stats.items()},
+            team_codes=self.team_codes[indices],
+            team_labels=self.team_labels,
+            seasons=self.seasons[indices] if self.seasons is not None else None,
+        )
+
+    def opponent_mask(self, opponent_team_code):
+        if opponent_team_code not in self.opponent_labels:
+            return np.zeros(len(self), dtype=bool)
+        return self.opponent_codes == self.opponent_labels.index(opponent_team_code)
+
+    def season_mask(self, seasons):
+        """Rows from any of the given seasons (every row of an untagged log)."""
+        if self.seasons is None:
+            return np.ones(len(self), dtype=bool)
+        return np.isin(self.seasons, np.asarray(list(seasons), dtype=np.int16))
+
+    @property
+    def season_list(self):
+        return [] if self.seasons is None else [int(season) for season in np.unique(self.seasons)]
+
+    def game_type_mask(self, game_type):
+        return self.game_type_codes == GAME_TYPES.index(game_type)
+
+    def end_index(self, selected_date=None):
+        """Number of games played on or before selected_date (all games if None)."""
+        if selected_date is None:
+            return len(self)
+        return int(np.searchsorted(self.dates, np.datetime64(selected_date, "D"), side="right"))
+
+    def start_index(self, start_date=None):
+        """Index of the first game played on or after start_date (0 if None)."""
+        if start_date is None:
+            return 0
+        return int(np.searchsorted(self.dates, np.datetime64(start_date, "D"), side="left"))
+
+    def last_n_range(self, n, selected_date=None):
+        """slice of the last n games on or before selected_date."""
+        end = self.end_index(selected_date)
+        return slice(max(end - n, 0), end)
+
+    def date_range(self, start_date=None, end_date=None):
+        """slice of the games played between start_date and end_date (inclusive)."""
+        start = self.start_index(start_date)
+        return slice(start, max(start, self.end_index(end_date)))
+
+    # --- Conversions and aggregates ---
+
+    def to_records(self, indices=None):
+        """Per-game dicts for the given row indices (all rows if None)."""
+        if indices is None:
+            indices = range(len(self))
+        records = [
+            {
+                "game_date": str(self.dates[i]),
+                "opponent": self.opponent_labels[self.opponent_codes[i]],
+                "result": self.results[i],
+                "team": self.team_labels[self.team_codes[i]],
+                "game_type": GAME_TYPES[self.game_type_codes[i]],
+                **{stat: int(values[i]) for stat, values in self.stats.items()},
+            }
+            for i in indices
+        ]
+        if self.seasons is not None:
+            for record, i in zip(records, indices):
+                record["season"] = int(self.seasons[i])
+        return records
+
+    def range_averages(self, start, end):
+        """Averages over rows start..end-1 in O(1) per stat using the prefix sums."""
+        count = end - start
+        if count <= 0:
+            return {}
+        return {
+            f"avg_{stat}": round(float(cumsum[end] - cumsum[start]) / count, 1)
+            for stat, cumsum in self.cumsums.items()
+        }
+
+    def last_n_averages_by_n(self, max_n=82, selected_date=None):
+        """
+        {n: averages over the last n games before selected_date} for every n in
+        1..max_n, computed in one vectorized pass. Once n exceeds the games
+        played, the window is every game played (same as slicing a list).
+        """
+        end = self.end_index(selected_date)
+        if end == 0:
+            return {n: {} for n in range(1, max_n + 1)}
+        ns = np.arange(1, max_n + 1)
+        starts = np.maximum(end - ns, 0)
+        counts = end - starts
+        means = {stat: (cumsum[end] - cumsum[starts]) / counts for stat, cumsum in self.cumsums.items()}
+        return {
+            int(n): {f"avg_{stat}": round(float(values[i]), 1) for stat, values in means.items()}
+            for i, n in enumerate(ns)
+        }
+
+    def averages(self, indices=None):
+        """{"avg_<stat>": mean rounded to 1 decimal} over the selected rows."""
+        if indices is None:
+            return self.range_averages(0, len(self))
+        if isinstance(indices, slice) and indices.step in (None, 1):
+            start, end, _ = indices.indices(len(self))
+            return self.range_averages(start, end)
+        count = len(self) if indices is None else len(np.arange(len(self))[indices])
+        if not count:
+            return {}
+        return {
+            f"avg_{stat}": round(float((values if indices is None else values[indices]).sum()) / count, 1)
+            for stat, values in self.stats.items()
+        }
+
+    def sorted_values(self, stat, indices=None):
+        """
+        Ascending values of stat over the selected rows: the empirical CDF.
+        The all-games array is built once per stat and reused.
+        """
+        values = self.stats.get(stat)
+        if values is None:
+            values = np.zeros(len(self), dtype=np.int32)
+        if indices is not None:
+            return np.sort(values[indices])
+        if stat not in self._sorted:
+            self._sorted[stat] = np.sort(values)
+        return self._sorted[stat]
+
+    def count_at_least(self, stat, threshold, indices=None):
+        """
+        Number of games where stat >= threshold. threshold may be a scalar or
+        a sequence, in which case an array of counts is returned.
+        """
+        ordered = self.sorted_values(stat, indices)
+        counts = len(ordered) - np.searchsorted(ordered, np.asarray(threshold), side="left")
+        return counts if np.ndim(counts) else int(counts)
+
+    def select(self, game_type=None, opponent=None, last_n=None, selected_date=None, seasons=None):
+        """
+        Row indices for games on or before selected_date, optionally limited to
+        one game type, opponent and/or set of seasons, then to the last n of those.
+        """
+        indices = np.arange(self.end_index(selected_date))
+        mask = np.ones(len(indices), dtype=bool)
+        if game_type is not None:
+            mask &= self.game_type_mask(game_type)[:len(indices)]
+        if opponent is not None:
+            mask &= self.opponent_mask(opponent)[:len(indices)]
+        if seasons is not None:
+            mask &= self.season_mask(seasons)[:len(indices)]
+        indices = indices[mask]
+        if last_n is not None:
+            indices = indices[-last_n:] if last_n > 0 else indices[:0]
+        return indices
+
+    @property
+    def nbytes(self):
+        return (self.dates.nbytes + self.opponent_codes.nbytes + self.game_type_codes.nbytes + self.team_codes.nbytes
+                + (self.seasons.nbytes if self.seasons is not None else 0)
+                + self.results.nbytes + sum(values.nbytes for values in self.stats.values())
+                + sum(cumsum.nbytes for cumsum in self.cumsums.values()))
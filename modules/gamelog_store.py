@@ -0,0 +1,112 @@
+import time
+from datetime import date, timedelta
+from modules import dataset
+from modules.cache import get_cached, set_cached, safe_request
+from modules.parse import parse_game_log, parse_headshot
+from modules.parsed_cache import parsed_key
+from modules.schedule import get_season_schedule, month_is_final
+
+GAMELOG_RETRY_AFTER = 3 * 60 * 60  # seconds between refetches while a played game is missing
+GAMELOG_SETTLE_DAYS = 2  # games this old are assumed to be on the page once fetched
+
+def season_is_final(season, today=None):
+    """A season can no longer change once June (the Finals) is over."""
+    return month_is_final(season, "june", today)
+
+def team_played_between(team_name, season, start, end):
+    """True if the season schedule has a game for team_name from start to end (inclusive)."""
+    if start > end:
+        return False
+    games = get_season_schedule(season).games_between(start, end)
+    return any(team_name in (game["away"], game["home"]) for game in games)
+
+
+class StoredGameLog:
+    """
+    A player's season game log kept in the "game_logs" category (which never
+    expires) together with what we know about its freshness:
+
+        games    per-game dicts, sorted by date
+        through  ISO date up to which the stored games are complete
+        checked  when the page was last fetched
+        final    the season is over; never fetched again
+    """
+
+    def __init__(self, image_url=None, games=None, through=None, checked=0, final=False):
+        self.image_url = image_url
+        self.games = list(games or [])
+        self.through = through
+        self.checked = checked
+        self.final = final
+
+    @property
+    def last_date(self):
+        return self.games[-1]["game_date"] if self.games else None
+
+    def merge(self, games):
+        """Append the games played after the last stored one; returns how many were new."""
+        last_date = self.last_date
+        new_games = [game for game in games if last_date is None or game["game_date"] > last_date]
+        self.games.extend(new_games)
+        return len(new_games)
+
+    def needs_fetch(self, team_name, season, today=None, now=None):
+        """
+        Fetch only if the team has played since the log was last complete
+        (team_name None: the team is unknown, so after every retry window).
+        """
+        if self.final:
+            return False
+        if not self.checked:
+            return True
+        today = today or date.today()
+        if season_is_final(season, today):
+            return True  # One last fetch, then the log is frozen
+        if (now or time.time()) - self.checked < GAMELOG_RETRY_AFTER:
+            return False
+        if team_name is None:
+            return True
+        start = date.fromisoformat(self.through) + timedelta(days=1)
+        return team_played_between(team_name, season, start, today - timedelta(days=1))
+
+    def to_cache(self):
+        return {"image_url": self.image_url, "games": self.games, "through": self.through,
+                "checked": self.checked, "final": self.final}
+
+
+def _key(player_id, season):
+    return parsed_key("gamelog", player_id, season)
+
+def game_log_needs_fetch(player_id, season, team_name, today=None):
+    """True if load_season_game_log would fetch the page (nothing stored, or the log is behind)."""
+    cached = get_cached(_key(player_id, season), category="game_logs")
+    return cached is None or StoredGameLog(**cached).needs_fetch(team_name, season, today or date.today())
+
+def load_season_game_log(url, player_id, season, team_name, today=None):
+    """
+    {"image_url", "games"} for a player's season. The stored log is reused as
+    long as the schedule shows no game for the player's team since it was
+    last complete; otherwise the page is fetched and only the new rows are
+    merged in. Logs of finished seasons are never refetched.
+    """
+    today = today or date.today()
+    cached = get_cached(_key(player_id, season), category="game_logs")
+    log = StoredGameLog(**cached) if cached is not None else StoredGameLog()
+
+    if log.needs_fetch(team_name, season, today):
+        # A cached page younger than the retry window is as good as a refetch
+        html = safe_request(url, category="pages", max_age=GAMELOG_RETRY_AFTER)
+        if not html:
+            return {"image_url": log.image_url, "games": log.games} if log.checked else None
+        added = log.merge(parse_game_log(html))
+        log.image_url = log.image_url or parse_headshot(html)
+        log.checked = time.time()
+        log.final = season_is_final(season, today)
+        settled = (today - timedelta(days=GAMELOG_SETTLE_DAYS)).isoformat()
+        log.through = max(filter(None, [log.through, log.last_date, settled]))
+        if cached is not None:
+            print(f"🔄 {player_id} {season}: {added} new game(s)")
+        set_cached(_key(player_id, season), log.to_cache(), category="game_logs")
+        if dataset.DATASET_ENABLED:
+            dataset.write_game_log(player_id, season, log.games, image_url=log.image_url)
+    return {"image_url": log.image_url, "games": log.games}
@@ -0,0 +1,97 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+class LRUCache:
+    """
+    Bounded in-memory cache of {"data", "timestamp"} entries keyed by
+    (category, key). Evicts least recently used entries once either the
+    entry count or the approximate payload size exceeds its limit.
+    Entries older than their category's expiry are treated as misses.
+    """
+
+    def __init__(self, max_entries=512, max_bytes=64 * 1024 * 1024, expiry=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.expiry = expiry or {}
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _sizeof(data):
+        if isinstance(data, (str, bytes)):
+            return len(data)
+        try:
+            return len(json.dumps(data))
+        except (TypeError, ValueError):
+            return 0
+
+    def get(self, category, key):
+        """Return the entry if present and fresh, else None."""
+        with self._lock:
+            item = self._entries.get((category, key))
+            if item is None:
+                self.misses += 1
+                return None
+            entry, size = item
+            expiry = self.expiry.get(category)
+            if expiry is not None and time.time() - entry["timestamp"] >= expiry:
+                self._remove((category, key))
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end((category, key))
+            self.hits += 1
+            return entry
+
+    def put(self, category, key, data, timestamp=None):
+        size = self._sizeof(data)
+        if size > self.max_bytes:
+            return  # Never let one payload flush the whole tier
+        entry = {"data": data, "timestamp": timestamp if timestamp is not None else time.time()}
+        with self._lock:
+            if (category, key) in self._entries:
+                self._remove((category, key))
+            self._entries[(category, key)] = (entry, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, category, key):
+        with self._lock:
+            if (category, key) in self._entries:
+                self._remove((category, key))
+
+    def clear(self, category=None):
+        with self._lock:
+            if category is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for cache_key in [k for k in self._entries if k[0] == category]:
+                self._remove(cache_key)
+
+    def _remove(self, cache_key):
+        _, size = self._entries.pop(cache_key)
+        self._bytes -= size
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
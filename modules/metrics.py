@@ -0,0 +1,118 @@
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+# Append one JSON line per span to this file (unset: no structured log)
+METRICS_LOG = os.environ.get("NBA_METRICS_LOG")
+# Prometheus text-format file rewritten by write_prometheus() (unset: disabled)
+METRICS_PROM_FILE = os.environ.get("NBA_METRICS_PROM_FILE")
+METRICS_PREFIX = "nba"
+
+_lock = threading.Lock()
+_local = threading.local()
+spans = {}  # name -> {"count", "seconds", "max_seconds"}
+counters = {}  # name -> int
+
+def increment(name, value=1):
+    with _lock:
+        counters[name] = counters.get(name, 0) + value
+
+def record(name, seconds, **labels):
+    """Add one timing to the process totals, the current collection and the log."""
+    with _lock:
+        total = spans.setdefault(name, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+        total["count"] += 1
+        total["seconds"] += seconds
+        total["max_seconds"] = max(total["max_seconds"], seconds)
+    collection = getattr(_local, "collection", None)
+    if collection is not None:
+        entry = collection.setdefault(name, {"count": 0, "seconds": 0.0})
+        entry["count"] += 1
+        entry["seconds"] += seconds
+    if METRICS_LOG:
+        _log({"ts": round(time.time(), 3), "span": name, "ms": round(seconds * 1000, 3), **labels})
+
+@contextmanager
+def span(name, **labels):
+    """Time the enclosed block as one span called name."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start, **labels)
+
+def timed(name):
+    """Decorator form of span()."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+@contextmanager
+def collect():
+    """
+    Gather the spans recorded on this thread (e.g. one Streamlit rerun) into
+    a {name: {"count", "seconds"}} dict. Work done on pool threads is only
+    in the process totals.
+    """
+    previous = getattr(_local, "collection", None)
+    _local.collection = {}
+    try:
+        yield _local.collection
+    finally:
+        _local.collection = previous
+
+def _log(event):
+    line = json.dumps(event) + "\n"
+    with _lock:
+        with open(METRICS_LOG, "a") as f:
+            f.write(line)
+
+def snapshot():
+    with _lock:
+        return {"spans": {name: dict(total) for name, total in spans.items()}, "counters": dict(counters)}
+
+def reset():
+    with _lock:
+        spans.clear()
+        counters.clear()
+
+def _metric_name(name):
+    return f"{METRICS_PREFIX}_" + "".join(c if c.isalnum() else "_" for c in name)
+
+def prometheus_text(gauges=None):
+    """Prometheus text exposition of the counters, span summaries and any extra gauges."""
+    current = snapshot()
+    lines = [
+        f"# TYPE {METRICS_PREFIX}_span_seconds summary",
+        f"# TYPE {METRICS_PREFIX}_span_max_seconds gauge",
+    ]
+    for name, total in sorted(current["spans"].items()):
+        lines.append(f'{METRICS_PREFIX}_span_seconds_sum{{span="{name}"}} {total["seconds"]:.6f}')
+        lines.append(f'{METRICS_PREFIX}_span_seconds_count{{span="{name}"}} {total["count"]}')
+        lines.append(f'{METRICS_PREFIX}_span_max_seconds{{span="{name}"}} {total["max_seconds"]:.6f}')
+    for name, value in sorted(current["counters"].items()):
+        lines.append(f"# TYPE {_metric_name(name)}_total counter")
+        lines.append(f"{_metric_name(name)}_total {value}")
+    for name, value in sorted((gauges or {}).items()):
+        lines.append(f"# TYPE {_metric_name(name)} gauge")
+        lines.append(f"{_metric_name(name)} {value}")
+    return "\n".join(lines) + "\n"
+
+def write_prometheus(path=None, gauges=None):
+    """Atomically rewrite a node-exporter textfile; no-op without a path."""
+    path = path or METRICS_PROM_FILE
+    if not path:
+        return False
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".prom.tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(prometheus_text(gauges))
+    os.replace(temp_path, path)
+    return True
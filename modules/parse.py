@@ -0,0 +1,197 @@
+import re
+from datetime import datetime
+from html import unescape
+import lxml.html
+from modules.constants import AVAILABLE_STATS, GAME_LOG_FIELDS
+from modules.metrics import timed
+from modules.player_index import player_id_from_href
+
+# Bump a parser's version whenever its output changes; cached results from
+# older versions are then ignored (see modules/parsed_cache.py).
+PARSER_VERSIONS = {
+    "gamelog": 2,
+    "schedule": 2,
+    "roster": 1,
+}
+
+# ============================== #
+#   TARGETED TABLE EXTRACTION    #
+# ============================== #
+
+def extract_tables(html, table_id):
+    """
+    Yield the lxml element for every <table id="table_id"> without parsing the
+    rest of the page. The table markup is sliced out of the raw HTML first,
+    which also finds tables Basketball Reference ships inside HTML comments.
+    Other elements carrying the same id are skipped.
+    """
+    attribute = f'id="{table_id}"'
+    marker = html.find(attribute)
+    while marker != -1:
+        start = html.rfind("<table", 0, marker)
+        end = html.find("</table>", marker)
+        if end == -1:
+            return
+        if start != -1 and ">" not in html[start:marker]:
+            yield lxml.html.fragment_fromstring(html[start:end + len("</table>")])
+        marker = html.find(attribute, marker + len(attribute))
+
+def extract_table(html, table_id):
+    """The first <table id="table_id"> in the page (see extract_tables), or None."""
+    return next(extract_tables(html, table_id), None)
+
+def iter_rows(table):
+    """Yield {data-stat: cell text} for each body row of a table."""
+    for row in table.iterfind(".//tbody/tr"):
+        if "thead" in (row.get("class") or ""):
+            continue
+        yield {cell.get("data-stat"): cell.text_content().strip() for cell in row}
+
+def _first(cells, fields):
+    for field in fields:
+        value = cells.get(field)
+        if value is not None:
+            return value
+    return None
+
+def _to_number(value):
+    try:
+        return int(value) if value.isdigit() else float(value or 0)
+    except ValueError:
+        return 0
+
+# ============================== #
+#          PAGE PARSERS          #
+# ============================== #
+
+GAME_LOG_TABLES = [("player_game_log_reg", "regular"), ("player_game_log_post", "playoff")]
+
+def parse_game_log_table(table, game_type):
+    """Parse one gamelog table into per-game stat dicts (DNP/inactive rows skipped)."""
+    stats_list = []
+    for cells in iter_rows(table):
+        game_date = _first(cells, GAME_LOG_FIELDS["game_date"])
+        if not game_date or game_date.lower() == "totals":
+            continue
+        if _first(cells, AVAILABLE_STATS["points"]) is None:
+            continue  # Inactive / Did Not Play rows carry a single "reason" cell
+
+        stat_row = {
+            "game_date": game_date,
+            "opponent": _first(cells, GAME_LOG_FIELDS["opponent"]) or "",
+            "result": _first(cells, GAME_LOG_FIELDS["result"]) or "",
+            "team": _first(cells, GAME_LOG_FIELDS["team"]) or "",
+            "game_type": game_type
+        }
+
+        for stat, fields in AVAILABLE_STATS.items():
+            if fields is None:
+                continue  # Derived below
+            stat_row[stat] = _to_number(_first(cells, fields) or "")
+
+        # Combo stats
+        stat_row["points_rebounds"] = stat_row["points"] + stat_row["rebounds"]
+        stat_row["points_assists"] = stat_row["points"] + stat_row["assists"]
+        stat_row["rebounds_assists"] = stat_row["rebounds"] + stat_row["assists"]
+        stat_row["points_rebounds_assists"] = stat_row["points"] + stat_row["rebounds"] + stat_row["assists"]
+
+        stats_list.append(stat_row)
+
+    return stats_list
+
+@timed("parse.game_log")
+def parse_game_log(html):
+    """Parse the regular season and playoff tables of a gamelog page, sorted by date."""
+    stats = []
+    for table_id, game_type in GAME_LOG_TABLES:
+        table = extract_table(html, table_id)
+        if table is not None:
+            stats.extend(parse_game_log_table(table, game_type))
+    stats.sort(key=lambda x: x["game_date"])
+    return stats
+
+@timed("parse.schedule")
+def parse_schedule(html):
+    """
+    Parse a month schedule page into a list of
+    {"date": "YYYY-MM-DD", "time", "away", "home"} dicts. Every schedule
+    table on the page is read (a game listed twice counts once); rows without
+    a date or both teams, such as postponed or TBD games, are skipped.
+    """
+    tables = list(extract_tables(html, "schedule"))
+    if not tables:
+        return None
+
+    games = []
+    seen = set()
+    rows = (row for table in tables for row in table.iterfind(".//tbody/tr"))
+    for row in rows:
+        cells = {cell.get("data-stat"): cell for cell in row}
+        date_cell = cells.get("date_game")
+        if date_cell is None or "home_team_name" not in cells or "visitor_team_name" not in cells:
+            continue
+        csk = date_cell.get("csk") or ""
+        if csk[:8].isdigit():
+            game_date = f"{csk[:4]}-{csk[4:6]}-{csk[6:8]}"
+        else:
+            try:
+                game_date = datetime.strptime(date_cell.text_content().strip(), "%a, %b %d, %Y").date().isoformat()
+            except ValueError:
+                continue
+        time_cell = cells.get("game_start_time")
+        game = {
+            "date": game_date,
+            "time": time_cell.text_content().strip() if time_cell is not None else "Time Not Available",
+            "away": cells["visitor_team_name"].text_content().strip() or "Unknown",
+            "home": cells["home_team_name"].text_content().strip() or "Unknown",
+        }
+        if (game["date"], game["away"], game["home"]) not in seen:
+            seen.add((game["date"], game["away"], game["home"]))
+            games.append(game)
+    return games
+
+_SCHEDULE_MONTH_LINK = re.compile(r"/leagues/NBA_(\d{4})_games-([a-z]+)\.html")
+
+def parse_schedule_months(html, season):
+    """Month slugs ("october", "november", ...) linked from a season schedule page, in order."""
+    months = [month for link_season, month in _SCHEDULE_MONTH_LINK.findall(html) if int(link_season) == season]
+    return list(dict.fromkeys(months))
+
+@timed("parse.roster")
+def parse_roster(html):
+    """Parse a team page into (logo_url, [(display name, player_id), ...])."""
+    table = extract_table(html, "roster")
+    players = None
+    if table is not None:
+        players = []
+        for cell in table.iterfind(".//tbody/tr/td[@data-stat='player']"):
+            links = cell.findall("a")
+            player_id = player_id_from_href(links[0].get("href")) if links else None
+            players.append((cell.text_content().strip(), player_id))
+    return parse_headshot(html), players
+
+_GAMELOG_SEASON_LINK = re.compile(r"/players/\w/(\w+)/gamelog/(\d{4})")
+
+def parse_gamelog_seasons(html, player_id):
+    """Seasons with a gamelog page linked from a player's profile, ascending."""
+    return sorted({int(season) for link_id, season in _GAMELOG_SEASON_LINK.findall(html) if link_id == player_id})
+
+_MEDIA_IMG = re.compile(r'<div class="media-item[^"]*">\s*<img[^>]*?src="([^"]+)"')
+_H1_SPAN = re.compile(r"<h1[^>]*>\s*<span[^>]*>([^<]+)</span>")
+_META_TEAM = re.compile(r"<strong>\s*Team\s*</strong>[^<]*<a[^>]*>([^<]+)</a>")
+
+def parse_headshot(html):
+    """Return the image in the page's #meta media-item (player headshot or team logo)."""
+    match = _MEDIA_IMG.search(html)
+    return match.group(1) if match else None
+
+@timed("parse.profile")
+def parse_profile(html):
+    """Return (display name, current team, headshot url) from a player profile page."""
+    name = _H1_SPAN.search(html)
+    team = _META_TEAM.search(html)
+    return (
+        unescape(name.group(1)).strip() if name else None,
+        unescape(team.group(1)).strip() if team else None,
+        parse_headshot(html),
+    )
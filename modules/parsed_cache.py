@@ -0,0 +1,88 @@
+from modules.batch import fetch_many
+from modules.cache import add_refresh_listener, get_cached, set_cached, safe_request
+from modules.memory_cache import LRUCache
+from modules.parse import PARSER_VERSIONS, parse_roster
+
+# Parsed artifacts live in their own categories so a warm hit skips HTML
+# parsing. Game logs and season schedules have their own stores
+# (modules/gamelog_store.py, modules/schedule.py) that use parsed_key too.
+PARSED_CATEGORIES = {
+    "roster": "parsed_rosters",
+}
+
+def parsed_key(kind, *parts):
+    """Cache key for a parsed artifact. The parser version is part of the key,
+    so bumping PARSER_VERSIONS[kind] makes every older entry unreachable."""
+    return "|".join([f"v{PARSER_VERSIONS[kind]}", *map(str, parts)])
+
+def _parse_roster_page(html):
+    logo_url, players = parse_roster(html)
+    if players is None:
+        return None
+    return {"logo_url": logo_url, "players": players}
+
+_PARSERS = {
+    "roster": (_parse_roster_page, "rosters"),
+}
+
+# (category, url) -> (kind, key_parts) of the artifacts parsed from it, so a
+# page that was served stale and refreshed in the background is re-parsed
+# too. Bounded: a forgotten page is simply parsed again on its next miss.
+PAGE_SOURCES_MAX_ENTRIES = 4096
+_page_sources = LRUCache(PAGE_SOURCES_MAX_ENTRIES)
+
+def _reparse_refreshed_page(url, category, html):
+    source = _page_sources.get(category, url)
+    if source is not None:
+        kind, key_parts = source["data"]
+        store_parsed(kind, html, *key_parts)
+
+add_refresh_listener(_reparse_refreshed_page)
+
+def load_parsed(kind, url, *key_parts):
+    """
+    Return the parsed artifact for url, from the parsed cache if possible.
+    On a miss the page is fetched (raw HTML is cached only if CACHE_RAW_HTML
+    is enabled), parsed and stored.
+    """
+    key = parsed_key(kind, *key_parts)
+    parsed = get_cached(key, category=PARSED_CATEGORIES[kind])
+    if parsed is not None:
+        return parsed
+
+    parser, source_category = _PARSERS[kind]
+    html = safe_request(url, category=source_category)
+    if not html:
+        return None
+    _page_sources.put(source_category, url, (kind, key_parts))
+    return store_parsed(kind, html, *key_parts)
+
+def store_parsed(kind, html, *key_parts):
+    """Parse html and store the result; returns the parsed artifact (or None)."""
+    parser, _ = _PARSERS[kind]
+    parsed = parser(html)
+    if parsed is not None:
+        set_cached(parsed_key(kind, *key_parts), parsed, category=PARSED_CATEGORIES[kind])
+    return parsed
+
+def load_roster(url, team_code, season):
+    """{"logo_url", "players": [(name, player_id)]} for a team page."""
+    return load_parsed("roster", url, team_code, season)
+
+def prefetch_rosters(teams, season):
+    """
+    Fetch and parse the roster pages for (team_code, url) pairs that are not
+    in the parsed cache yet, concurrently. Returns the URLs that failed.
+    """
+    missing = {
+        url: code for code, url in teams
+        if get_cached(parsed_key("roster", code, season), category=PARSED_CATEGORIES["roster"]) is None
+    }
+    failed = []
+    for url, html in fetch_many(list(missing), category="rosters"):
+        if html:
+            _page_sources.put("rosters", url, ("roster", (missing[url], season)))
+            store_parsed("roster", html, missing[url], season)
+        else:
+            failed.append(url)
+    return failed
@@ -1,27 +1,76 @@
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
-from modules.cache import safe_request
+from modules.batch import BATCH_MAX_WORKERS
+from modules.cache import safe_request, was_not_found
+from modules.parse import parse_gamelog_seasons, parse_profile
+from modules import dataset
+from modules.gamelog_store import load_season_game_log, season_is_final
+from modules.gamelog import GameLog
+from modules.metrics import timed
+from modules.player_index import lookup_player_id, record_player_id, record_missing_player, player_urls
 from modules.utils import normalize_player_name, format_display_name
 from modules.constants import *
 import time
 
+CAREER = "career"
+# A loaded season log is re-checked against the game_logs store this often
+# (also how long the registry hands out the same Player)
+STATS_EXPIRY = 12 * 60 * 60
+
 class Player:
-    def __init__(self, name, team, season):
+    def __init__(self, name, team, season, player_id=None):
         self.name = name
         self.team_name = team
         self.team_code = TEAM_CODES.get(self.team_name)
         self.season = season
         self.normalized_name = normalize_player_name(name)
+        self.player_id = player_id
         self.profile_url = None
         self.stats_url = None
         self.image_url = None
         self.stats = None
+        self._stats_loaded = 0  # when self.stats was last (re)loaded
+        self.career = None  # season-tagged GameLog, see fetch_career()
+        self._career_seasons = set()
         self._urls_resolved = False  # ✅ Flag to track if URLs were resolved
 
+    def _set_player_id(self, player_id):
+        self.player_id = player_id
+        self.profile_url, self.stats_url = player_urls(player_id, self.season)
+        self._urls_resolved = True
+
     def _resolve_urls(self):
         if self._urls_resolved:
             return True
 
+        # Roster pages record exact ids, so most players never need probing
+        if self.player_id:
+            self._set_player_id(self.player_id)
+            return True
+
+        indexed = lookup_player_id(self.normalized_name, self.team_code, self.season)
+        if indexed is not None:
+            if indexed["player_id"] is None:
+                return False
+            self._set_player_id(indexed["player_id"])
+            return True
+
+        found = self._probe_urls()
+        if found:
+            record_player_id(self.normalized_name, self.team_code, self.season, self.player_id)
+            return True
+
+        # A probe that failed to fetch may have been the player; only a clean miss is remembered
+        if found is False:
+            record_missing_player(self.normalized_name, self.team_code, self.season)
+        return False
+
+    def _probe_urls(self):
+        """
+        Fallback: guess ids ({last5}{first2}01..08) and check each profile page.
+        True if one matched, False if every page was fetched (or does not exist)
+        and none matched, None if some could not be fetched.
+        """
         BASE_URL = "https://www.basketball-reference.com/players/{}/{}"
         name_parts = self.normalized_name.split()
         last_name = name_parts[-1].lower()
@@ -30,6 +79,7 @@ class Player:
         first_two_first = first_name[:2]
         first_letter = last_name[0]
 
+        unreachable = False
         for i in range(1, 9):  # Try 01 to 08
             player_id = f"{first_five_last}{first_two_first}{str(i).zfill(2)}"
             profile_url = BASE_URL.format(first_letter, f"{player_id}.html")
@@ -37,39 +87,27 @@ class Player:
             response = safe_request(profile_url)
 
             if not response:
+                unreachable = unreachable or not was_not_found(profile_url)
                 continue
 
-            soup = BeautifulSoup(response, "html.parser")
-
-            h1_tag = soup.find("h1")
-            if not h1_tag or not h1_tag.find("span"):
+            fetched_name, fetched_team, image_url = parse_profile(response)
+            if not fetched_name:
                 continue
 
-            fetched_name = h1_tag.find("span").text.strip()
             if normalize_player_name(format_display_name(fetched_name)) != self.normalized_name:
-                time(7)
                 continue
 
-            team_element = None
-            for strong_tag in soup.select("#meta strong"):
-                if "Team" in strong_tag.text:
-                    team_element = strong_tag.find_next("a")
-                    break
-            fetched_team = team_element.text.strip() if team_element else None
-
             if fetched_team != self.team_name:
                 continue
 
+            self.player_id = player_id
             self.profile_url = profile_url
             self.stats_url = stats_url
-
-            media_item = soup.find("div", class_="media-item")
-            img_tag = media_item.find("img") if media_item else None
-            self.image_url = img_tag["src"] if img_tag else None
+            self.image_url = image_url
             self._urls_resolved = True  # ✅ Mark as resolved
             return True
 
-        return False
+        return None if unreachable else False
 
     def __str__(self):
         return f"{self.name}"
@@ -77,8 +115,9 @@ class Player:
     def __repr__(self):
         return self.__str__()
 
+    @timed("player.fetch_stats")
     def fetch_stats(self):
-        if self.stats:
+        if self.stats and time.time() - self._stats_loaded < STATS_EXPIRY:
             return self.stats
 
         if not self._urls_resolved and not self._resolve_urls():
@@ -89,103 +128,118 @@ class Player:
             print(f"⚠️ No stats URL found for {self.name}")
             return None
 
-        response = safe_request(self.stats_url)
-        if not response:
-            print(f"❌ Failed to fetch stats page: {self.stats_url}")
-            return None
-
-        soup = BeautifulSoup(response, "html.parser")
-        stats = []
-        for table_id, game_type in [("player_game_log_reg", "regular"), ("player_game_log_post", "playoff")]:
-            table = soup.find("table", {"id": table_id})
-            if table:
-                stats.extend(self._parse_stats_table(table, game_type))
-
-        stats.sort(key=lambda x: x["game_date"])
-        self.stats = stats
-        return stats
+        if dataset.DATASET_ENABLED and season_is_final(self.season):
+            # Finished seasons never change, so the columnar copy is authoritative
+            stats = dataset.load_game_log(self.player_id, self.season)
+            if stats:
+                self.stats, self._stats_loaded = stats, time.time()
+                self.image_url = self.image_url or dataset.load_headshot(self.player_id, self.season)
+                return self.stats
 
-    def _parse_stats_table(self, table, game_type):
-        rows = table.find_all("tr")[1:]
-        stats_list = []
-
-        for row in rows:
-            cols = row.find_all("td")
-            if len(cols) < 27:
-                continue
-
-            game_date = cols[2].get_text().strip()
-            if not game_date or game_date.lower() in ["totals", ""]:
-                continue
-
-            stat_row = {
-                "game_date": game_date,
-                "opponent": cols[5].get_text(),
-                "result": cols[6].get_text(),
-                "game_type": game_type
-            }
-
-            for stat, idx in AVAILABLE_STATS.items():
-                if idx is None:
-                    continue  # Skip stats without a valid index
-                try:
-                    value = cols[idx].get_text()
-                    stat_row[stat] = int(value) if value.isdigit() else float(value or 0)
-                except (ValueError, IndexError):
-                    stat_row[stat] = 0
-
-            # Combo stats
-            stat_row["points_rebounds"] = stat_row["points"] + stat_row["rebounds"]
-            stat_row["points_assists"] = stat_row["points"] + stat_row["assists"]
-            stat_row["rebounds_assists"] = stat_row["rebounds"] + stat_row["assists"]
-            stat_row["points_rebounds_assists"] = stat_row["points"] + stat_row["rebounds"] + stat_row["assists"]
-
-            stats_list.append(stat_row)
-
-        return stats_list
-
-    def _calculate_average_stats(self, games):
-        """Return a dict of average stats across provided games."""
-        if not games:
-            return {}
-
-        totals = {stat: 0 for stat in AVAILABLE_STATS}
-        for game in games:
-            for stat in AVAILABLE_STATS:
-                totals[stat] += game.get(stat, 0)
+        game_log = load_season_game_log(self.stats_url, self.player_id, self.season, self.team_name)
+        if not game_log:
+            print(f"❌ Failed to fetch stats page: {self.stats_url}")
+            return self.stats  # A failed re-check keeps the log already loaded
+
+        if not self.image_url:
+            # Gamelog pages carry the same headshot as the profile page
+            self.image_url = game_log["image_url"]
+
+        self.stats = GameLog.from_records(game_log["games"])
+        self._stats_loaded = time.time()
+        return self.stats
+
+    def career_seasons(self):
+        """Seasons with a gamelog page, read from the profile page (just this season if unavailable)."""
+        html = safe_request(self.profile_url) if self.profile_url else None
+        seasons = parse_gamelog_seasons(html, self.player_id) if html else []
+        return seasons or [self.season]
+
+    def _load_season(self, season):
+        _, stats_url = player_urls(self.player_id, season)
+        # The roster team says nothing about other seasons; without one the log refetches on the retry window
+        team_name = self.team_name if season == self.season else None
+        game_log = load_season_game_log(stats_url, self.player_id, season, team_name)
+        if not game_log:
+            print(f"⚠️ No {season} game log for {self.name}")
+            return []
+        return [{**game, "season": season} for game in game_log["games"]]
 
-        averages = {f"avg_{stat}": round(val / len(games), 1) for stat, val in totals.items()}
-        return averages
+    @timed("player.fetch_career")
+    def fetch_career(self, seasons=CAREER):
+        """
+        Season-tagged GameLog over several seasons (CAREER: every season on the
+        profile page). Seasons not loaded yet are fetched concurrently; finished
+        seasons come from the permanent game_logs cache.
+        """
+        if not self._urls_resolved and not self._resolve_urls():
+            print(f"⚠️ Could not resolve URLs for {self.name}")
+            return None
 
+        seasons = self.career_seasons() if seasons == CAREER else sorted(set(seasons))
+        missing = [season for season in seasons if season not in self._career_seasons]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(missing))) as pool:
+                games = [game for season_games in pool.map(self._load_season, missing) for game in season_games]
+            loaded = self.career.to_records() if self.career is not None else []
+            self.career = GameLog.from_records(loaded + games)
+            self._career_seasons.update(missing)
+        return self.career
+
+    def _season_log(self, seasons):
+        """(log, seasons filter) for the current season (None) or a season range."""
+        if seasons is None:
+            return self.stats, None
+        return self.fetch_career(seasons), (None if seasons == CAREER else list(seasons))
+
+    @timed("player.career_averages")
+    def get_career_averages(self, seasons=CAREER):
+        """Averages over several seasons (any iterable of season years, or CAREER)."""
+        log, season_filter = self._season_log(seasons)
+        return log.averages(log.select(seasons=season_filter)) if log else {}
+
+    @timed("player.season_averages")
     def get_season_averages(self):
         """Return full-season averages (all games)."""
-        return self._calculate_average_stats(self.stats)
+        return self.stats.averages() if self.stats else {}
 
+    @timed("player.last_n_games")
     def get_last_n_games(self, n=5, selected_date=None):
         """Returns the last n games before a specified date (inclusive)."""
         if not self.stats:
             print("⚠️ No stats loaded. Call fetch_stats() first.")
             return []
 
-        if selected_date:
-            filtered_games = [g for g in self.stats if datetime.strptime(g["game_date"], "%Y-%m-%d").date() <= selected_date]
-        else:
-            filtered_games = self.stats[:]
-
-        last_n_games = filtered_games[-n:]  # Last n games before date
-        avg_over_last_n_games = self._calculate_average_stats(last_n_games)
+        last_n = self.stats.last_n_range(n, selected_date)  # Last n games before date
+        return self.stats[last_n], self.stats.averages(last_n)
 
-        return last_n_games, avg_over_last_n_games
+    @timed("player.last_n_averages_by_n")
+    def get_last_n_averages_by_n(self, max_n=82, selected_date=None):
+        """Averages for every window size 1..max_n at once (for the "n Games" slider)."""
+        if not self.stats:
+            return {}
+        return self.stats.last_n_averages_by_n(max_n, selected_date)
 
-    def get_stats_against_opponent(self, opponent_team_code):
-        """Return games and averages against a specific opponent."""
-        #if not self.stats:
-         #   return [], {}
+    @timed("player.games_between")
+    def get_games_between(self, start_date=None, end_date=None):
+        """Return games and averages between two dates (inclusive)."""
+        if not self.stats:
+            return [], {}
+        games = self.stats.date_range(start_date, end_date)
+        return self.stats[games], self.stats.averages(games)
 
-        games_vs_opponent = [g for g in self.stats if g["opponent"] == opponent_team_code]
-        avg_vs_opponent = self._calculate_average_stats(games_vs_opponent)
+    @timed("player.against_opponent")
+    def get_stats_against_opponent(self, opponent_team_code, seasons=None):
+        """
+        Return games and averages against a specific opponent, this season or
+        across seasons (an iterable of season years, or CAREER).
+        """
+        log, season_filter = self._season_log(seasons)
+        if not log:
+            return [], {}
 
-        return games_vs_opponent, avg_vs_opponent
+        indices = log.select(opponent=opponent_team_code, seasons=season_filter)
+        return log.to_records(indices), log.averages(indices)
 
     def count_exceeding_threshold(self, stat, threshold):
         """
@@ -195,11 +249,7 @@ class Player:
         if not self.stats:
             return (0, 0, 0, 0.0, 0.0)
 
-        count_exceeded = 0
-        for game in self.stats:
-            if game.get(stat, 0) >= threshold:
-                count_exceeded += 1
-
+        count_exceeded = self.stats.count_at_least(stat, threshold)
         total_games = len(self.stats)
         count_not_exceeded = total_games - count_exceeded
         pct_exceeded = (count_exceeded / total_games) * 100 if total_games else 0
@@ -207,3 +257,37 @@ class Player:
 
         return (count_exceeded, count_not_exceeded, total_games, pct_exceeded, pct_not_exceeded)
 
+    @timed("player.threshold_table")
+    def threshold_table(self, thresholds, game_type=None, opponent=None, last_n=None, selected_date=None,
+                        seasons=None):
+        """
+        Hit rates for many lines at once. thresholds maps stat -> one threshold
+        or a list of them (e.g. {"points": [18.5, 20.5, ..., 32.5]}). Optional
+        filters: game_type ("regular"/"playoff"), opponent team code, last_n
+        games before selected_date, and seasons (iterable of season years, or
+        CAREER) to look beyond the current season.
+        Returns a DataFrame shaped like the app's "Threshold Stats" table.
+        """
+        import pandas as pd  # only the table needs pandas; headless loading never imports it
+
+        columns = ["Stat", "Threshold", "Total Games", "Exceeded", "% Exceeded", "Not Exceeded", "% Not Exceeded"]
+        log, season_filter = self._season_log(seasons)
+        if not log:
+            return pd.DataFrame(columns=columns)
+
+        unfiltered = (game_type is None and opponent is None and last_n is None and selected_date is None
+                      and season_filter is None)
+        indices = None if unfiltered else log.select(game_type, opponent, last_n, selected_date, season_filter)
+        total_games = len(log) if indices is None else len(indices)
+
+        rows = []
+        for stat, stat_thresholds in thresholds.items():
+            stat_thresholds = [stat_thresholds] if pd.api.types.is_scalar(stat_thresholds) else list(stat_thresholds)
+            counts = log.count_at_least(stat, stat_thresholds, indices)
+            for threshold, count_exceeded in zip(stat_thresholds, counts):
+                pct_exceeded = count_exceeded / total_games * 100 if total_games else 0
+                rows.append([
+                    STAT_NAME_MAPPING.get(stat, stat), threshold, total_games, int(count_exceeded),
+                    f"{pct_exceeded:.2f}%", total_games - int(count_exceeded), f"{100 - pct_exceeded:.2f}%"
+                ])
+        return pd.DataFrame(rows, columns=columns)
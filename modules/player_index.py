@@ -0,0 +1,49 @@
+import re
+from modules.cache import get_cached, set_cached
+
+PLAYER_URL = "https://www.basketball-reference.com/players/{}/{}"
+_PLAYER_HREF = re.compile(r"/players/(\w)/(\w+)\.html")
+
+def player_id_from_href(href):
+    """Extract the Basketball Reference id from a player link, e.g. /players/j/jamesle01.html."""
+    match = _PLAYER_HREF.search(href or "")
+    return match.group(2) if match else None
+
+def player_urls(player_id, season):
+    """Return (profile_url, gamelog_url) for a player id."""
+    letter = player_id[0]
+    return (
+        PLAYER_URL.format(letter, f"{player_id}.html"),
+        PLAYER_URL.format(letter, f"{player_id}/gamelog/{season}"),
+    )
+
+def _index_key(normalized_name, team_code, season):
+    return f"{normalized_name}|{team_code}|{season}"
+
+def lookup_player_id(normalized_name, team_code, season):
+    """
+    Return the indexed entry for a player, or None if the index has no answer.
+    Entries for players known not to resolve have player_id set to None.
+    """
+    key = _index_key(normalized_name, team_code, season)
+    entry = get_cached(key, category="player_ids")
+    if entry is not None:
+        return entry
+    if get_cached(key, category="player_ids_missing") is not None:
+        return {"player_id": None}
+    return None
+
+def record_player_id(normalized_name, team_code, season, player_id):
+    """Store a resolved player id (no-op if the index already has it)."""
+    key = _index_key(normalized_name, team_code, season)
+    existing = get_cached(key, category="player_ids")
+    if existing and existing["player_id"] == player_id:
+        return
+    profile_url, stats_url = player_urls(player_id, season)
+    set_cached(key, {"player_id": player_id, "profile_url": profile_url, "stats_url": stats_url},
+               category="player_ids")
+
+def record_missing_player(normalized_name, team_code, season):
+    """Remember that probing failed so the next lookup does not probe again."""
+    set_cached(_index_key(normalized_name, team_code, season), {"player_id": None},
+               category="player_ids_missing")
@@ -0,0 +1,93 @@
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+# Basketball Reference blocks clients that exceed ~20 requests per minute
+HOST_RATE_LIMITS = {
+    "www.basketball-reference.com": (18 / 60, 3),  # (tokens per second, burst)
+}
+DEFAULT_HOST_RATE_LIMIT = (1.0, 5)
+GLOBAL_RATE_LIMIT = (float(os.environ.get("NBA_GLOBAL_RATE", 0.5)), 5)
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self):
+        """Take a token if one is available; return the seconds to wait otherwise."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available."""
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                return
+            self._sleep(wait)
+
+
+class RateLimiter:
+    """
+    Per-host token buckets plus one global politeness budget shared by every
+    host. A request must get a token from both before it goes out.
+    """
+
+    def __init__(self, host_limits=None, default_limit=DEFAULT_HOST_RATE_LIMIT, global_limit=GLOBAL_RATE_LIMIT):
+        self.host_limits = host_limits if host_limits is not None else HOST_RATE_LIMITS
+        self.default_limit = default_limit
+        self.global_bucket = TokenBucket(*global_limit) if global_limit else None
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def bucket_for(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(*self.host_limits.get(host, self.default_limit))
+            return self._buckets[host]
+
+    def share(self, parts):
+        """
+        Cut every budget to 1/parts, for one of parts processes fetching at
+        once: together they stay within the limits one process would keep.
+        """
+        def part(limit):
+            rate, capacity = limit
+            return rate / parts, max(1, capacity // parts)
+
+        with self._lock:
+            self.host_limits = {host: part(limit) for host, limit in self.host_limits.items()}
+            self.default_limit = part(self.default_limit)
+            self._buckets.clear()
+        if self.global_bucket:
+            self.global_bucket = TokenBucket(*part((self.global_bucket.rate, self.global_bucket.capacity)))
+
+    def acquire(self, url):
+        start = time.monotonic()
+        self.bucket_for(url).acquire()
+        if self.global_bucket:
+            self.global_bucket.acquire()
+        self.waited += time.monotonic() - start
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,91 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from modules.player import STATS_EXPIRY, Player
+from modules.utils import normalize_player_name
+
+# A Player with a loaded season log is ~10-20 KB, a Team a few hundred bytes
+# plus its (interned) roster, so the defaults stay well under 50 MB.
+REGISTRY_MAX_PLAYERS = int(os.environ.get("NBA_REGISTRY_PLAYERS", 2000))
+REGISTRY_MAX_TEAMS = int(os.environ.get("NBA_REGISTRY_TEAMS", 240))
+
+# Seconds an interned object is handed out before a fresh one replaces it.
+# A Team only holds its roster's names (see Team.roster), so it can outlive
+# the Players, which re-check their game logs on the same schedule.
+REGISTRY_EXPIRY = {
+    "players": STATS_EXPIRY,
+    "teams": 7 * 24 * 60 * 60,  # 7 days
+}
+
+
+class ObjectRegistry:
+    """
+    Process-wide intern table for Player and Team objects, keyed by
+    (name or team code, season). Handing out the same instance everywhere
+    means resolved URLs, image URLs and loaded game logs are shared by every
+    Streamlit rerun and session instead of being rebuilt.
+
+    Each kind is a bounded LRU; entries older than REGISTRY_EXPIRY are
+    replaced by a fresh object on their next lookup.
+    """
+
+    def __init__(self, max_entries=None, expiry=None):
+        self.max_entries = max_entries or {"players": REGISTRY_MAX_PLAYERS, "teams": REGISTRY_MAX_TEAMS}
+        self.expiry = expiry or REGISTRY_EXPIRY
+        self._entries = {kind: OrderedDict() for kind in self.max_entries}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def intern(self, kind, key, factory):
+        """Return the live object for key, building it with factory() if needed."""
+        entries = self._entries[kind]
+        with self._lock:
+            item = entries.get(key)
+            if item is not None and time.time() - item[1] < self.expiry[kind]:
+                entries.move_to_end(key)
+                self.hits += 1
+                return item[0]
+            self.misses += 1
+            obj = factory()
+            entries[key] = (obj, time.time())
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries[kind]:
+                entries.popitem(last=False)
+                self.evictions += 1
+            return obj
+
+    def clear(self):
+        with self._lock:
+            for entries in self._entries.values():
+                entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                **{kind: len(entries) for kind, entries in self._entries.items()},
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_registry = ObjectRegistry()
+
+def get_registry():
+    return _registry
+
+def get_player(name, team, season, player_id=None):
+    """The shared Player for (name, team, season)."""
+    key = (normalize_player_name(name), team, season)
+    player = _registry.intern("players", key, lambda: Player(name, team, season, player_id))
+    if player_id and not player.player_id:
+        player.player_id = player_id
+    return player
+
+def get_team(name, season):
+    """The shared Team for (name, season)."""
+    from modules.team import Team  # team.py imports this module for its roster
+    return _registry.intern("teams", (name, season), lambda: Team(name, season))
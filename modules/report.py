@@ -0,0 +1,193 @@
+"""
+Headless slate reports: the app's "Generate Report" sections (last n games,
+season averages, stats against the opponent, threshold analysis) for every
+player in every game on a date.
+
+    python -m modules.report 2025-04-13 --last-n 10 --threshold points=20.5,25.5 --format parquet
+
+Pages are fetched in this process, through the rate-limited fetcher and into
+the shared cache; parsing and the per-player numbers are spread over a pool
+of worker processes that read the same cache.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date
+from multiprocessing import get_context
+
+from modules.batch import BATCH_MAX_WORKERS
+from modules.constants import AVAILABLE_STATS
+from modules.fetch import get_games_for_date
+from modules.gamelog_store import game_log_needs_fetch, load_season_game_log
+from modules.metrics import span
+from modules.player import CAREER
+from modules.player_index import player_urls
+from modules.rate_limit import rate_limiter
+from modules.registry import get_player
+
+REPORT_DIR = os.environ.get("NBA_REPORT_DIR", "reports")
+REPORT_WORKERS = int(os.environ.get("NBA_REPORT_WORKERS", os.cpu_count() or 1))
+REPORT_CHUNKSIZE = 4
+REPORT_FORMATS = ("csv", "parquet")
+SECTIONS = ("last_n", "averages", "vs_opponent", "thresholds")
+# Head-to-head history, as in the app's selectbox
+HISTORY = {
+    "season": lambda season: None,
+    "last3": lambda season: range(season - 2, season + 1),
+    "career": lambda season: CAREER,
+}
+
+def slate_jobs(selected_date, team_codes=None):
+    """One job dict per rostered player in the date's games (optionally only some teams')."""
+    jobs = []
+    for game in get_games_for_date(selected_date):
+        teams = (game.home_team, game.away_team)
+        if team_codes and not any(team.code in team_codes for team in teams):
+            continue
+        for player in game.get_all_players():
+            opponent = game.away_team if player.team_name == game.home_team.name else game.home_team
+            jobs.append({
+                "name": player.name, "team": player.team_name, "season": game.season,
+                "player_id": player.player_id, "opponent": opponent.code, "game": str(game),
+            })
+    return jobs
+
+def prefetch_game_logs(jobs):
+    """
+    Bring the game_logs store up to date for every job, concurrently, before
+    the workers start; returns the URLs that failed. The parent runs the same
+    load_season_game_log as the workers, so they find the stored logs current
+    and fetch nothing (whether or not raw HTML is cached).
+    """
+    logs = {
+        player_urls(job["player_id"], job["season"])[1]: (job["player_id"], job["season"], job["team"])
+        for job in jobs
+        if job["player_id"] and game_log_needs_fetch(job["player_id"], job["season"], job["team"])
+    }
+    if not logs:
+        return []
+    print(f"🌍 Prefetching {len(logs)} game logs...")
+    with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as pool:
+        loaded = pool.map(lambda url: load_season_game_log(url, *logs[url]), logs)
+        return [url for url, game_log in zip(logs, loaded) if not game_log]
+
+def player_report(job, selected_date, last_n=5, thresholds=None, history="season"):
+    """{section: [row dicts]} for one job from slate_jobs (every section empty if there are no stats)."""
+    sections = {section: [] for section in SECTIONS}
+    player = get_player(job["name"], job["team"], job["season"], job["player_id"])
+    if not player.fetch_stats():
+        return sections
+
+    # Game rows carry their own "team" and "opponent", so the slate's are prefixed
+    who = {"player": player.name, "player_id": player.player_id, "slate_team": player.team_code,
+           "slate_opponent": job["opponent"], "slate_game": job["game"]}
+
+    def averages(window, avg):
+        if avg:
+            sections["averages"].append({**who, "window": window,
+                                         **{stat.replace("avg_", ""): value for stat, value in avg.items()}})
+
+    games, avg_n = player.get_last_n_games(last_n, selected_date)
+    sections["last_n"] = [{**who, **game} for game in games]
+    averages(f"last_{last_n}", avg_n)
+    averages("season", player.get_season_averages())
+
+    games, avg = player.get_stats_against_opponent(job["opponent"], seasons=HISTORY[history](job["season"]))
+    sections["vs_opponent"] = [{**who, **game} for game in games]
+    averages(f"vs_{job['opponent']}", avg)
+
+    if thresholds:
+        table = player.threshold_table(thresholds)
+        sections["thresholds"] = [{**who, **row} for row in table.to_dict("records")]
+    return sections
+
+def _run_job(args):
+    return player_report(*args)
+
+def _init_worker(workers):
+    # Each worker fetches whatever the parent could not, within its share of the rate limits
+    rate_limiter.share(workers)
+
+def slate_report(selected_date, last_n=5, thresholds=None, history="season", team_codes=None,
+                 workers=REPORT_WORKERS):
+    """
+    {section: DataFrame} for every player on the date's slate. workers <= 1
+    runs in this process; otherwise players are spread over a pool of
+    spawned worker processes (each opens its own cache connection).
+    """
+    with span("report.slate"):
+        jobs = slate_jobs(selected_date, team_codes)
+        failed = prefetch_game_logs(jobs)
+        if failed:
+            print(f"⚠️ {len(failed)} game logs could not be fetched")
+
+        print(f"📋 Building reports for {len(jobs)} players...")
+        args = [(job, selected_date, last_n, thresholds, history) for job in jobs]
+        if workers <= 1 or len(jobs) <= 1:
+            results = list(map(_run_job, args))
+        else:
+            workers = min(workers, len(jobs))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"),
+                                     initializer=_init_worker, initargs=(workers,)) as pool:
+                results = list(pool.map(_run_job, args, chunksize=REPORT_CHUNKSIZE))
+
+    import pandas as pd  # frames are built here; workers only need it for threshold tables
+
+    missing = sum(1 for result in results if not any(result.values()))
+    if missing:
+        print(f"⚠️ No stats for {missing} of {len(jobs)} players")
+    return {section: pd.DataFrame([row for result in results for row in result[section]]) for section in SECTIONS}
+
+def write_report(frames, selected_date, output_dir=REPORT_DIR, fmt="csv"):
+    """Write one file per non-empty section as slate_<date>_<section>.<fmt>; returns the paths."""
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unknown report format: {fmt}")
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for section, frame in frames.items():
+        if frame.empty:
+            continue
+        path = os.path.join(output_dir, f"slate_{selected_date.isoformat()}_{section}.{fmt}")
+        if fmt == "csv":
+            frame.to_csv(path, index=False)
+        else:
+            frame.to_parquet(path, index=False)
+        paths.append(path)
+    return paths
+
+def parse_thresholds(values):
+    """["points=20.5,25.5", "assists=6.5"] -> {"points": [20.5, 25.5], "assists": [6.5]}"""
+    thresholds = {}
+    for value in values or []:
+        stat, _, lines = value.partition("=")
+        thresholds.setdefault(stat.strip(), []).extend(float(line) for line in lines.split(",") if line)
+    return thresholds
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report on every player in a day's games.")
+    parser.add_argument("date", type=date.fromisoformat, help="slate date, YYYY-MM-DD")
+    parser.add_argument("--last-n", type=int, default=5)
+    parser.add_argument("--threshold", action="append", metavar="STAT=LINE[,LINE...]",
+                        help="threshold lines for one stat (repeatable)")
+    parser.add_argument("--history", choices=list(HISTORY), default="season",
+                        help="games counted in the head-to-head section")
+    parser.add_argument("--teams", nargs="*", help="only games involving these team codes")
+    parser.add_argument("--workers", type=int, default=REPORT_WORKERS)
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="csv")
+    parser.add_argument("--output", default=REPORT_DIR, help="output directory")
+    args = parser.parse_args(argv)
+    thresholds = parse_thresholds(args.threshold)
+    unknown = sorted(set(thresholds) - set(AVAILABLE_STATS))
+    if unknown:
+        parser.error(f"unknown stats: {', '.join(unknown)} (choose from {', '.join(AVAILABLE_STATS)})")
+
+    frames = slate_report(args.date, args.last_n, thresholds, args.history,
+                          args.teams, args.workers)
+    paths = write_report(frames, args.date, args.output, args.format)
+    for path in paths:
+        print(f"✅ Wrote {path}")
+    return 0 if paths else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import calendar
+import time
+from bisect import bisect_left, bisect_right
+from datetime import date
+from modules.batch import fetch_many
+from modules.cache import CACHE_EXPIRY, get_cached, set_cached, safe_request
+from modules.parse import parse_schedule, parse_schedule_months
+from modules.parsed_cache import parsed_key
+from modules.single_flight import SingleFlight
+
+SEASON_SCHEDULE_URL = "https://www.basketball-reference.com/leagues/NBA_{}_games.html"
+MONTH_SCHEDULE_URL = "https://www.basketball-reference.com/leagues/NBA_{}_games-{}.html"
+DEFAULT_MONTHS = ["october", "november", "december", "january", "february", "march", "april", "may", "june"]
+SCHEDULE_RETRY_AFTER = 10 * 60  # seconds before retrying a month that failed to load
+MONTH_NUMBERS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+
+def month_is_final(season, month, today=None):
+    """A month's schedule can no longer change once its last day is in the past."""
+    today = today or date.today()
+    number = MONTH_NUMBERS[month]
+    year = season - 1 if number >= 10 else season
+    return date(year, number, calendar.monthrange(year, number)[1]) < today
+
+
+class SeasonSchedule:
+    """
+    Every game of a season keyed by ISO date: {"2025-04-13": [[time, away, home], ...]}.
+    Built from all of the season's month pages; months that are over are
+    never fetched again, the rest are refreshed when older than the
+    "pages" expiry.
+    """
+
+    def __init__(self, season, months=None):
+        self.season = season
+        # month -> {"games": [...], "fetched": timestamp, "final": bool}
+        self.months = months or {}
+        self._index()
+
+    def _index(self):
+        # Built aside and swapped in, so concurrent queries see the old or the new index
+        by_date = {}
+        for entry in list(self.months.values()):
+            for game in entry["games"]:
+                by_date.setdefault(game["date"], []).append([game["time"], game["away"], game["home"]])
+        self.by_date, self.dates = by_date, sorted(by_date)
+
+    def stale_months(self, now=None):
+        now = now or time.time()
+        return [
+            month for month, entry in list(self.months.items())
+            if not entry["final"] and now - entry["fetched"] >= CACHE_EXPIRY["pages"]
+        ]
+
+    def refresh(self, months):
+        """Fetch the given month pages concurrently and rebuild the date index."""
+        urls = {MONTH_SCHEDULE_URL.format(self.season, month): month for month in months}
+        # A refresh must not be answered with the stale page it is replacing
+        for url, html in fetch_many(list(urls), category="pages", max_age=CACHE_EXPIRY["pages"]):
+            games = parse_schedule(html) if html else None
+            if games is None:
+                print(f"⚠️ Could not load {urls[url]} schedule for {self.season}")
+                previous = self.months.get(urls[url], {"games": [], "final": False})
+                # Keep what we had and retry after SCHEDULE_RETRY_AFTER rather than every call
+                previous["fetched"] = time.time() - CACHE_EXPIRY["pages"] + SCHEDULE_RETRY_AFTER
+                self.months[urls[url]] = previous
+                continue
+            self.months[urls[url]] = {
+                "games": games,
+                "fetched": time.time(),
+                "final": month_is_final(self.season, urls[url]),
+            }
+        self._index()
+
+    # --- Queries ---
+
+    @staticmethod
+    def _as_game(day, game):
+        game_time, away, home = game
+        return {"date": day, "time": game_time, "away": away, "home": home}
+
+    def games_on(self, day):
+        """All games on a date, as {"date", "time", "away", "home"} dicts."""
+        iso = day.isoformat()
+        return [self._as_game(iso, game) for game in self.by_date.get(iso, [])]
+
+    def games_between(self, start, end):
+        """All games from start to end (inclusive), in date order."""
+        lo = bisect_left(self.dates, start.isoformat())
+        hi = bisect_right(self.dates, end.isoformat())
+        return [self._as_game(day, game) for day in self.dates[lo:hi] for game in self.by_date[day]]
+
+    def next_game(self, team_name, after=None, inclusive=True):
+        """The team's first game on (or, if not inclusive, after) a date, or None."""
+        after = (after or date.today()).isoformat()
+        start = bisect_left(self.dates, after) if inclusive else bisect_right(self.dates, after)
+        for day in self.dates[start:]:
+            for game in self.by_date[day]:
+                if team_name in (game[1], game[2]):
+                    return self._as_game(day, game)
+        return None
+
+    def to_cache(self):
+        return {"months": self.months}
+
+
+_schedules = {}
+# Loads and refreshes are coalesced per season; no lock is held across fetches,
+# so one cold season never blocks lookups of another
+_schedule_flight = SingleFlight()
+
+def _schedule_key(season):
+    return parsed_key("schedule", "season", season)
+
+def _load_season_schedule(season):
+    schedule = _schedules.get(season)
+    if schedule is not None:
+        return schedule
+    cached = get_cached(_schedule_key(season), category="season_schedules")
+    if cached is not None:
+        schedule = SeasonSchedule(season, cached["months"])
+    else:
+        print(f"🌍 Building {season} season schedule...")
+        index_html = safe_request(SEASON_SCHEDULE_URL.format(season))
+        months = (parse_schedule_months(index_html, season) if index_html else None) or DEFAULT_MONTHS
+        schedule = SeasonSchedule(season)
+        schedule.refresh(months)
+        set_cached(_schedule_key(season), schedule.to_cache(), category="season_schedules")
+    _schedules[season] = schedule
+    return schedule
+
+def _refresh_stale_months(schedule):
+    stale = schedule.stale_months()
+    if stale:
+        print(f"🔄 Refreshing {schedule.season} schedule months: {', '.join(stale)}")
+        schedule.refresh(stale)
+        set_cached(_schedule_key(schedule.season), schedule.to_cache(), category="season_schedules")
+
+def get_season_schedule(season):
+    """
+    Return the SeasonSchedule for a season: from memory, then the cache, and
+    only then by fetching every month page. Months that can still change are
+    refreshed in place.
+    """
+    schedule = _schedules.get(season)
+    if schedule is None:
+        schedule = _schedule_flight.do(("load", season), lambda: _load_season_schedule(season))
+    if schedule.stale_months():
+        _schedule_flight.do(("refresh", season), lambda: _refresh_stale_months(schedule))
+    return schedule
@@ -0,0 +1,106 @@
+import re
+import threading
+from modules.constants import NICKNAMES
+from modules.utils import normalize_player_name
+
+_NON_ALNUM = re.compile(r"[^a-z0-9 ]+")
+PREFIX_LENGTH = 2
+MAX_CANDIDATES = 40
+# Just below a token-prefix match (90+): "ant" still lists every "Ant..." player first
+NICKNAME_SCORE = 89
+
+def search_key(name):
+    """normalize_player_name plus punctuation folding: "D'Angelo Russell" -> "dangelo russell"."""
+    normalized = normalize_player_name(name.replace("-", " ")) if name.strip() else ""
+    return " ".join(_NON_ALNUM.sub("", normalized).split())
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerSearchIndex:
+    """
+    Name-search index over a fixed player list. Names are normalized once;
+    candidates are pruned through trigram and token-prefix buckets, and only
+    those are scored (trigram Dice similarity, with bonuses for exact and
+    token-prefix matches). A query that is exactly a nickname in NICKNAMES
+    also finds its player, ranked below real name-prefix matches.
+    """
+
+    def __init__(self, players, name_of=str):
+        self.players = list(players)
+        self.keys = [search_key(name_of(player)) for player in self.players]
+        self.grams = [trigrams(key) for key in self.keys]
+        self.tokens = [key.split() for key in self.keys]
+        self.by_gram = {}
+        self.by_prefix = {}
+        self.by_key = {}
+        for i, key in enumerate(self.keys):
+            self.by_key.setdefault(key, []).append(i)
+            for gram in self.grams[i]:
+                self.by_gram.setdefault(gram, []).append(i)
+            for token in self.tokens[i]:
+                self.by_prefix.setdefault(token[:PREFIX_LENGTH], []).append(i)
+
+    def _candidates(self, query, query_grams):
+        hits = {}
+        for gram in query_grams:
+            for i in self.by_gram.get(gram, ()):
+                hits[i] = hits.get(i, 0) + 1
+        for token in query.split():
+            for i in self.by_prefix.get(token[:PREFIX_LENGTH], ()):
+                hits[i] = hits.get(i, 0) + 1
+        return sorted(hits, key=hits.get, reverse=True)[:MAX_CANDIDATES]
+
+    def _score(self, i, query, query_grams, query_tokens):
+        key = self.keys[i]
+        if key == query:
+            return 100
+        grams = self.grams[i]
+        score = 200 * len(query_grams & grams) / (len(query_grams) + len(grams))
+        # Every query token starts a different name token ("lebr jam", "curry")
+        remaining = list(self.tokens[i])
+        for token in query_tokens:
+            match = next((t for t in remaining if t.startswith(token)), None)
+            if match is None:
+                return round(score)
+            remaining.remove(match)
+        return round(max(score, 90 + 9 * len(query) / len(key)))
+
+    def search(self, query, k=5):
+        """Return up to k (player, score) pairs, best first. Scores are 0-100."""
+        query = search_key(query)
+        if not query:
+            return []
+
+        query_grams = trigrams(query)
+        query_tokens = query.split()
+        scores = {
+            i: self._score(i, query, query_grams, query_tokens)
+            for i in self._candidates(query, query_grams)
+        }
+        for i in self.by_key.get(NICKNAMES.get(query), ()):
+            scores[i] = max(scores.get(i, 0), NICKNAME_SCORE)
+        scored = [(score, i) for i, score in scores.items()]
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+        return [(self.players[i], score) for score, i in scored[:k]]
+
+    def best_match(self, query):
+        matches = self.search(query, k=1)
+        return matches[0][0] if matches else None
+
+
+_index = None
+_index_key = None
+_index_lock = threading.Lock()
+
+def get_search_index(players):
+    """Return an index over players, rebuilding it only when the list changes."""
+    global _index, _index_key
+    key = tuple(str(player) + "|" + str(getattr(player, "team_name", "")) for player in players)
+    with _index_lock:
+        if _index is None or key != _index_key:
+            _index = PlayerSearchIndex(players)
+            _index_key = key
+        return _index
@@ -1,52 +1,95 @@
 # modules/team.py
 
-from bs4 import BeautifulSoup
+import threading
 from modules.constants import TEAM_CODES
-from modules.cache import safe_request
 from modules.utils import *
-from modules.player import Player
+from modules.registry import get_player
+from modules import dataset
+from modules.gamelog_store import season_is_final
+from modules.parsed_cache import load_roster
+from modules.player_index import record_player_id
+
+TEAM_PAGE_URL = "https://www.basketball-reference.com/teams/{}/{}.html"
+
+def team_page_url(code, season):
+    return TEAM_PAGE_URL.format(code, season)
 
 class Team:
+    """
+    A team in one season. The roster page is fetched on first access to
+    `roster` or `logo_url`, so building a Team (e.g. for every game in a
+    slate) costs nothing until its roster is actually needed. The Team keeps
+    only (name, player_id) pairs; `roster` looks the Players up in the
+    registry on every access, so they expire on the players' schedule.
+    """
+
     def __init__(self, name, season):
         self.name = name
         self.season = season
         self.code = TEAM_CODES.get(name)
-        self.logo_url = None
-        self.roster = []
+        self._logo_url = None
+        self._players = []
+        self._loaded = False
+        self._load_lock = threading.Lock()
 
-        if self.code:
-            self._fetch_team_page()
-        else:
+        if not self.code:
             print(f"❌ Team code for {name} not found.")
 
+    @property
+    def url(self):
+        return team_page_url(self.code, self.season) if self.code else None
+
+    @property
+    def is_loaded(self):
+        return self._loaded
+
+    def load(self):
+        """
+        Fetch and parse the team page if that has not happened yet. A failed
+        fetch leaves the Team unloaded, so the next access tries again.
+        """
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self._loaded = not self.code or self._fetch_team_page()
+        return self
+
+    @property
+    def roster(self):
+        return [get_player(name, self.name, self.season, player_id) for name, player_id in self.load()._players]
+
+    @property
+    def logo_url(self):
+        return self.load()._logo_url
+
     def _fetch_team_page(self):
-        url = f"https://www.basketball-reference.com/teams/{self.code}/{self.season}.html"
-        response_text = safe_request(url, category="rosters")
+        url = team_page_url(self.code, self.season)
+        use_dataset = dataset.DATASET_ENABLED and season_is_final(self.season)
+        roster_page = dataset.load_roster(self.code, self.season) if use_dataset else None
+        if roster_page is None:
+            roster_page = load_roster(url, self.code, self.season)
+            if roster_page and roster_page["players"] is not None and dataset.DATASET_ENABLED:
+                dataset.write_roster(self.code, self.season, roster_page["logo_url"], roster_page["players"])
 
-        if not response_text:
+        if not roster_page:
             print(f"❌ Failed to fetch page for {self.name}")
-            return
-
-        soup = BeautifulSoup(response_text, "html.parser")
-
-        # Extract logo
-        media_item = soup.find("div", class_="media-item")
-        img_tag = media_item.find("img") if media_item else None
-        self.logo_url = img_tag["src"] if img_tag else None
-
-        # Extract roster
-        roster_table = soup.find("table", {"class": "sortable stats_table now_sortable"})
-        if roster_table:
-            self.roster = [
-                Player(format_display_name(row.find("td", {"data-stat": "player"}).get_text(strip=True)), self.name, self.season)
-                for row in roster_table.find_all("tr")[1:]
-                if row.find("td", {"data-stat": "player"})
-            ]
+            return False
+
+        self._logo_url = roster_page["logo_url"]
+        players = roster_page["players"]
+
+        if players is not None:
+            self._players = [(format_display_name(name), player_id) for name, player_id in players]
+            for name, player_id in self._players:
+                if player_id:
+                    record_player_id(normalize_player_name(name), self.code, self.season, player_id)
         else:
             print(f"⚠️ No roster found for {self.name}")
+        return True
 
     def get_player_names(self):
         return self.roster
 
     def __repr__(self):
-        return f"<Team: {self.name}, Players: {len(self.roster)}>"
+        players = len(self._players) if self._loaded else "not loaded"
+        return f"<Team: {self.name}, Players: {players}>"
@@ -0,0 +1,51 @@
+"""Streamlit rendering helpers for app.py; the data and fetch modules never import this."""
+import streamlit as st
+import pandas as pd
+
+from modules.constants import STAT_NAME_MAPPING
+from modules.metrics import snapshot, timed
+
+def rename_stats_for_display(df):
+    """
+    Renames the columns of the DataFrame using the STAT_NAME_MAPPING dictionary.
+    """
+    return df.rename(columns=STAT_NAME_MAPPING)
+
+def highlight_thresholds(row, thresholds):
+    return [
+        'color: green; font-weight: bold' if stat in thresholds and row[stat] >= thresholds[stat]
+        else 'color: red' if stat in thresholds else ''
+        for stat in row.index
+    ]
+
+@timed("render.table")
+def render_table(df, title="", thresholds=None):
+    st.write(title)
+    df = rename_stats_for_display(df)
+    df = df[[col for col in ["Game Date", "Opponent", "Result"] if col in df.columns] + [col for col in df.columns if col not in ["Game Date", "Opponent", "Result"]]]
+    df.index += 1
+    if thresholds:
+        styled_df = df.style.apply(highlight_thresholds, thresholds=thresholds, axis=1)
+        st.dataframe(styled_df)
+    else:
+        st.dataframe(df)
+
+def render_diagnostics(rerun_spans, rerun_seconds, cache_stats=None):
+    """Sidebar breakdown of this rerun's spans (they nest, so shares overlap) and cache hit rates."""
+    st.sidebar.subheader("⏱️ Diagnostics")
+    st.sidebar.write(f"Rerun: {rerun_seconds * 1000:.0f} ms")
+    if rerun_spans:
+        rows = [
+            {"Span": name, "Calls": entry["count"], "ms": round(entry["seconds"] * 1000, 1),
+             "% of rerun": round(entry["seconds"] / rerun_seconds * 100, 1) if rerun_seconds else 0.0}
+            for name, entry in sorted(rerun_spans.items(), key=lambda item: -item[1]["seconds"])
+        ]
+        st.sidebar.dataframe(pd.DataFrame(rows), hide_index=True)
+
+    counters = snapshot()["counters"]
+    lookups = counters.get("cache.hit", 0) + counters.get("cache.stale_hit", 0) + counters.get("cache.miss", 0)
+    if lookups:
+        st.sidebar.write(f"Cache hit rate: {(lookups - counters.get('cache.miss', 0)) / lookups:.0%} of {lookups} lookups")
+    for label, stats in (cache_stats or {}).items():
+        st.sidebar.write(f"{label}: {stats}")
+
@@ -1,10 +1,7 @@
 import html
 import unidecode
 import re
-import streamlit as st
-import pandas as pd
 from datetime import datetime, date
-from fuzzywuzzy import process
 
 
 from modules.constants import *
@@ -55,34 +52,21 @@ def extract_player_details(selected_player, selected_team=None):
   
 def fuzzy_match_player(player_name, all_players):
     """
-    Perform fuzzy matching to find the best player match.
+    Find the best player match for a typed name.
 
     Args:
         player_name (str): The name entered by the user.
-        all_players (list): A list of (player_name, team_name) tuples.
+        all_players (list): The active Player objects to search.
 
     Returns:
-        tuple: (Best matched player name, team name), or (None, None) if no match.
+        Player: The best match, or None if nothing resembles the query.
     """
-    #print(type(all_players))  # Check if it's a list
-    #print(type(all_players[0]))  # Check if first element is a tuple or list
-    #print(all_players[:5])  # Print first 5 elements to inspect structure
+    from modules.search import get_search_index  # search builds on normalize_player_name
 
-    #player_dict = {p[0]: p for p in all_players}  # Map player_name -> (player_name, team_name)
-
-    best_match = process.extractOne(player_name, all_players)
+    best_match = get_search_index(all_players).best_match(player_name)
     print(f"best match is {best_match}")
+    return best_match
 
-    if best_match:
-        return best_match[0]  # Correctly returns (player_name, team_name)
-
-    return None, None
-def rename_stats_for_display(df):
-    """
-    Renames the columns of the DataFrame using the STAT_NAME_MAPPING dictionary.
-    """
-    return df.rename(columns=STAT_NAME_MAPPING)
-    
 def filter_stat_columns(stats_list, selected_stats, is_average=False):
     """
     Filter a list of stat dictionaries to include only selected stats.
@@ -103,21 +87,3 @@ def filter_stat_columns(stats_list, selected_stats, is_average=False):
         }
         for game in stats_list
     ]
-
-def highlight_thresholds(row, thresholds):
-    return [
-        'color: green; font-weight: bold' if stat in thresholds and row[stat] >= thresholds[stat]
-        else 'color: red' if stat in thresholds else ''
-        for stat in row.index
-    ]
-
-def render_table(df, title="", thresholds=None):
-    st.write(title)
-    df = rename_stats_for_display(df)
-    df = df[[col for col in ["Game Date", "Opponent", "Result"] if col in df.columns] + [col for col in df.columns if col not in ["Game Date", "Opponent", "Result"]]]
-    df.index += 1
-    if thresholds:
-        styled_df = df.style.apply(highlight_thresholds, thresholds=thresholds, axis=1)
-        st.dataframe(styled_df)
-    else:
-        st.dataframe(df)
@@ -0,0 +1,17 @@
+import pytest
+
+from modules import cache, registry
+from modules.cache_store import SQLiteCacheStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point the cache layer at a fresh SQLite store for the test."""
+    store = SQLiteCacheStore(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(cache, "_store", store)
+    cache.memory_cache.clear()
+    registry.get_registry().clear()
+    yield store
+    registry.get_registry().clear()
+    cache.memory_cache.clear()
+    store.close()
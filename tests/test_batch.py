@@ -0,0 +1,65 @@
+from modules import batch
+from modules.rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_throttles():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0.5, capacity=2, clock=clock, sleep=clock.sleep)
+    bucket.acquire()
+    bucket.acquire()
+    assert clock.now == 0.0
+    bucket.acquire()
+    assert clock.now == 2.0
+
+
+def test_fetch_many_yields_cached_and_retries_failures(monkeypatch):
+    cached = {"u1": "<html>1</html>"}
+    attempts = {}
+
+    def fake_safe_request(url, category="pages", max_age=None):
+        attempts[url] = attempts.get(url, 0) + 1
+        return "<html>2</html>" if url == "u2" and attempts[url] > 1 else None
+
+    monkeypatch.setattr(batch, "get_cached", lambda url, category: cached.get(url))
+    monkeypatch.setattr(batch, "safe_request", fake_safe_request)
+    monkeypatch.setattr(batch.time, "sleep", lambda seconds: None)
+
+    results = dict(batch.fetch_many(["u1", "u2", "u3", "u1"], max_workers=2))
+
+    assert results == {"u1": "<html>1</html>", "u2": "<html>2</html>", "u3": None}
+    assert attempts == {"u2": 2, "u3": batch.BATCH_RETRIES + 1}
+
+
+def test_fetch_many_with_max_age_revalidates_through_safe_request(monkeypatch):
+    requests = []
+
+    def fake_safe_request(url, category="pages", max_age=None):
+        requests.append((url, max_age))
+        return "<html>fresh</html>"
+
+    monkeypatch.setattr(batch, "get_cached", lambda url, category: "<html>stale</html>")
+    monkeypatch.setattr(batch, "safe_request", fake_safe_request)
+
+    assert dict(batch.fetch_many(["u1"], max_age=60)) == {"u1": "<html>fresh</html>"}
+    assert requests == [("u1", 60)]
+
+
+def test_fetch_with_retries_gives_up_on_missing_pages(monkeypatch):
+    attempts = []
+    monkeypatch.setattr(batch, "safe_request", lambda url, category="pages", max_age=None: attempts.append(url))
+    monkeypatch.setattr(batch, "was_not_found", lambda url: url.endswith("june.html"))
+    monkeypatch.setattr(batch.time, "sleep", lambda seconds: None)
+
+    assert batch.fetch_with_retries("NBA_2025_games-june.html") is None
+    assert attempts == ["NBA_2025_games-june.html"]
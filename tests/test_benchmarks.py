@@ -0,0 +1,24 @@
+from benchmarks import suite
+
+
+def test_suite_runs_offline_and_reports_json_ready_results():
+    report = suite.run(["parse_roster", "games_for_date_cold", "cache_miss_fetch_store"], repeat=1)
+    assert set(report["results"]) == {"parse_roster", "games_for_date_cold", "cache_miss_fetch_store"}
+    for result in report["results"].values():
+        assert result["median_ms"] > 0
+        assert {"min_ms", "max_ms", "runs", "number", "budget_ms"} <= set(result)
+
+
+def test_compare_flags_budget_and_baseline_regressions():
+    report = {"results": {
+        "fast": {"median_ms": 1.0, "budget_ms": 5},
+        "slower": {"median_ms": 2.0, "budget_ms": 5},
+        "over_budget": {"median_ms": 9.0, "budget_ms": 5},
+    }}
+    baseline = {"results": {"fast": {"median_ms": 0.9}, "slower": {"median_ms": 1.0}}}
+    regressions = suite.compare(report, baseline, tolerance=0.3)
+    assert [(r["name"], r["reason"]) for r in regressions] == [("slower", "baseline"), ("over_budget", "budget")]
+
+
+def test_core_modules_import_without_the_ui_stack():
+    assert suite.import_core() == []
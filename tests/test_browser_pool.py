@@ -0,0 +1,81 @@
+import pytest
+
+from modules import browser_pool
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+    def goto(self, url, timeout=None, wait_until=None):
+        if "crash" in url:
+            self.browser.connected = False
+            raise RuntimeError("Target closed")
+        self.url = url
+
+    def content(self):
+        return f"<html>{self.url}</html>"
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    def new_page(self):
+        return FakePage(self)
+
+    def close(self):
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = self
+
+    def start(self):
+        return self
+
+    def launch(self, headless=True):
+        return FakeBrowser()
+
+    def stop(self):
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(browser_pool, "sync_playwright", FakePlaywright)
+    pool = browser_pool.BrowserPool(size=1, max_page_uses=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_reuses_browser_and_recycles_pages(pool):
+    for i in range(5):
+        assert pool.fetch(f"https://example.com/{i}") == f"<html>https://example.com/{i}</html>"
+    assert pool.stats()["launches"] == 1
+    assert pool.stats()["recycles"] == 2
+
+
+def test_pool_relaunches_browser_after_crash(pool):
+    with pytest.raises(RuntimeError):
+        pool.fetch("https://example.com/crash")
+    assert pool.fetch("https://example.com/ok") == "<html>https://example.com/ok</html>"
+    assert pool.stats()["crashes"] == 1
+    assert pool.stats()["launches"] == 2
+
+
+def test_pool_rejects_fetch_after_shutdown(pool):
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.fetch("https://example.com/late")
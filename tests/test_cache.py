@@ -0,0 +1,165 @@
+import json
+import time
+
+from modules import cache, cache_store
+from modules.cache_store import migrate_json_cache
+from modules.memory_cache import LRUCache
+
+
+def test_set_and_get_cached_roundtrip(store):
+    cache.set_cached("https://example.com/a", "<html>a</html>")
+    assert cache.get_cached("https://example.com/a") == "<html>a</html>"
+    assert cache.get_cached("https://example.com/missing") is None
+
+
+def test_get_cached_respects_category_expiry(store):
+    stale = time.time() - cache.CACHE_EXPIRY["pages"] - 1
+    store.set("pages", "https://example.com/old", "<html>old</html>", stale)
+    store.set("rosters", "https://example.com/old", "<html>old</html>", stale)
+    assert cache.get_cached("https://example.com/old", "pages") is None
+    assert cache.get_cached("https://example.com/old", "rosters") == "<html>old</html>"
+
+
+def test_migrate_json_cache_copies_entries_once(tmp_path, store):
+    legacy_path = tmp_path / "nba_cache.json"
+    legacy_path.write_text(json.dumps({
+        "pages": {"u1": {"data": "<html>1</html>", "timestamp": 1.0}},
+        "rosters": {"u2": {"data": "<html>2</html>", "timestamp": 2.0}},
+        "all_players": {"data": [["A", "B"]], "timestamp": 3.0},
+    }))
+
+    assert migrate_json_cache(str(legacy_path), store) == 2
+    assert store.get("pages", "u1") == {"data": "<html>1</html>", "timestamp": 1.0}
+    assert store.get("rosters", "u2")["data"] == "<html>2</html>"
+    assert not legacy_path.exists()
+    assert migrate_json_cache(str(legacy_path), store) == 0
+
+
+def test_memory_tier_serves_repeat_hits(store):
+    cache.set_cached("https://example.com/a", "<html>a</html>")
+    store.clear()
+    assert cache.get_cached("https://example.com/a") == "<html>a</html>"
+
+
+def test_lru_cache_evicts_by_count_and_bytes():
+    lru = LRUCache(max_entries=2, max_bytes=10)
+    lru.put("pages", "a", "12345")
+    lru.put("pages", "b", "12345")
+    assert lru.get("pages", "a") is not None  # a is now most recent
+    lru.put("pages", "c", "1")
+    assert lru.get("pages", "b") is None
+    assert lru.get("pages", "c") is not None
+    lru.put("pages", "d", "123456789")
+    assert lru.stats()["bytes"] <= 10
+    assert lru.stats()["evictions"] == 2
+
+
+def test_lru_cache_expires_by_category():
+    lru = LRUCache(expiry={"pages": 60})
+    lru.put("pages", "a", "x", timestamp=time.time() - 61)
+    lru.put("rosters", "a", "x", timestamp=time.time() - 61)
+    assert lru.get("pages", "a") is None
+    assert lru.get("rosters", "a") is not None
+    assert lru.stats()["expirations"] == 1
+
+
+class FakeFetcher:
+    def __init__(self, html="<html>new</html>"):
+        self.html = html
+        self.urls = []
+
+    def fetch(self, url):
+        self.urls.append(url)
+        return self.html, "http"
+
+
+def test_stale_entry_is_served_and_refreshed_in_background(store, monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(cache, "get_fetcher", lambda: fetcher)
+    before = cache.cache_refresh_stats()
+    stale = time.time() - cache.CACHE_EXPIRY["pages"] - 1
+    store.set("pages", "https://example.com/stale", "<html>old</html>", stale)
+
+    assert cache.safe_request("https://example.com/stale") == "<html>old</html>"
+    assert cache.wait_for_refreshes()
+    assert cache.safe_request("https://example.com/stale") == "<html>new</html>"
+    assert fetcher.urls == ["https://example.com/stale"]
+
+    stats = cache.cache_refresh_stats()
+    assert stats["stale_hits"] == before["stale_hits"] + 1
+    assert stats["refreshes"] == before["refreshes"] + 1
+
+
+def test_entry_past_hard_expiry_is_fetched_synchronously(store, monkeypatch):
+    fetcher = FakeFetcher()
+    monkeypatch.setattr(cache, "get_fetcher", lambda: fetcher)
+    ancient = time.time() - cache.CACHE_HARD_EXPIRY["pages"] - 1
+    store.set("pages", "https://example.com/ancient", "<html>old</html>", ancient)
+
+    assert cache.safe_request("https://example.com/ancient") == "<html>new</html>"
+
+
+def test_failed_refresh_is_counted_and_keeps_stale_entry(store, monkeypatch):
+    monkeypatch.setattr(cache, "get_fetcher", lambda: FakeFetcher(html=None))
+    before = cache.cache_refresh_stats()["refresh_failures"]
+    stale = time.time() - cache.CACHE_EXPIRY["pages"] - 1
+    store.set("pages", "https://example.com/down", "<html>old</html>", stale)
+
+    assert cache.safe_request("https://example.com/down") == "<html>old</html>"
+    assert cache.wait_for_refreshes()
+    assert cache.cache_refresh_stats()["refresh_failures"] == before + 1
+    assert cache.safe_request("https://example.com/down") == "<html>old</html>"
+
+
+def test_payloads_are_stored_compressed(store):
+    html = "<tr><td data-stat='pts'>25</td></tr>" * 500
+    cache.set_cached("https://example.com/big", html)
+    blob = store._conn().execute("SELECT data FROM cache WHERE key = ?", ("https://example.com/big",)).fetchone()[0]
+    assert isinstance(blob, bytes) and len(blob) < len(html) / 10
+    assert cache.get_cached("https://example.com/big") == html
+
+
+def test_rows_from_uncompressed_schema_are_still_readable(tmp_path):
+    import sqlite3
+    from modules.cache_store import SQLiteCacheStore
+
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE cache (category TEXT, key TEXT, data TEXT, timestamp REAL, PRIMARY KEY (category, key))")
+    conn.execute("INSERT INTO cache VALUES ('pages', 'u', ?, 1.0)", (json.dumps("<html>old</html>"),))
+    conn.commit()
+    conn.close()
+
+    store = SQLiteCacheStore(path)
+    assert store.get("pages", "u") == {"data": "<html>old</html>", "timestamp": 1.0}
+    assert store.sizes()["pages"]["bytes"] > 0
+    store.close()
+
+
+def test_eviction_drops_least_recently_read_entries_of_largest_category(store, monkeypatch):
+    monkeypatch.setattr(cache_store, "ACCESS_RESOLUTION", 0)
+    for i in range(10):
+        store.set("pages", f"page{i}", f"<html>{i}</html>" + "x" * 2000 + str(i))
+    store.set("player_ids", "lebron", {"player_id": "jamesle01"})
+    store.get("pages", "page0")
+
+    assert store.evict(store.total_bytes() // 2) > 0
+    assert store.get("pages", "page0") is not None
+    assert store.get("pages", "page1") is None
+    assert store.get("player_ids", "lebron") is not None
+
+
+def test_dead_entries_are_deleted_when_read(store):
+    dead = time.time() - cache.CACHE_EXPIRY["parsed_rosters"] - 1
+    store.set("parsed_rosters", "v1|LAL|2025", {"players": []}, dead)
+    assert cache.get_cached("v1|LAL|2025", "parsed_rosters") is None
+    assert store.count("parsed_rosters") == 0
+
+
+def test_cache_stats_reports_size_per_category(store):
+    cache.set_cached("https://example.com/a", "<html>a</html>")
+    cache.set_cached("lebron", {"player_id": "jamesle01"}, category="player_ids")
+    stats = cache.cache_stats()
+    assert stats["categories"]["pages"]["entries"] == 1
+    assert stats["total"]["entries"] == 2
+    assert stats["total"]["bytes"] > 0
@@ -0,0 +1,115 @@
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from modules import cache
+from modules.cache_store import JSONCacheStore, SQLiteCacheStore, migrate_json_cache
+from modules.single_flight import SingleFlight
+
+WRITERS = 4
+KEYS_PER_WRITER = 15
+
+
+def _write_entries(backend, path, writer):
+    store = {"json": JSONCacheStore, "sqlite": SQLiteCacheStore}[backend](path)
+    for i in range(KEYS_PER_WRITER):
+        store.set("pages", f"w{writer}-{i}", f"<html>{writer}-{i}</html>")
+    store.close()
+
+
+@pytest.mark.parametrize("backend, filename", [("json", "cache.json"), ("sqlite", "cache.db")])
+def test_concurrent_processes_do_not_lose_writes(tmp_path, backend, filename):
+    path = str(tmp_path / filename)
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_write_entries, args=(backend, path, w)) for w in range(WRITERS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    store = JSONCacheStore(path) if backend == "json" else SQLiteCacheStore(path)
+    assert store.count("pages") == WRITERS * KEYS_PER_WRITER
+    store.close()
+
+
+def test_single_flight_runs_once_for_concurrent_callers():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return "result"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", slow))) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    while flight.coalesced < 5:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == ["result"] * 6
+
+
+def test_concurrent_misses_for_one_url_fetch_once(store, monkeypatch):
+    fetched = []
+
+    class SlowFetcher:
+        def fetch(self, url):
+            fetched.append(url)
+            time.sleep(0.05)
+            return "<html>page</html>", "http"
+
+    monkeypatch.setattr(cache, "get_fetcher", lambda: SlowFetcher())
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.safe_request("https://example.com/hot")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fetched == ["https://example.com/hot"]
+    assert results == ["<html>page</html>"] * 8
+
+
+def _migrate(json_path, db_path, results):
+    store = SQLiteCacheStore(db_path)
+    results.put(migrate_json_cache(json_path, store))
+    store.close()
+
+
+def test_concurrent_startups_migrate_the_legacy_cache_once(tmp_path):
+    json_path = str(tmp_path / "nba_cache.json")
+    JSONCacheStore(json_path).set("pages", "u1", "<html>1</html>")
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    workers = [context.Process(target=_migrate, args=(json_path, str(tmp_path / "cache.db"), results))
+               for _ in range(WRITERS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(30)
+        assert worker.exitcode == 0
+
+    assert sorted(results.get() for _ in workers) == [0] * (WRITERS - 1) + [1]
+
+
+def test_corrupt_json_cache_is_moved_aside_on_read(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    store = JSONCacheStore(str(path))
+    assert store.get("pages", "u1") is None
+    assert (tmp_path / "cache.json.corrupt").read_text() == "{not json"
+    store.set("pages", "u1", "<html>1</html>")
+    assert store.get("pages", "u1")["data"] == "<html>1</html>"
@@ -0,0 +1,92 @@
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from benchmarks.offline import offline_cache
+from modules import dataset, player as player_module
+from modules.fetch import export_season
+from modules.gamelog import GameLog
+from modules.parse import parse_game_log
+from modules.player import Player
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def games():
+    return parse_game_log((FIXTURES / "gamelog_jamesle01_2025.html").read_text())
+
+
+def test_game_logs_round_trip_and_rewrites_replace_rows(tmp_path, games):
+    dataset.write_game_log("jamesle01", 2025, games, base_dir=tmp_path)
+    dataset.write_game_log("jamesle01", 2025, games, base_dir=tmp_path)
+    dataset.write_game_log("davisan02", 2025, games[:10], base_dir=tmp_path)
+
+    assert dataset.read_game_logs(seasons=[2025], base_dir=tmp_path).num_rows == len(games) + 10
+    log = dataset.load_game_log("jamesle01", 2025, base_dir=tmp_path)
+    reference = GameLog.from_records(games)
+    assert list(log) == list(reference)
+    assert log.averages() == reference.averages()
+
+
+def test_reads_prune_partitions_and_columns(tmp_path, games):
+    dataset.write_game_log("jamesle01", 2025, games, base_dir=tmp_path)
+    dataset.write_game_log("jamesle01", 2024, [{**g, "team": "CLE"} for g in games[:5]], base_dir=tmp_path)
+
+    table = dataset.read_game_logs(teams=["CLE"], columns=["player_id", "points"], base_dir=tmp_path)
+    assert table.num_rows == 5
+    assert table.column_names == ["player_id", "points"]
+    assert dataset.read_game_logs(seasons=[2023], base_dir=tmp_path).num_rows == 0
+
+
+def test_finished_seasons_load_from_the_dataset(tmp_path, games, monkeypatch):
+    dataset.write_game_log("jamesle01", 2025, games, base_dir=tmp_path)
+    monkeypatch.setattr(dataset, "DATASET_ENABLED", True)
+    monkeypatch.setattr(dataset, "DATASET_DIR", str(tmp_path))
+    monkeypatch.setattr(player_module, "load_season_game_log", lambda *args: pytest.fail("fetched"))
+
+    lebron = Player("LeBron James", "Los Angeles Lakers", 2025, "jamesle01")
+    assert len(lebron.fetch_stats()) == len(games)
+
+
+def test_headshot_is_stored_with_the_game_log(tmp_path, games, monkeypatch):
+    dataset.write_game_log("jamesle01", 2025, games, base_dir=tmp_path, image_url="https://img/lebron.jpg")
+    monkeypatch.setattr(dataset, "DATASET_ENABLED", True)
+    monkeypatch.setattr(dataset, "DATASET_DIR", str(tmp_path))
+
+    lebron = Player("LeBron James", "Los Angeles Lakers", 2025, "jamesle01")
+    lebron.fetch_stats()
+    assert lebron.image_url == "https://img/lebron.jpg"
+
+
+def test_readers_never_see_a_half_written_file(tmp_path, games):
+    dataset.write_game_log("jamesle01", 2025, games, base_dir=tmp_path)
+    errors = []
+
+    def rewrite():
+        for _ in range(20):
+            dataset.write_game_log("jamesle01", 2025, games, base_dir=tmp_path)
+
+    writer = threading.Thread(target=rewrite)
+    writer.start()
+    while writer.is_alive():
+        try:
+            assert len(dataset.load_game_log("jamesle01", 2025, base_dir=tmp_path)) == len(games)
+        except Exception as e:
+            errors.append(e)
+    writer.join()
+    assert errors == []
+    assert [name for name in os.listdir(tmp_path / "game_logs") if name.startswith(".")] == []
+
+
+def test_export_season_writes_rosters_game_logs_and_schedule(tmp_path):
+    with offline_cache():
+        summary = export_season(2025, ["LAL"], base_dir=tmp_path)
+
+    roster = dataset.load_roster("LAL", 2025, base_dir=tmp_path)
+    assert ("LeBron James", "jamesle01") in roster["players"]
+    assert summary["players"] == len({player_id for _, player_id in roster["players"] if player_id})
+    assert dataset.read_game_logs(seasons=[2025], base_dir=tmp_path).num_rows == summary["games"]
+    assert dataset.read_schedules(seasons=[2025], base_dir=tmp_path).num_rows > 0
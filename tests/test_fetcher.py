@@ -0,0 +1,75 @@
+from modules.fetcher import NOT_FOUND, TieredFetcher, classify_url, uncomment_tables
+
+GAMELOG_URL = "https://www.basketball-reference.com/players/j/jamesle01/gamelog/2025"
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+
+class FakeSession:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        return FakeResponse(self.text, self.status_code)
+
+
+def test_classify_url_matches_known_patterns():
+    assert classify_url(GAMELOG_URL)[0] == "gamelog"
+    assert classify_url("https://www.basketball-reference.com/teams/LAL/2025.html")[0] == "roster"
+    assert classify_url("https://www.basketball-reference.com/leagues/NBA_2025_games-april.html")[0] == "schedule"
+    assert classify_url("https://www.basketball-reference.com/players/j/jamesle01.html")[0] == "profile"
+
+
+def test_uncomment_tables_exposes_commented_table():
+    html = '<div class="placeholder"></div><!--\n<div class="table_container" id="div_x"><table id="x"></table></div>\n-->'
+    assert '<!--' not in uncomment_tables(html)
+    assert '<table id="x">' in uncomment_tables(html)
+
+
+def test_fetcher_uses_http_when_page_is_complete():
+    session = FakeSession('<table id="player_game_log_reg"></table>')
+    browser_calls = []
+    fetcher = TieredFetcher(session=session, browser_fetch=lambda url: browser_calls.append(url), limiter=None)
+    html, tier = fetcher.fetch(GAMELOG_URL)
+    assert tier == "http"
+    assert browser_calls == []
+
+
+def test_fetcher_falls_back_and_remembers_browser_tier():
+    session = FakeSession("<html>Please enable JavaScript</html>")
+    fetcher = TieredFetcher(session=session, browser_fetch=lambda url: '<table id="player_game_log_reg"></table>', limiter=None)
+    assert fetcher.fetch(GAMELOG_URL)[1] == "browser"
+    assert fetcher.fetch(GAMELOG_URL)[1] == "browser"
+    assert session.calls == 1
+    assert fetcher.preferred_tier["gamelog"] == "browser"
+
+
+def test_fetcher_reports_missing_pages_without_the_browser():
+    browser_calls = []
+    fetcher = TieredFetcher(session=FakeSession("Page Not Found", 404),
+                            browser_fetch=lambda url: browser_calls.append(url), limiter=None)
+    assert fetcher.fetch(GAMELOG_URL) == (None, NOT_FOUND)
+    assert browser_calls == []
+
+
+def test_fetcher_returns_server_errors_without_the_browser():
+    browser_calls = []
+    fetcher = TieredFetcher(session=FakeSession("Too Many Requests", 429),
+                            browser_fetch=lambda url: browser_calls.append(url), limiter=None)
+    assert fetcher.fetch(GAMELOG_URL) == (None, None)
+    assert browser_calls == []
+    assert "gamelog" not in fetcher.preferred_tier
+
+
+def test_fetcher_keeps_http_when_the_browser_page_is_incomplete_too():
+    empty_log = "<html>No games played</html>"
+    fetcher = TieredFetcher(session=FakeSession(empty_log), browser_fetch=lambda url: empty_log, limiter=None)
+    assert fetcher.fetch(GAMELOG_URL) == (empty_log, "browser")
+    assert "gamelog" not in fetcher.preferred_tier
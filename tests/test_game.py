@@ -0,0 +1,31 @@
+import datetime
+from pathlib import Path
+
+from modules import parsed_cache
+from modules.game import Game
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_game_fetches_rosters_only_when_needed(store, monkeypatch):
+    roster_html = (FIXTURES / "roster_LAL_2025.html").read_text()
+    fetched = []
+
+    def fake_fetch_many(urls, category="pages"):
+        for url in urls:
+            fetched.append(url)
+            yield url, roster_html
+
+    monkeypatch.setattr(parsed_cache, "fetch_many", fake_fetch_many)
+
+    game = Game("Los Angeles Lakers", "Portland Trail Blazers", datetime.date(2025, 4, 13), "7:30p")
+    assert str(game) == "Portland Trail Blazers @ Los Angeles Lakers on 2025-04-13 at 7:30p"
+    assert fetched == []
+
+    players = game.get_all_players()
+    assert sorted(fetched) == [
+        "https://www.basketball-reference.com/teams/LAL/2025.html",
+        "https://www.basketball-reference.com/teams/POR/2025.html",
+    ]
+    assert len(players) == 24
+    assert game.home_team.logo_url.endswith("LAL-2025.png")
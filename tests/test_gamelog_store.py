@@ -0,0 +1,88 @@
+import time
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from modules import gamelog_store
+from modules.cache import set_cached
+from modules.gamelog_store import GAMELOG_RETRY_AFTER, StoredGameLog, load_season_game_log
+from modules.parse import parse_game_log
+from modules.schedule import SeasonSchedule
+
+FIXTURES = Path(__file__).parent / "fixtures"
+URL = "https://www.basketball-reference.com/players/j/jamesle01/gamelog/2025"
+LAKERS = "Los Angeles Lakers"
+TODAY = date(2025, 5, 1)
+
+
+@pytest.fixture
+def html():
+    return (FIXTURES / "gamelog_jamesle01_2025.html").read_text()
+
+
+@pytest.fixture
+def fetches(html, monkeypatch):
+    calls = []
+
+    def fake_request(url, category="pages", max_age=None):
+        calls.append(url)
+        return html
+
+    monkeypatch.setattr(gamelog_store, "safe_request", fake_request)
+    return calls
+
+
+def use_schedule(monkeypatch, games):
+    months = {"april": {"games": games, "fetched": time.time(), "final": True}}
+    monkeypatch.setattr(gamelog_store, "get_season_schedule", lambda season: SeasonSchedule(season, months))
+
+
+def seed(games, through, checked=None, final=False):
+    log = StoredGameLog(None, games, through, checked or time.time() - GAMELOG_RETRY_AFTER - 1, final)
+    set_cached(gamelog_store._key("jamesle01", 2025), log.to_cache(), category="game_logs")
+
+
+def test_first_load_fetches_then_reuses_the_stored_log(store, fetches, html):
+    first = load_season_game_log(URL, "jamesle01", 2025, LAKERS, today=TODAY)
+    assert first["games"] == parse_game_log(html)
+    assert load_season_game_log(URL, "jamesle01", 2025, LAKERS, today=TODAY) == first
+    assert len(fetches) == 1
+
+
+def test_no_fetch_when_team_has_not_played_since(store, fetches, monkeypatch, html):
+    games = parse_game_log(html)
+    seed(games, games[-1]["game_date"])
+    use_schedule(monkeypatch, [{"date": "2025-04-29", "time": "", "away": "Boston Celtics", "home": "Miami Heat"}])
+
+    assert len(load_season_game_log(URL, "jamesle01", 2025, LAKERS, today=TODAY)["games"]) == len(games)
+    assert fetches == []
+
+
+def test_new_games_are_merged_into_the_stored_log(store, fetches, monkeypatch, html):
+    games = parse_game_log(html)
+    seed(games[:-3], games[-4]["game_date"])
+    use_schedule(monkeypatch, [{"date": games[-1]["game_date"], "time": "", "away": LAKERS, "home": "Minnesota Timberwolves"}])
+
+    assert load_season_game_log(URL, "jamesle01", 2025, LAKERS, today=TODAY)["games"] == games
+    assert len(fetches) == 1
+
+
+def test_finished_seasons_are_never_refetched(store, fetches, html):
+    games = parse_game_log(html)
+    seed(games[:10], games[9]["game_date"])
+
+    after_finals = date(2025, 8, 1)
+    assert load_season_game_log(URL, "jamesle01", 2025, LAKERS, today=after_finals)["games"] == games
+    assert load_season_game_log(URL, "jamesle01", 2025, LAKERS, today=after_finals)["games"] == games
+    assert len(fetches) == 1
+
+
+def test_unknown_team_refetches_once_the_retry_window_has_passed(store, fetches, monkeypatch, html):
+    games = parse_game_log(html)
+    seed(games, games[-1]["game_date"])
+    use_schedule(monkeypatch, [])
+
+    load_season_game_log(URL, "jamesle01", 2025, None, today=TODAY)
+    load_season_game_log(URL, "jamesle01", 2025, None, today=TODAY)
+    assert len(fetches) == 1
@@ -0,0 +1,40 @@
+import json
+
+from modules import metrics
+
+
+def test_spans_feed_totals_and_the_current_collection():
+    metrics.reset()
+    with metrics.collect() as collected:
+        with metrics.span("parse.test"):
+            pass
+        metrics.timed("parse.test")(lambda: None)()
+    with metrics.span("parse.test"):
+        pass
+
+    assert collected["parse.test"]["count"] == 2
+    assert metrics.snapshot()["spans"]["parse.test"]["count"] == 3
+
+
+def test_prometheus_text_exports_spans_counters_and_gauges(tmp_path):
+    metrics.reset()
+    metrics.increment("cache.hit", 3)
+    metrics.record("fetch", 0.25)
+
+    path = tmp_path / "nba.prom"
+    assert metrics.write_prometheus(str(path), gauges={"cache_memory_hit_rate": 0.5})
+    text = path.read_text()
+    assert 'nba_span_seconds_sum{span="fetch"} 0.250000' in text
+    assert 'nba_span_seconds_count{span="fetch"} 1' in text
+    assert "nba_cache_hit_total 3" in text
+    assert "nba_cache_memory_hit_rate 0.5" in text
+
+
+def test_structured_log_writes_one_json_line_per_span(tmp_path, monkeypatch):
+    log = tmp_path / "metrics.jsonl"
+    monkeypatch.setattr(metrics, "METRICS_LOG", str(log))
+    with metrics.span("fetch", url="https://example.com"):
+        pass
+    event = json.loads(log.read_text().splitlines()[-1])
+    assert event["span"] == "fetch" and event["url"] == "https://example.com"
+    assert event["ms"] >= 0
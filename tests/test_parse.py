@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from modules.parse import extract_table, parse_game_log, parse_profile, parse_roster, parse_schedule
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def read_fixture(name):
+    return (FIXTURES / name).read_text()
+
+
+def test_parse_game_log_reads_cells_by_data_stat():
+    stats = parse_game_log(read_fixture("gamelog_jamesle01_2025.html"))
+    regular = [g for g in stats if g["game_type"] == "regular"]
+    playoff = [g for g in stats if g["game_type"] == "playoff"]
+
+    assert len(regular) == 77  # 82 games minus 5 inactive rows
+    assert len(playoff) == 5  # table is inside an HTML comment
+    assert [g["game_date"] for g in stats] == sorted(g["game_date"] for g in stats)
+
+    game = stats[0]
+    assert game["game_date"] == "2024-10-22"
+    assert len(game["opponent"]) == 3
+    assert game["points_rebounds_assists"] == game["points"] + game["rebounds"] + game["assists"]
+    assert all(isinstance(game[stat], int) for stat in ["points", "assists", "rebounds", "3pm"])
+
+
+def test_parse_schedule_uses_csk_dates():
+    games = parse_schedule(read_fixture("schedule_2025_april.html"))
+    on_13th = [g for g in games if g["date"] == "2025-04-13"]
+    assert len(on_13th) == 15
+    assert {"date": "2025-04-13", "time": "7:30p", "away": "Portland Trail Blazers",
+            "home": "Los Angeles Lakers"} in on_13th
+
+
+def test_parse_roster_and_profile():
+    logo_url, players = parse_roster(read_fixture("roster_LAL_2025.html"))
+    assert logo_url.endswith("LAL-2025.png")
+    assert ("Luka Dončić", "doncilu01") in players
+
+    assert parse_profile(read_fixture("profile_jamesle01.html")) == (
+        "LeBron James", "Los Angeles Lakers",
+        "https://www.basketball-reference.com/req/202106291/images/headshots/jamesle01.jpg",
+    )
+
+
+def test_extract_table_missing_returns_none():
+    assert extract_table("<html><table id='other'></table></html>", "roster") is None
+
+
+def test_extract_table_skips_other_elements_with_the_id():
+    html = ('<div id="schedule">menu</div><table class="x"><tr><td>nav</td></tr></table>'
+            '<!-- <table id="schedule"><tbody><tr><td>1</td></tr></tbody></table> -->')
+    table = extract_table(html, "schedule")
+    assert table is not None and table.get("id") == "schedule"
+
+
+def test_parse_schedule_skips_rows_without_both_teams():
+    row = ('<tr><th data-stat="date_game" csk="{date}0000">x</th>{cells}</tr>')
+    teams = '<td data-stat="visitor_team_name">Boston Celtics</td><td data-stat="home_team_name">Miami Heat</td>'
+    html = ('<table id="schedule"><tbody>'
+            + row.format(date="20250413", cells='<td data-stat="home_team_name">Miami Heat</td>')
+            + row.format(date="20250414", cells=teams)
+            + '</tbody></table><!-- <table id="schedule"><tbody>'
+            + row.format(date="20250414", cells=teams)
+            + row.format(date="20250415", cells=teams)
+            + '</tbody></table> -->')
+    assert parse_schedule(html) == [
+        {"date": "2025-04-14", "time": "Time Not Available", "away": "Boston Celtics", "home": "Miami Heat"},
+        {"date": "2025-04-15", "time": "Time Not Available", "away": "Boston Celtics", "home": "Miami Heat"},
+    ]
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from modules import cache, parse, parsed_cache
+
+FIXTURES = Path(__file__).parent / "fixtures"
+ROSTER_URL = "https://www.basketball-reference.com/teams/LAL/2025.html"
+
+
+def test_parsed_roster_is_cached_and_versioned(store, monkeypatch):
+    html = (FIXTURES / "roster_LAL_2025.html").read_text()
+    fetches = []
+    monkeypatch.setattr(parsed_cache, "safe_request", lambda url, category="pages": fetches.append(url) or html)
+
+    first = parsed_cache.load_roster(ROSTER_URL, "LAL", 2025)
+    second = parsed_cache.load_roster(ROSTER_URL, "LAL", 2025)
+    assert first == second
+    assert "Luka Dončić" in [name for name, _ in first["players"]]
+    assert len(fetches) == 1
+
+    monkeypatch.setitem(parse.PARSER_VERSIONS, "roster", parse.PARSER_VERSIONS["roster"] + 1)
+    parsed_cache.load_roster(ROSTER_URL, "LAL", 2025)
+    assert len(fetches) == 2
+
+
+def test_raw_html_retention_can_be_disabled(store, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_RAW_HTML", False)
+    monkeypatch.setattr(cache, "get_fetcher", lambda: type("F", (), {"fetch": lambda self, url: ("<html></html>", "http")})())
+    assert cache.safe_request("https://example.com/page") == "<html></html>"
+    assert store.get("pages", "https://example.com/page") is None
+
+
+def test_background_refresh_reparses_within_a_bounded_source_map(store, monkeypatch):
+    html = (FIXTURES / "roster_LAL_2025.html").read_text()
+    older_url = ROSTER_URL.replace("2025", "2024")
+    monkeypatch.setattr(parsed_cache, "safe_request", lambda url, category="pages": html)
+    monkeypatch.setattr(parsed_cache, "_page_sources", parsed_cache.LRUCache(1))
+    parsed_cache.load_roster(ROSTER_URL, "LAL", 2025)
+    parsed_cache.load_roster(older_url, "LAL", 2024)
+    assert parsed_cache._page_sources.stats()["entries"] == 1
+
+    reparsed = []
+    monkeypatch.setattr(parsed_cache, "store_parsed", lambda kind, html, *parts: reparsed.append((kind, parts)))
+    parsed_cache._reparse_refreshed_page(ROSTER_URL, "rosters", html)  # evicted: parsed again on its next miss
+    parsed_cache._reparse_refreshed_page(older_url, "rosters", html)
+    assert reparsed == [("roster", ("LAL", 2024))]
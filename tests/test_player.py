@@ -0,0 +1,131 @@
+import datetime
+from pathlib import Path
+
+import pytest
+
+from modules.constants import AVAILABLE_STATS
+from modules.gamelog import GameLog
+from modules.parse import parse_game_log
+from modules.player import Player
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def games():
+    return parse_game_log((FIXTURES / "gamelog_jamesle01_2025.html").read_text())
+
+
+@pytest.fixture
+def lebron(games):
+    player = Player("LeBron James", "Los Angeles Lakers", 2025, "jamesle01")
+    player.stats = GameLog.from_records(games)
+    return player
+
+
+def reference_averages(games):
+    return {f"avg_{stat}": round(sum(g[stat] for g in games) / len(games), 1) for stat in AVAILABLE_STATS}
+
+
+def test_game_log_round_trips_records(games):
+    log = GameLog.from_records(games)
+    assert len(log) == len(games)
+    assert list(log) == games
+    assert log[-1] == games[-1]
+    assert log.nbytes < 20_000
+
+
+def test_get_last_n_games_matches_list_implementation(lebron, games):
+    selected_date = datetime.date(2025, 1, 15)
+    before = [g for g in games if g["game_date"] <= selected_date.isoformat()]
+
+    last_n, averages = lebron.get_last_n_games(10, selected_date)
+    assert last_n == before[-10:]
+    assert averages == reference_averages(before[-10:])
+
+
+def test_get_stats_against_opponent_and_season_averages(lebron, games):
+    vs_min = [g for g in games if g["opponent"] == "MIN"]
+    assert lebron.get_stats_against_opponent("MIN") == (vs_min, reference_averages(vs_min))
+    assert lebron.get_stats_against_opponent("XXX") == ([], {})
+    assert lebron.get_season_averages() == reference_averages(games)
+
+
+def test_count_exceeding_threshold(lebron, games):
+    exceeded = sum(g["points"] >= 25 for g in games)
+    result = lebron.count_exceeding_threshold("points", 25)
+    assert result[:3] == (exceeded, len(games) - exceeded, len(games))
+    assert result[3] == pytest.approx(exceeded / len(games) * 100)
+
+
+def test_last_n_averages_by_n_matches_individual_windows(lebron):
+    selected_date = datetime.date(2025, 2, 1)
+    by_n = lebron.get_last_n_averages_by_n(82, selected_date)
+    assert len(by_n) == 82
+    for n in (1, 5, 30, 82):
+        assert by_n[n] == lebron.get_last_n_games(n, selected_date)[1]
+
+
+def test_get_games_between_dates(lebron, games):
+    start, end = datetime.date(2024, 12, 1), datetime.date(2024, 12, 31)
+    december = [g for g in games if start.isoformat() <= g["game_date"] <= end.isoformat()]
+    assert lebron.get_games_between(start, end) == (december, reference_averages(december))
+    assert lebron.get_games_between(end, start) == ([], {})
+
+
+def test_threshold_table_sweeps_many_lines(lebron, games):
+    lines = [18.5, 22.5, 26.5, 30.5]
+    df = lebron.threshold_table({"points": lines, "assists": 7})
+    assert list(df["Threshold"]) == lines + [7]
+    assert list(df["Exceeded"][:4]) == [sum(g["points"] >= line for g in games) for line in lines]
+    assert df["Total Games"].iloc[0] == len(games)
+
+    playoffs = lebron.threshold_table({"points": lines}, game_type="playoff")
+    assert playoffs["Total Games"].iloc[0] == 5
+
+    recent = lebron.threshold_table({"points": 20}, last_n=10, selected_date=datetime.date(2025, 1, 15))
+    before = [g for g in games if g["game_date"] <= "2025-01-15"][-10:]
+    assert recent["Exceeded"].iloc[0] == sum(g["points"] >= 20 for g in before)
+
+
+def test_fetch_career_merges_seasons_concurrently_and_filters_by_range(store, monkeypatch, games):
+    from modules import gamelog_store
+
+    html_2025 = (FIXTURES / "gamelog_jamesle01_2025.html").read_text()
+    html_2024 = html_2025.replace("2024-", "2023-").replace("2025-", "2024-")
+    pages = {
+        "https://www.basketball-reference.com/players/j/jamesle01/gamelog/2024": html_2024,
+        "https://www.basketball-reference.com/players/j/jamesle01/gamelog/2025": html_2025,
+    }
+    fetched = []
+
+    def fake_request(url, category="pages", max_age=None):
+        fetched.append(url)
+        return pages.get(url)
+
+    monkeypatch.setattr(gamelog_store, "safe_request", fake_request)
+    player = Player("LeBron James", "Los Angeles Lakers", 2025, "jamesle01")
+
+    career = player.fetch_career(range(2024, 2026))
+    assert len(career) == 2 * len(games)
+    assert career.season_list == [2024, 2025]
+    assert {g["team"] for g in career} == {"LAL"}
+
+    vs_boston = [g for g in games if g["opponent"] == "BOS"]
+    assert len(player.get_stats_against_opponent("BOS", seasons=[2024, 2025])[0]) == 2 * len(vs_boston)
+    assert len(player.get_stats_against_opponent("BOS", seasons=[2024])[0]) == len(vs_boston)
+    assert player.get_career_averages([2025]) == GameLog.from_records(games).averages()
+    assert player.threshold_table({"points": 20}, seasons=[2024, 2025])["Total Games"][0] == 2 * len(games)
+
+    player.fetch_career([2025])
+    assert len(fetched) == 2
+
+
+def test_career_seasons_come_from_the_profile_page(monkeypatch):
+    from modules import player as player_module
+
+    profile_html = (FIXTURES / "profile_jamesle01.html").read_text()
+    monkeypatch.setattr(player_module, "safe_request", lambda url, category="pages": profile_html)
+    lebron = Player("LeBron James", "Los Angeles Lakers", 2025, "jamesle01")
+    lebron._resolve_urls()
+    assert lebron.career_seasons() == list(range(2004, 2026))
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from modules import parsed_cache, player
+from modules.player import Player
+from modules.player_index import lookup_player_id, player_id_from_href
+from modules.team import Team
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_player_id_from_href():
+    assert player_id_from_href("/players/j/jamesle01.html") == "jamesle01"
+    assert player_id_from_href("/teams/LAL/2025.html") is None
+
+
+def test_roster_records_ids_so_players_resolve_without_fetching(store, monkeypatch):
+    roster_html = (FIXTURES / "roster_LAL_2025.html").read_text()
+    monkeypatch.setattr(parsed_cache, "safe_request", lambda url, category="pages": roster_html)
+
+    lakers = Team("Los Angeles Lakers", 2025)
+    assert {p.name: p.player_id for p in lakers.roster}["LeBron James"] == "jamesle01"
+
+    def no_fetch(url, category="pages"):
+        raise AssertionError(f"unexpected fetch of {url}")
+
+    monkeypatch.setattr(player, "safe_request", no_fetch)
+    lebron = Player("LeBron James", "Los Angeles Lakers", 2025)
+    assert lebron._resolve_urls()
+    assert lebron.stats_url == "https://www.basketball-reference.com/players/j/jamesle01/gamelog/2025"
+
+
+def test_failed_probe_is_recorded_as_negative_result(store, monkeypatch):
+    calls = []
+    monkeypatch.setattr(player, "safe_request", lambda url, category="pages": calls.append(url))
+    monkeypatch.setattr(player, "was_not_found", lambda url: True)
+
+    unknown = Player("Nobody Special", "Los Angeles Lakers", 2025)
+    assert not unknown._resolve_urls()
+    assert len(calls) == 8
+    assert lookup_player_id("nobody special", "LAL", 2025) == {"player_id": None}
+
+    assert not Player("Nobody Special", "Los Angeles Lakers", 2025)._resolve_urls()
+    assert len(calls) == 8
+
+
+def test_probe_that_failed_to_fetch_is_not_recorded(store, monkeypatch):
+    calls = []
+    monkeypatch.setattr(player, "safe_request", lambda url, category="pages": calls.append(url))
+    monkeypatch.setattr(player, "was_not_found", lambda url: not url.endswith("01.html"))
+
+    assert not Player("Nobody Special", "Los Angeles Lakers", 2025)._resolve_urls()
+    assert lookup_player_id("nobody special", "LAL", 2025) is None
+    assert not Player("Nobody Special", "Los Angeles Lakers", 2025)._resolve_urls()
+    assert len(calls) == 16
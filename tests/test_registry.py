@@ -0,0 +1,85 @@
+from datetime import date
+from pathlib import Path
+
+from modules import parsed_cache, player as player_module, registry, team as team_module
+from modules.game import Game
+from modules.parse import parse_game_log
+from modules.registry import ObjectRegistry, get_player, get_team
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_player_and_team_are_interned_per_season(store):
+    lebron = get_player("LeBron James", "Los Angeles Lakers", 2025)
+    assert get_player("Lebron James", "Los Angeles Lakers", 2025) is lebron
+    assert get_player("LeBron James", "Los Angeles Lakers", 2024) is not lebron
+    assert get_team("Boston Celtics", 2025) is get_team("Boston Celtics", 2025)
+
+
+def test_player_id_is_filled_in_on_later_lookup(store):
+    lebron = get_player("LeBron James", "Los Angeles Lakers", 2025)
+    assert get_player("LeBron James", "Los Angeles Lakers", 2025, "jamesle01").player_id == "jamesle01"
+    assert lebron.player_id == "jamesle01"
+
+
+def test_entries_are_bounded_and_expire():
+    registry = ObjectRegistry(max_entries={"players": 2}, expiry={"players": 60})
+    first = registry.intern("players", "a", object)
+    registry.intern("players", "b", object)
+    registry.intern("players", "c", object)
+    assert registry.stats()["players"] == 2
+    assert registry.stats()["evictions"] == 1
+    assert registry.intern("players", "a", object) is not first
+
+    registry.expiry["players"] = 0
+    b = registry.intern("players", "b", object)
+    assert registry.intern("players", "b", object) is not b
+
+
+def test_roster_and_games_share_objects(store, monkeypatch):
+    roster_html = (FIXTURES / "roster_LAL_2025.html").read_text()
+    monkeypatch.setattr(parsed_cache, "safe_request", lambda url, category="pages": roster_html)
+
+    game = Game("Los Angeles Lakers", "Boston Celtics", date(2025, 1, 2), "7:30p")
+    lakers = game.home_team
+    assert Game("Los Angeles Lakers", "Boston Celtics", date(2025, 1, 2), "7:30p").home_team is lakers
+    lebron = next(p for p in lakers.roster if p.name == "LeBron James")
+    assert get_player("LeBron James", "Los Angeles Lakers", 2025) is lebron
+
+
+def test_interned_team_retries_after_a_failed_roster_fetch(store, monkeypatch):
+    pages = [None, {"logo_url": "logo.png", "players": [("LeBron James", "jamesle01")]}]
+    monkeypatch.setattr(team_module, "load_roster", lambda url, code, season: pages.pop(0))
+
+    lakers = get_team("Los Angeles Lakers", 2025)
+    assert lakers.roster == [] and not lakers.is_loaded
+    assert get_team("Los Angeles Lakers", 2025) is lakers
+    assert [player.player_id for player in lakers.roster] == ["jamesle01"]
+    assert lakers.is_loaded and lakers.logo_url == "logo.png"
+
+
+def test_roster_hands_out_the_registry_player_after_it_expires(store, monkeypatch):
+    monkeypatch.setattr(team_module, "load_roster",
+                        lambda url, code, season: {"logo_url": None, "players": [("LeBron James", "jamesle01")]})
+    lakers = get_team("Los Angeles Lakers", 2025)
+    [lebron] = lakers.roster
+
+    now = registry.time.time() + player_module.STATS_EXPIRY + 1
+    monkeypatch.setattr(registry.time, "time", lambda: now)
+    [fresh] = lakers.roster
+    assert fresh is not lebron
+    assert fresh is get_player("LeBron James", "Los Angeles Lakers", 2025)
+    assert get_team("Los Angeles Lakers", 2025) is lakers  # teams live longer than players
+
+
+def test_loaded_stats_are_rechecked_after_they_expire(monkeypatch):
+    games = parse_game_log((FIXTURES / "gamelog_jamesle01_2025.html").read_text())
+    logs = []
+    monkeypatch.setattr(player_module, "load_season_game_log",
+                        lambda *args: logs.append(args) or {"image_url": None, "games": games})
+    lebron = player_module.Player("LeBron James", "Los Angeles Lakers", 2025, "jamesle01")
+    stats = lebron.fetch_stats()
+    assert lebron.fetch_stats() is stats and len(logs) == 1
+
+    lebron._stats_loaded -= player_module.STATS_EXPIRY
+    assert lebron.fetch_stats() is not stats and len(logs) == 2
@@ -0,0 +1,110 @@
+import datetime
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+from benchmarks.offline import FixtureFetcher, offline_cache
+from modules import cache, registry, report, schedule
+from modules.cache_store import SQLiteCacheStore
+from modules.rate_limit import RateLimiter
+
+SLATE_DATE = datetime.date(2025, 4, 13)
+
+
+def test_slate_report_covers_every_player_in_the_selected_games(tmp_path):
+    with offline_cache() as fetcher:
+        frames = report.slate_report(SLATE_DATE, last_n=3, thresholds={"points": [20.5, 25.5]},
+                                     team_codes=["LAL"], workers=1)
+        gamelog_fetches = [url for url in fetcher.urls if "/gamelog/" in url]
+
+    assert len(frames["last_n"]) == 24 * 3  # two rosters of 12, three games each
+    assert set(frames["last_n"]["slate_team"]) == {"LAL", "POR"}
+    # Every player is served LeBron's (LAL) game log, which has no games against LAL
+    assert set(frames["averages"]["window"]) == {"last_3", "season", "vs_POR"}
+    averages = frames["averages"]
+    # Every roster is the LAL fixture too; take LeBron's row for the home side
+    lebron = averages[(averages["player_id"] == "jamesle01") & (averages["slate_team"] == "LAL")]
+    assert list(lebron["window"]) == ["last_3", "season", "vs_POR"]
+    assert set(lebron["slate_opponent"]) == {"POR"}
+    assert len(frames["thresholds"]) == 24 * 2
+    # Every gamelog page was fetched once, up front (both rosters are the same 12 players)
+    assert len(gamelog_fetches) == len(set(gamelog_fetches)) == 12
+
+    paths = report.write_report(frames, SLATE_DATE, str(tmp_path), fmt="parquet")
+    assert len(paths) == 4
+    assert len(pd.read_parquet(paths[0])) == len(frames["last_n"])
+
+
+def test_slate_report_spreads_players_over_worker_processes(tmp_path, monkeypatch):
+    # Workers open the cache at the default path, relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    store = SQLiteCacheStore(str(tmp_path / cache.CACHE_DB))
+    fetcher = FixtureFetcher()
+    monkeypatch.setattr(cache, "_store", store)
+    monkeypatch.setattr(cache, "get_fetcher", lambda: fetcher)
+    cache.memory_cache.clear()
+    schedule._schedules.clear()
+    registry.get_registry().clear()
+    try:
+        in_process = report.slate_report(SLATE_DATE, last_n=2, team_codes=["LAL"], workers=1)
+        registry.get_registry().clear()
+        pooled = report.slate_report(SLATE_DATE, last_n=2, team_codes=["LAL"], workers=2)
+    finally:
+        schedule._schedules.clear()
+        registry.get_registry().clear()
+        cache.memory_cache.clear()
+        store.close()
+
+    for section in ("last_n", "averages", "vs_opponent"):
+        pd.testing.assert_frame_equal(pooled[section], in_process[section])
+    assert pooled["thresholds"].empty
+
+
+def test_parse_thresholds():
+    assert report.parse_thresholds(["points=20.5,25.5", "assists=6.5", "points=30"]) == {
+        "points": [20.5, 25.5, 30.0], "assists": [6.5]}
+    with pytest.raises(SystemExit):
+        report.main(["2025-04-13", "--threshold", "dunks=2"])
+
+
+def test_rate_limiter_share_splits_each_budget():
+    limiter = RateLimiter(host_limits={"a.com": (1.0, 4)}, default_limit=(2.0, 5), global_limit=(0.5, 5))
+    limiter.share(4)
+    assert limiter.bucket_for("https://a.com/x").rate == 0.25
+    assert limiter.bucket_for("https://a.com/x").capacity == 1
+    assert limiter.bucket_for("https://b.com/x").rate == 0.5
+    assert limiter.global_bucket.rate == 0.125
+
+
+def test_prefetch_loads_game_logs_as_the_workers_would(monkeypatch):
+    calls = []
+    monkeypatch.setattr(report, "game_log_needs_fetch", lambda *args: calls.append(args) or True)
+    monkeypatch.setattr(report, "load_season_game_log", lambda *args: calls.append(args) or None)
+
+    job = {"name": "LeBron James", "team": "Los Angeles Lakers", "season": 2025, "player_id": "jamesle01"}
+    url = "https://www.basketball-reference.com/players/j/jamesle01/gamelog/2025"
+    assert report.prefetch_game_logs([job]) == [url]
+    assert calls == [
+        ("jamesle01", 2025, "Los Angeles Lakers"),  # no date: judged as of today, like the workers
+        (url, "jamesle01", 2025, "Los Angeles Lakers"),
+    ]
+
+
+def test_prefetched_logs_survive_without_raw_html(monkeypatch):
+    # With raw HTML off the fetched page is not cached, but the stored log is
+    monkeypatch.setattr(cache, "CACHE_RAW_HTML", False)
+    job = {"name": "LeBron James", "team": "Los Angeles Lakers", "season": 2025, "player_id": "jamesle01",
+           "opponent": "POR", "game": "POR @ LAL"}
+    with offline_cache() as fetcher:
+        assert report.prefetch_game_logs([job]) == []
+        assert any(report.player_report(job, SLATE_DATE).values())
+        assert len([url for url in fetcher.urls if "/gamelog/" in url]) == 1
+
+
+def test_report_workers_do_not_import_pandas():
+    # Spawned workers import modules.report; pandas loads only if they build threshold tables
+    code = "import sys, modules.report; print('pandas' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          check=True).stdout.strip() == "False"
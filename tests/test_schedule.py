@@ -0,0 +1,74 @@
+import datetime
+import threading
+from pathlib import Path
+
+import pytest
+
+from modules import schedule
+
+FIXTURES = Path(__file__).parent / "fixtures"
+APRIL_HTML = (FIXTURES / "schedule_2025_april.html").read_text()
+EMPTY_HTML = '<table id="schedule"><tbody></tbody></table>'
+
+
+@pytest.fixture
+def fetched(store, monkeypatch):
+    fetched = []
+
+    def fake_fetch_many(urls, category="pages", max_age=None):
+        for url in urls:
+            fetched.append(url)
+            yield url, APRIL_HTML if url.endswith("-april.html") else EMPTY_HTML
+
+    monkeypatch.setattr(schedule, "fetch_many", fake_fetch_many)
+    monkeypatch.setattr(schedule, "safe_request", lambda url, category="pages": APRIL_HTML)
+    monkeypatch.setattr(schedule, "_schedules", {})
+    return fetched
+
+
+def test_season_schedule_answers_date_queries(fetched):
+    season = schedule.get_season_schedule(2025)
+    assert len(fetched) == 9  # every month linked from the season page
+
+    games = season.games_on(datetime.date(2025, 4, 13))
+    assert len(games) == 15
+    assert season.next_game("Los Angeles Lakers", datetime.date(2025, 4, 14)) == {
+        "date": "2025-04-19", "time": "7:30p", "away": "Minnesota Timberwolves", "home": "Los Angeles Lakers"}
+    playoffs = season.games_between(datetime.date(2025, 4, 19), datetime.date(2025, 4, 22))
+    assert [g["date"] for g in playoffs] == ["2025-04-19", "2025-04-20", "2025-04-21", "2025-04-22"]
+
+
+def test_finished_months_are_never_refetched(fetched, monkeypatch):
+    schedule.get_season_schedule(2025)
+    monkeypatch.setattr(schedule, "_schedules", {})
+    monkeypatch.setattr(schedule.time, "time", lambda: 4_000_000_000.0)  # long after the season
+
+    schedule.get_season_schedule(2025)
+    assert len(fetched) == 9
+
+
+def test_month_is_final():
+    assert schedule.month_is_final(2025, "october", datetime.date(2024, 11, 1))
+    assert not schedule.month_is_final(2025, "april", datetime.date(2025, 4, 13))
+
+
+def test_a_cold_season_does_not_block_other_seasons(fetched, monkeypatch):
+    warm = schedule.get_season_schedule(2025)
+    building = threading.Event()
+    release = threading.Event()
+
+    def slow_index(url, category="pages"):
+        building.set()
+        release.wait(5)
+        return APRIL_HTML
+
+    monkeypatch.setattr(schedule, "safe_request", slow_index)
+    cold = threading.Thread(target=schedule.get_season_schedule, args=(2024,))
+    cold.start()
+    assert building.wait(5)
+    try:
+        assert schedule.get_season_schedule(2025) is warm  # answered while 2024 is still fetching
+    finally:
+        release.set()
+        cold.join()
+    assert 2024 in schedule._schedules
@@ -0,0 +1,65 @@
+import pytest
+
+from modules.player import Player
+from modules.search import PlayerSearchIndex, search_key
+from modules.utils import fuzzy_match_player
+
+NAMES = [
+    ("LeBron James", "Los Angeles Lakers"),
+    ("Bronny James", "Los Angeles Lakers"),
+    ("Luka Dončić", "Los Angeles Lakers"),
+    ("D'Angelo Russell", "Brooklyn Nets"),
+    ("Tim Hardaway Jr.", "Dallas Mavericks"),
+    ("Shai Gilgeous-Alexander", "Oklahoma City Thunder"),
+    ("Stephen Curry", "Golden State Warriors"),
+    ("Seth Curry", "Charlotte Hornets"),
+    ("Jalen Williams", "Oklahoma City Thunder"),
+    ("Jaylin Williams", "Oklahoma City Thunder"),
+    ("Anthony Davis", "Dallas Mavericks"),
+    ("Adem Bona", "Philadelphia 76ers"),
+]
+
+
+@pytest.fixture
+def players():
+    return [Player(name, team, 2025) for name, team in NAMES]
+
+
+def test_search_key_folds_accents_suffixes_and_punctuation():
+    assert search_key("Luka Dončić") == "luka doncic"
+    assert search_key("Tim Hardaway Jr.") == "tim hardaway"
+    assert search_key("D'Angelo Russell") == "dangelo russell"
+    assert search_key("Shai Gilgeous-Alexander") == "shai gilgeous alexander"
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("lebron", "LeBron James"),
+    ("Lebron Jmaes", "LeBron James"),
+    ("luka doncic", "Luka Dončić"),
+    ("dangelo", "D'Angelo Russell"),
+    ("tim hardaway jr", "Tim Hardaway Jr."),
+    ("gilgeous", "Shai Gilgeous-Alexander"),
+    ("steph", "Stephen Curry"),
+    ("sga", "Shai Gilgeous-Alexander"),
+    ("jaylin williams", "Jaylin Williams"),
+])
+def test_search_finds_expected_player(players, query, expected):
+    assert PlayerSearchIndex(players).best_match(query).name == expected
+
+
+def test_search_returns_ranked_top_k(players):
+    results = PlayerSearchIndex(players).search("curry", k=3)
+    assert {p.name for p, _ in results[:2]} == {"Stephen Curry", "Seth Curry"}
+    assert results[0][1] >= results[-1][1]
+
+
+def test_nicknames_rank_below_real_prefix_matches(players):
+    index = PlayerSearchIndex(players)
+    # "ad" is Anthony Davis's nickname, but Adem Bona's name really starts with it
+    assert [p.name for p, _ in index.search("ad", k=2)] == ["Adem Bona", "Anthony Davis"]
+    assert index.best_match("the brow").name == "Anthony Davis"
+
+
+def test_fuzzy_match_player_returns_none_without_candidates(players):
+    assert fuzzy_match_player("lebron", players).name == "LeBron James"
+    assert fuzzy_match_player("zzzz", players) is None